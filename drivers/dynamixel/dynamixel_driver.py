@@ -21,6 +21,69 @@ ADDR_PRESENT_TEMPERATURE = 146
 ADDR_PRESENT_VOLTAGE    = 144
 ADDR_PRESENT_CURRENT    = 126
 ADDR_OPERATING_MODE     = 11
+ADDR_RETURN_DELAY_TIME  = 9     # EEPROM, 단위 2us (기본 250 = 500us)
+ADDR_STATUS_RETURN_LEVEL = 68   # 0: PING만, 1: PING/READ만, 2: 모든 명령에 응답 (기본)
+ADDR_BAUD_RATE          = 8     # EEPROM, BAUD_RATE_INDEX 값
+ADDR_LED                = 65
+
+# 상태 블록: Moving(122) ~ Present Temperature(146) 은 X 시리즈에서 연속된 영역이므로
+# Indirect Address 재설정(EEPROM, 토크 OFF 필요) 없이 한 번의 read로 모두 가져올 수 있음
+# {필드명: (주소, 크기, 부호 여부)}
+STATUS_FIELDS = {
+    'moving':      (ADDR_MOVING, 1, False),
+    'current':     (ADDR_PRESENT_CURRENT, 2, True),
+    'velocity':    (ADDR_PRESENT_VELOCITY, 4, True),
+    'position':    (ADDR_PRESENT_POSITION, 4, True),
+    'voltage':     (ADDR_PRESENT_VOLTAGE, 2, False),
+    'temperature': (ADDR_PRESENT_TEMPERATURE, 1, False),
+}
+STATUS_BLOCK_START  = ADDR_MOVING
+STATUS_BLOCK_LENGTH = ADDR_PRESENT_TEMPERATURE + 1 - ADDR_MOVING
+
+# 필드 일부만 읽을 때 이 바이트 수 이하의 빈 구간은 읽기를 나누지 않고 함께 읽음
+# (읽기 1회 추가 비용: 명령 패킷 + 모터당 상태 패킷 헤더 11바이트 + USB latency)
+SPAN_MERGE_GAP = 16
+
+
+def pack_status_spans(fields, max_gap=SPAN_MERGE_GAP):
+    """
+    읽을 필드들을 최소 개수의 연속 구간으로 묶기
+    
+    Returns:
+        [(start, length, [field, ...]), ...]
+    """
+    spans = []
+    for name in sorted(fields, key=lambda f: STATUS_FIELDS[f][0]):
+        addr, size, _ = STATUS_FIELDS[name]
+        if spans and addr - (spans[-1][0] + spans[-1][1]) <= max_gap:
+            start, _, names = spans[-1]
+            spans[-1] = (start, max(spans[-1][1], addr + size - start), names + [name])
+        else:
+            spans.append((addr, size, [name]))
+    return spans
+
+# 이동 계획 시 재사용할 수 있는 상태 스냅샷의 최대 나이 (초)
+SNAPSHOT_MAX_AGE = 0.1
+
+# EEPROM 영역 (X 시리즈 주소 0-63): 토크 ON 상태에서는 쓰기 불가, 쓰기 횟수 수명 있음
+EEPROM_AREA_END = ADDR_TORQUE_ENABLE
+
+# Status Return Level
+STATUS_RETURN_PING_READ = 1
+STATUS_RETURN_ALL       = 2
+
+# Baud Rate 레지스터 값 (X 시리즈)
+BAUD_RATE_INDEX = {
+    9600: 0, 57600: 1, 115200: 2, 1000000: 3,
+    2000000: 4, 3000000: 5, 4000000: 6, 4500000: 7,
+}
+
+# 통신속도 튜닝: 속도별 soak 트랜잭션 수, 허용 에러율
+TUNE_SOAK_TRANSACTIONS  = 200
+TUNE_MAX_ERROR_RATE     = 0.0
+
+# 응답 없는 쓰기 모드에서 주기적 read-back 검증 간격 (쓰기 횟수)
+VERIFY_EVERY_WRITES     = 20
 
 # Operating modes
 POSITION_CONTROL_MODE   = 3
@@ -34,12 +97,22 @@ PROTOCOL_VERSION        = 2.0
 BAUDRATE                = 57600
 DEVICENAME              = 'COM3'  # Windows의 경우, Linux는 '/dev/ttyUSB0' 등
 
+# 스캔 설정
+# Protocol 2.0 broadcast ping: 각 모터가 ID 순서대로 응답 (모터당 상태 패킷 14바이트 + 약 3ms 슬롯)
+PING_STATUS_LENGTH_V1   = 6
+PING_STATUS_LENGTH_V2   = 14
+BROADCAST_PING_SLOT_MS  = 3.0
+SCAN_LATENCY_MS         = LATENCY_TIMER  # USB-시리얼 latency timer (ms)
+
 TORQUE_ENABLE           = 1
 TORQUE_DISABLE          = 0
 DXL_MINIMUM_POSITION_VALUE  = 0
 DXL_MAXIMUM_POSITION_VALUE  = 4095
 DXL_MOVING_STATUS_THRESHOLD = 20
 
+# 속도 단위 (X 시리즈 Goal/Present Velocity: 0.229 rpm)
+VELOCITY_UNIT_RPM       = 0.229
+
 class DynamixelDriver:
     def __init__(self, device_name=DEVICENAME, baudrate=BAUDRATE, protocol_version=PROTOCOL_VERSION):
         """
@@ -53,7 +126,7 @@ class DynamixelDriver:
         self.device_name = device_name
         self.baudrate = baudrate
         self.protocol_version = protocol_version
-        self.target_angle_prev = 0
+        self.target_angle_prev = {}  # {motor_id: 직전 목표 각도}
         
         # Initialize PortHandler instance
         self.portHandler = PortHandler(self.device_name)
@@ -62,9 +135,35 @@ class DynamixelDriver:
         self.packetHandler = PacketHandler(self.protocol_version)
         
         self.connected_motors = {}  # {motor_id: motor_info}
+        self._sync_readers = {}     # {(start, length, ids): GroupSyncRead}
+        self._sync_writers = {}     # {(start, length): GroupSyncWrite}
+        
+        # 컨트롤 테이블 섀도 캐시: 마지막으로 쓰거나 읽은 설정값 {motor_id: {address: value}}
+        self._shadow = {}
+        self.shadow_stats = {
+            'hits': 0,                  # 생략된 쓰기 (절약된 왕복)
+            'misses': 0,                # 실제로 전송된 캐시 대상 쓰기
+            'eeprom_hits': 0,           # 생략된 EEPROM 쓰기 (수명 절약)
+            'fills': 0,                 # 캐시를 채우기 위한 읽기
+            'torque_cycles_saved': 0,   # 생략된 토크 OFF/ON 사이클
+        }
+        
+        # 응답 없는 쓰기 모드 (Status Return Level < 2인 모터)
+        self._tx_only_motors = set()
+        self._pending_verify = {}   # {motor_id: {address: bytes}} 아직 read-back 하지 않은 쓰기
+        self._writes_since_verify = 0
+        self.verify_every = VERIFY_EVERY_WRITES
+        self.tx_only_stats = {
+            'writes': 0,        # 응답 없이 보낸 쓰기
+            'verified': 0,      # read-back으로 확인한 쓰기
+            'mismatches': 0,    # read-back 불일치 (재전송)
+        }
         
     def connect(self):
         """포트 연결"""
+        self.invalidate_shadow()
+        self._tx_only_motors.clear()
+        self._pending_verify.clear()
         if self.portHandler.openPort():
             logging.info(f"포트 {self.device_name} 연결 성공")
         else:
@@ -78,45 +177,580 @@ class DynamixelDriver:
     def disconnect(self):
         """포트 연결 해제"""
         self.portHandler.closePort()
+        self.invalidate_shadow()
         logging.info("포트 연결 해제")
     
-    def scan_motors(self, id_range=(1, 10)):
-        """연결된 모터 스캔"""
-        found_motors = []
-        for motor_id in range(id_range[0], id_range[1] + 1):
-            # Ping the Dynamixel
-            dxl_model_number, dxl_comm_result, dxl_error = self.packetHandler.ping(self.portHandler, motor_id)
-            if dxl_comm_result == COMM_SUCCESS:
-                found_motors.append({
-                    'id': motor_id,
-                    'model_number': dxl_model_number
-                })
-                logging.info(f"모터 ID {motor_id} 발견 (모델: {dxl_model_number})")
+    # ── 컨트롤 테이블 섀도 캐시 ───────────────────────────────
+    def invalidate_shadow(self, motor_id=None, address=None):
+        """섀도 캐시 무효화 (motor_id/address 생략 시 전체)"""
+        if motor_id is None:
+            self._shadow.clear()
+        elif address is None:
+            self._shadow.pop(motor_id, None)
+        else:
+            self._shadow.get(motor_id, {}).pop(address, None)
+    
+    def _supersede_pending(self, motor_id, address, length):
+        """[address, address+length) 와 겹치는 확인 대기 쓰기 제거 (새 쓰기가 덮어쓴 옛 값은 재전송하면 안 됨)"""
+        writes = self._pending_verify.get(motor_id)
+        if not writes:
+            return
+        for pending_address in [a for a, data in writes.items()
+                                if a < address + length and address < a + len(data)]:
+            del writes[pending_address]
+    
+    def get_shadow_stats(self):
+        """섀도 캐시 통계 복사본"""
+        return dict(self.shadow_stats)
+    
+    def _write_register(self, motor_id, address, size, value, label, verify=False):
+        """1/2/4바이트 쓰기 (섀도 캐시 갱신, 실패 시 해당 주소 무효화)"""
+        self._write_bytes(motor_id, address, (value & ((1 << (8 * size)) - 1)).to_bytes(size, 'little'),
+                          label, verify)
+        self._shadow.setdefault(motor_id, {})[address] = value
+    
+    def _write_bytes(self, motor_id, address, data, label, verify=False):
+        """
+        컨트롤 테이블 쓰기
+        응답 없는 쓰기 모드의 모터는 TxOnly로 보내고, EEPROM/verify=True 쓰기는 즉시 read-back,
+        나머지는 verify_every 회마다 모아서 read-back
+        """
+        self._supersede_pending(motor_id, address, len(data))
+        if motor_id not in self._tx_only_motors:
+            dxl_comm_result, dxl_error = self.packetHandler.writeTxRx(
+                self.portHandler, motor_id, address, len(data), list(data))
+        else:
+            dxl_comm_result = self.packetHandler.writeTxOnly(
+                self.portHandler, motor_id, address, len(data), list(data))
+            dxl_error = 0
         
-        self.connected_motors = {motor['id']: motor for motor in found_motors}
-        return found_motors
+        if dxl_comm_result != COMM_SUCCESS:
+            self.invalidate_shadow(motor_id, address)
+            raise RuntimeError(f"{label} 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
+        elif dxl_error != 0:
+            self.invalidate_shadow(motor_id, address)
+            raise RuntimeError(f"{label} 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+        
+        if motor_id not in self._tx_only_motors:
+            return
+        
+        self.tx_only_stats['writes'] += 1
+        if verify or address < EEPROM_AREA_END:
+            if not self._verify_write(motor_id, address, data):
+                self.invalidate_shadow(motor_id, address)
+                raise RuntimeError(f"{label} 확인 실패: read-back 값 불일치")
+            return
+        
+        self._pending_verify.setdefault(motor_id, {})[address] = bytes(data)
+        self._writes_since_verify += 1
+        if self._writes_since_verify >= self.verify_every:
+            self.verify_writes()
     
-    def enable_torque(self, motor_id):
-        """토크 활성화"""
-        dxl_comm_result, dxl_error = self.packetHandler.write1ByteTxRx(
-            self.portHandler, motor_id, ADDR_TORQUE_ENABLE, TORQUE_ENABLE)
+    def _verify_write(self, motor_id, address, data):
+        """read-back으로 쓰기 확인 (통신 실패는 예외)"""
+        read_data, dxl_comm_result, dxl_error = self.packetHandler.readTxRx(
+            self.portHandler, motor_id, address, len(data))
         
         if dxl_comm_result != COMM_SUCCESS:
-            raise RuntimeError(f"토크 활성화 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
+            raise RuntimeError(f"쓰기 확인 읽기 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
         elif dxl_error != 0:
-            raise RuntimeError(f"토크 활성화 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+            raise RuntimeError(f"쓰기 확인 읽기 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
         
-        logging.info(f"모터 ID {motor_id} 토크 활성화")
+        if bytes(read_data) == bytes(data):
+            self.tx_only_stats['verified'] += 1
+            return True
+        self.tx_only_stats['mismatches'] += 1
+        return False
     
-    def disable_torque(self, motor_id):
-        """토크 비활성화"""
-        dxl_comm_result, dxl_error = self.packetHandler.write1ByteTxRx(
-            self.portHandler, motor_id, ADDR_TORQUE_ENABLE, TORQUE_DISABLE)
+    def verify_writes(self):
+        """
+        응답 없이 보낸 쓰기 중 아직 확인하지 않은 마지막 값들을 read-back으로 확인
+        불일치(패킷 손실)는 경고 후 한 번 재전송
+        
+        Returns:
+            불일치한 (motor_id, address) 목록
+        """
+        pending, self._pending_verify = self._pending_verify, {}
+        self._writes_since_verify = 0
+        
+        mismatched = []
+        for motor_id, writes in pending.items():
+            for address, data in writes.items():
+                if self._verify_write(motor_id, address, data):
+                    continue
+                logging.warning(f"모터 ID {motor_id} 주소 {address} 쓰기 확인 불일치, 재전송")
+                mismatched.append((motor_id, address))
+                self.packetHandler.writeTxOnly(self.portHandler, motor_id, address, len(data), list(data))
+        return mismatched
+    
+    def configure_fast_writes(self, motor_ids, return_delay_us=0, status_return_level=STATUS_RETURN_PING_READ,
+                              verify_every=VERIFY_EVERY_WRITES):
+        """
+        응답 없는 쓰기 모드 설정
+        Return Delay Time(EEPROM)을 줄이고 Status Return Level을 낮춰 쓰기 명령에 상태 패킷이 오지 않게 함
+        이후 해당 모터의 쓰기는 TxOnly로 전송하고 주기적으로 read-back 검증
+        
+        Args:
+            motor_ids: 대상 모터 ID 목록
+            return_delay_us: 응답 지연 (us, 2us 단위, 0-508)
+            status_return_level: STATUS_RETURN_PING_READ(1) 또는 STATUS_RETURN_ALL(2, 모드 해제)
+            verify_every: read-back 검증 간격 (쓰기 횟수)
+        """
+        if status_return_level not in (STATUS_RETURN_PING_READ, STATUS_RETURN_ALL):
+            raise ValueError("Status Return Level은 1 또는 2만 지원합니다 (0이면 상태 읽기 불가)")
+        
+        self.verify_every = verify_every
+        for motor_id in motor_ids:
+            self.ensure_eeprom(motor_id, ADDR_RETURN_DELAY_TIME, 1, min(254, return_delay_us // 2), "응답 지연 설정")
+            
+            # 레벨 변경 쓰기 자체는 이전/새 레벨 중 어느 쪽으로 응답할지 불확실하므로
+            # TxOnly로 보내고, 올 수도 있는 상태 패킷을 버린 뒤 read-back
+            data = bytes([status_return_level])
+            dxl_comm_result = self.packetHandler.writeTxOnly(
+                self.portHandler, motor_id, ADDR_STATUS_RETURN_LEVEL, 1, list(data))
+            time.sleep((self._tx_time_ms(PING_STATUS_LENGTH_V2) + SCAN_LATENCY_MS) / 1000.0)
+            self.portHandler.clearPort()
+            if dxl_comm_result != COMM_SUCCESS or not self._verify_write(motor_id, ADDR_STATUS_RETURN_LEVEL, data):
+                raise RuntimeError(f"모터 ID {motor_id} Status Return Level 설정 실패")
+            self._shadow.setdefault(motor_id, {})[ADDR_STATUS_RETURN_LEVEL] = status_return_level
+            
+            if status_return_level < STATUS_RETURN_ALL:
+                self._tx_only_motors.add(motor_id)
+            else:
+                self._tx_only_motors.discard(motor_id)
+                self._pending_verify.pop(motor_id, None)
+            logging.info(f"모터 ID {motor_id} 응답 지연 {return_delay_us}us, Status Return Level {status_return_level}")
+    
+    def detect_status_return_levels(self, motor_ids):
+        """
+        모터의 현재 Status Return Level을 읽어 응답 없는 쓰기 대상 재구성
+        레벨은 RAM 값이라 포트를 닫거나 앱을 재시작해도 모터 전원이 유지되는 동안 남아 있으므로,
+        이전 연결이 레벨을 낮춰 두었으면 확인 응답을 기다리는 첫 쓰기가 실패함 -> 연결 후 첫 쓰기 전에 호출
+        (READ는 레벨 1에서도 응답)
+        """
+        for motor_id in motor_ids:
+            self.invalidate_shadow(motor_id, ADDR_STATUS_RETURN_LEVEL)
+            level = self._read_cached(motor_id, ADDR_STATUS_RETURN_LEVEL, 1, "Status Return Level")
+            if level < STATUS_RETURN_ALL:
+                self._tx_only_motors.add(motor_id)
+                logging.info(f"모터 ID {motor_id} Status Return Level {level}: 응답 없는 쓰기 모드로 연결")
+            else:
+                self._tx_only_motors.discard(motor_id)
+    
+    def get_tx_only_stats(self):
+        """응답 없는 쓰기 통계 복사본"""
+        return dict(self.tx_only_stats)
+    
+    # ── 통신속도 튜닝 ─────────────────────────────────────────
+    def _set_adapter_baudrate(self, baudrate):
+        """어댑터(포트) 통신속도만 변경"""
+        if not self.portHandler.setBaudRate(baudrate):
+            return False
+        self.baudrate = baudrate
+        self._sync_readers.clear()
+        self._sync_writers.clear()
+        return True
+    
+    def _ping_all(self, motor_ids, attempts=3):
+        """모든 모터가 현재 통신속도에서 응답하는지 확인"""
+        for motor_id in motor_ids:
+            if not any(self.ping(motor_id) is not None for _ in range(attempts)):
+                return False
+        return True
+    
+    def switch_baudrate(self, motor_ids, baudrate):
+        """
+        모터 EEPROM과 어댑터의 통신속도를 함께 변경
+        모터는 쓰기 직후 새 속도로 전환하므로 Baud Rate 쓰기는 TxOnly로 보내고,
+        어댑터를 바꾼 뒤 새 속도에서 ping으로 확인
+        
+        Returns:
+            새 속도에서 모든 모터가 응답하면 True
+        """
+        if baudrate not in BAUD_RATE_INDEX:
+            raise ValueError(f"지원하지 않는 통신속도: {baudrate}")
+        if baudrate == self.baudrate:
+            return self._ping_all(motor_ids)
+        
+        old_baudrate = self.baudrate
+        for motor_id in motor_ids:
+            # 토크 OFF 상태에서만 EEPROM 쓰기 가능 (튜닝 중에는 토크를 다시 켜지 않음)
+            self.disable_torque(motor_id)
+            dxl_comm_result = self.packetHandler.writeTxOnly(
+                self.portHandler, motor_id, ADDR_BAUD_RATE, 1, [BAUD_RATE_INDEX[baudrate]])
+            if dxl_comm_result != COMM_SUCCESS:
+                raise RuntimeError(f"통신속도 쓰기 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
+        
+        # 마지막 패킷이 전송될 시간 + 모터 전환 여유
+        time.sleep((self._tx_time_ms(PING_STATUS_LENGTH_V2) + SCAN_LATENCY_MS) / 1000.0)
+        if not self._set_adapter_baudrate(baudrate):
+            logging.warning(f"어댑터가 {baudrate}bps를 지원하지 않음")
+            self._set_adapter_baudrate(old_baudrate)
+            return False
+        self.portHandler.clearPort()
+        
+        for motor_id in motor_ids:
+            self._shadow.setdefault(motor_id, {})[ADDR_BAUD_RATE] = BAUD_RATE_INDEX[baudrate]
+        return self._ping_all(motor_ids)
+    
+    def recover_baudrate(self, motor_ids, baudrate):
+        """
+        모터가 어느 속도에 있든 찾아서 baudrate로 되돌림 (튜닝 실패 시 롤백)
+        
+        Returns:
+            baudrate에서 모든 모터가 응답하면 True
+        """
+        if self._set_adapter_baudrate(baudrate) and self._ping_all(motor_ids):
+            return True
+        
+        for candidate in sorted(BAUD_RATE_INDEX):
+            if not self._set_adapter_baudrate(candidate):
+                continue
+            responding = [motor_id for motor_id in motor_ids if self.ping(motor_id) is not None]
+            if not responding:
+                continue
+            logging.info(f"모터 {responding} {candidate}bps에서 발견, {baudrate}bps로 복구")
+            self.switch_baudrate(responding, baudrate)
+        
+        self._set_adapter_baudrate(baudrate)
+        return self._ping_all(motor_ids)
+    
+    def soak_test(self, motor_ids, transactions=TUNE_SOAK_TRANSACTIONS):
+        """
+        현재 통신속도에서 읽기/쓰기 반복 (상태 블록 읽기 + LED 쓰기 교대)
+        
+        Returns:
+            {'transactions', 'errors', 'error_rate', 'rtt_avg_ms', 'rtt_max_ms'}
+        """
+        errors = 0
+        rtts = []
+        for i in range(transactions):
+            motor_id = motor_ids[i % len(motor_ids)]
+            start = time.perf_counter()
+            try:
+                if i % 2 == 0:
+                    self.read_status_block(motor_ids)
+                else:
+                    self._write_bytes(motor_id, ADDR_LED, bytes([(i // 2) & 1]), "LED 설정")
+                rtts.append((time.perf_counter() - start) * 1000.0)
+            except RuntimeError:
+                errors += 1
+                self.portHandler.clearPort()
+        
+        for motor_id in motor_ids:
+            try:
+                self._write_bytes(motor_id, ADDR_LED, b"\x00", "LED 설정")
+            except RuntimeError:
+                pass
+        return {
+            'transactions': transactions,
+            'errors': errors,
+            'error_rate': errors / transactions if transactions else 0.0,
+            'rtt_avg_ms': sum(rtts) / len(rtts) if rtts else 0.0,
+            'rtt_max_ms': max(rtts) if rtts else 0.0,
+        }
+    
+    def tune_baudrate(self, motor_ids, candidates=None, transactions=TUNE_SOAK_TRANSACTIONS,
+                      max_error_rate=TUNE_MAX_ERROR_RATE):
+        """
+        통신속도 자동 튜닝
+        현재 속도에서 시작해 빠른 속도로 올라가며 soak 테스트, 에러율이 max_error_rate를 넘거나
+        모터가 응답하지 않는 첫 속도에서 중단하고 가장 빠른 안정 속도로 확정 (EEPROM + 어댑터)
+        확정 후 다시 soak 테스트를 통과하지 못하면 원래 속도로 롤백
+        
+        Args:
+            motor_ids: 버스의 모든 모터 ID (한 모터라도 빠지면 버스가 나뉨)
+            candidates: 시도할 통신속도 목록 (None이면 어댑터가 지원하는 BAUD_RATE_INDEX 전체)
+        
+        Returns:
+            (확정된 통신속도, {baudrate: soak 결과 또는 None(응답 없음)})
+        """
+        motor_ids = list(motor_ids)
+        original = self.baudrate
+        if candidates is None:
+            candidates = [b for b in BAUD_RATE_INDEX if self.portHandler.getCFlagBaud(b) > 0]
+        candidates = sorted(b for b in candidates if b > original and b in BAUD_RATE_INDEX)
+        
+        results = {original: self.soak_test(motor_ids, transactions)}
+        if results[original]['error_rate'] > max_error_rate:
+            raise RuntimeError(f"현재 통신속도 {original}bps에서도 에러율 {results[original]['error_rate']:.1%}")
+        best = original
+        logging.info(f"통신속도 {original}bps: {results[original]}")
+        
+        try:
+            for baudrate in candidates:
+                if not self.switch_baudrate(motor_ids, baudrate):
+                    results[baudrate] = None
+                    logging.info(f"통신속도 {baudrate}bps: 응답 없음")
+                    break
+                results[baudrate] = self.soak_test(motor_ids, transactions)
+                logging.info(f"통신속도 {baudrate}bps: {results[baudrate]}")
+                if results[baudrate]['error_rate'] > max_error_rate:
+                    break
+                best = baudrate
+            
+            # 가장 빠른 안정 속도로 확정 후 재확인
+            if not self.recover_baudrate(motor_ids, best):
+                raise RuntimeError(f"{best}bps 확정 실패")
+            final = self.soak_test(motor_ids, transactions)
+            if final['error_rate'] > max_error_rate:
+                raise RuntimeError(f"{best}bps 재확인 에러율 {final['error_rate']:.1%}")
+        except Exception as e:
+            logging.error(f"통신속도 튜닝 실패, {original}bps로 롤백: {e}")
+            if not self.recover_baudrate(motor_ids, original):
+                raise RuntimeError(f"{original}bps 롤백 실패 - 모터 통신속도를 수동으로 확인하세요")
+            return original, results
+        
+        logging.info(f"통신속도 확정: {best}bps")
+        return best, results
+    
+    def _write_cached(self, motor_id, address, size, value, label):
+        """
+        섀도 캐시의 값과 같으면 쓰기를 생략
+        
+        Returns:
+            실제로 썼으면 True, 생략했으면 False
+        """
+        if self._shadow.get(motor_id, {}).get(address) == value:
+            self.shadow_stats['hits'] += 1
+            if address < EEPROM_AREA_END:
+                self.shadow_stats['eeprom_hits'] += 1
+            return False
+        
+        self.shadow_stats['misses'] += 1
+        self._write_register(motor_id, address, size, value, label)
+        return True
+    
+    def _read_cached(self, motor_id, address, size, label):
+        """섀도 캐시 값 반환, 없으면 모터에서 읽어 채움"""
+        cached = self._shadow.get(motor_id, {}).get(address)
+        if cached is not None:
+            return cached
+        
+        read = {1: self.packetHandler.read1ByteTxRx,
+                2: self.packetHandler.read2ByteTxRx,
+                4: self.packetHandler.read4ByteTxRx}[size]
+        value, dxl_comm_result, dxl_error = read(self.portHandler, motor_id, address)
         
         if dxl_comm_result != COMM_SUCCESS:
-            raise RuntimeError(f"토크 비활성화 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
+            raise RuntimeError(f"{label} 읽기 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
         elif dxl_error != 0:
-            raise RuntimeError(f"토크 비활성화 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+            raise RuntimeError(f"{label} 읽기 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+        
+        self.shadow_stats['fills'] += 1
+        self._shadow.setdefault(motor_id, {})[address] = value
+        return value
+    
+    def scan_motors(self, id_range=(1, 10), method='auto'):
+        """
+        연결된 모터 스캔
+        
+        Args:
+            id_range: (첫 ID, 마지막 ID)
+            method: 'auto'      - Protocol 2.0이면 'broadcast', 아니면 'sequential'
+                    'broadcast' - broadcast ping 1회로 범위 내 모든 모터 발견 (Protocol 2.0 전용)
+                    'sequential'- ID별 ping, 응답 없는 ID는 짧은 타임아웃 후 다음 ID로
+                    'ping'      - SDK ping 순차 호출 (ID마다 SDK 기본 타임아웃)
+        
+        Returns:
+            [{'id': motor_id, 'model_number': model_number}, ...]
+        """
+        if method == 'auto':
+            method = 'broadcast' if self.protocol_version >= 2.0 else 'sequential'
+        
+        start_time = time.perf_counter()
+        if method == 'broadcast':
+            found_motors = self._scan_broadcast(id_range)
+        elif method == 'sequential':
+            found_motors = self._scan_sequential(id_range)
+        elif method == 'ping':
+            found_motors = []
+            for motor_id in range(id_range[0], id_range[1] + 1):
+                model_number = self.ping(motor_id)
+                if model_number is not None:
+                    found_motors.append({'id': motor_id, 'model_number': model_number})
+        else:
+            raise ValueError(f"알 수 없는 스캔 방식: {method}")
+        
+        for motor in found_motors:
+            logging.info(f"모터 ID {motor['id']} 발견 (모델: {motor['model_number']})")
+        logging.info(f"모터 스캔 완료 ({method}, ID {id_range[0]}-{id_range[1]}): "
+                     f"{len(found_motors)}개, {(time.perf_counter() - start_time) * 1000:.0f} ms")
+        
+        self.connected_motors = {motor['id']: motor for motor in found_motors}
+        return found_motors
+    
+    def ping(self, motor_id):
+        """SDK ping, 응답한 모터의 모델 번호 반환 (응답 없으면 None)"""
+        dxl_model_number, dxl_comm_result, dxl_error = self.packetHandler.ping(self.portHandler, motor_id)
+        if dxl_comm_result != COMM_SUCCESS:
+            return None
+        return dxl_model_number
+    
+    def verify_motors(self, known_motors):
+        """
+        캐시된 버스 맵의 모터만 ping으로 확인 (재스캔 없이 재연결)
+        
+        Args:
+            known_motors: [{'id': motor_id, 'model_number': model_number}, ...]
+        
+        Returns:
+            모든 모터가 같은 모델 번호로 응답하면 True (connected_motors 갱신), 아니면 False
+        """
+        verified = []
+        for motor in known_motors:
+            model_number = self.ping(motor['id'])
+            if model_number is None or model_number != motor.get('model_number', model_number):
+                logging.info(f"캐시된 모터 ID {motor['id']} 확인 실패 (응답 모델: {model_number})")
+                return False
+            verified.append({'id': motor['id'], 'model_number': model_number})
+        
+        if not verified:
+            return False
+        self.connected_motors = {motor['id']: motor for motor in verified}
+        logging.info(f"캐시된 버스 맵 확인 완료: {sorted(self.connected_motors)}")
+        return True
+    
+    def _tx_time_ms(self, nbytes):
+        """nbytes 전송 시간 (ms, 8N1 기준 10비트/바이트)"""
+        return nbytes * 10000.0 / self.baudrate
+    
+    def _scan_broadcast(self, id_range):
+        """
+        Protocol 2.0 broadcast ping
+        SDK broadcastPing()은 ID 252까지의 응답을 기다리므로 (57600bps에서 약 1.4초),
+        응답 대기 시간을 스캔 범위의 마지막 ID까지로 제한해 직접 송수신
+        """
+        if self.protocol_version < 2.0:
+            raise RuntimeError("broadcast ping은 Protocol 2.0에서만 지원됩니다")
+        
+        first_id, last_id = id_range
+        txpacket = [0] * 10
+        txpacket[PKT_ID] = BROADCAST_ID
+        txpacket[PKT_LENGTH_L] = 3
+        txpacket[PKT_LENGTH_H] = 0
+        txpacket[PKT_INSTRUCTION] = INST_PING
+        
+        self.portHandler.clearPort()
+        dxl_comm_result = self.packetHandler.txPacket(self.portHandler, txpacket)
+        if dxl_comm_result != COMM_SUCCESS:
+            self.portHandler.is_using = False
+            raise RuntimeError(f"broadcast ping 전송 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
+        
+        # 마지막 ID까지의 응답 시간만큼만 대기
+        wait_length = PING_STATUS_LENGTH_V2 * last_id
+        timeout_ms = self._tx_time_ms(wait_length) + BROADCAST_PING_SLOT_MS * last_id + SCAN_LATENCY_MS
+        deadline = time.perf_counter() + timeout_ms / 1000.0
+        
+        rxpacket = bytearray()
+        found = {}
+        try:
+            while time.perf_counter() < deadline:
+                rxpacket += bytes(self.portHandler.readPort(wait_length - len(rxpacket)))
+                for motor_id, model_number in self._parse_ping_status_v2(rxpacket):
+                    found[motor_id] = model_number
+                # 범위의 마지막 ID가 응답하면 더 기다릴 필요 없음
+                if last_id in found:
+                    break
+                time.sleep(0.0005)
+
+            # 범위 밖(last_id 초과) ID의 늦은 응답이 다음 트랜잭션을 오염시키지 않도록
+            # 응답이 한 슬롯 동안 끊길 때까지 버리고 버퍼 비우기
+            quiet_s = (self._tx_time_ms(PING_STATUS_LENGTH_V2) + BROADCAST_PING_SLOT_MS + SCAN_LATENCY_MS) / 1000.0
+            quiet_until = time.perf_counter() + quiet_s
+            while time.perf_counter() < quiet_until:
+                if self.portHandler.readPort(PING_STATUS_LENGTH_V2):
+                    quiet_until = time.perf_counter() + quiet_s
+                time.sleep(0.0005)
+            self.portHandler.clearPort()
+        finally:
+            self.portHandler.is_using = False
+        
+        return [{'id': motor_id, 'model_number': found[motor_id]}
+                for motor_id in sorted(found) if first_id <= motor_id <= last_id]
+    
+    def _parse_ping_status_v2(self, buf):
+        """buf 앞쪽의 완전한 ping 상태 패킷을 꺼내 (id, model_number) 생성 (불완전한 꼬리는 남김)"""
+        while True:
+            idx = buf.find(b"\xff\xff\xfd")
+            if idx < 0:
+                del buf[:max(0, len(buf) - 2)]
+                return
+            del buf[:idx]
+            if len(buf) < PING_STATUS_LENGTH_V2:
+                return
+            packet = list(buf[:PING_STATUS_LENGTH_V2])
+            crc = DXL_MAKEWORD(packet[-2], packet[-1])
+            if self.packetHandler.updateCRC(0, packet, PING_STATUS_LENGTH_V2 - 2) == crc:
+                del buf[:PING_STATUS_LENGTH_V2]
+                yield packet[PKT_ID], DXL_MAKEWORD(packet[PKT_PARAMETER0 + 1], packet[PKT_PARAMETER0 + 2])
+            else:
+                del buf[:1]
+    
+    def _scan_sequential(self, id_range):
+        """
+        ID별 ping을 직접 송신하고, 타임아웃을 SDK 기본값(latency timer x2 + 2ms) 대신
+        ping/응답 전송 시간 + latency timer 1회로 제한. 응답한 ID만 SDK ping으로 모델 번호 조회
+        """
+        status_length = PING_STATUS_LENGTH_V2 if self.protocol_version >= 2.0 else PING_STATUS_LENGTH_V1
+        timeout_s = (self._tx_time_ms(status_length * 2) + SCAN_LATENCY_MS) / 1000.0
+        
+        found_motors = []
+        for motor_id in range(id_range[0], id_range[1] + 1):
+            if not self._quick_ping(motor_id, status_length, timeout_s):
+                continue
+            model_number = self.ping(motor_id)
+            if model_number is not None:
+                found_motors.append({'id': motor_id, 'model_number': model_number})
+        return found_motors
+    
+    def _quick_ping(self, motor_id, status_length, timeout_s):
+        """ping 송신 후 timeout_s 안에 motor_id의 상태 패킷 헤더가 오는지 확인"""
+        if self.protocol_version >= 2.0:
+            txpacket = [0] * 10
+            txpacket[PKT_ID] = motor_id
+            txpacket[PKT_LENGTH_L] = 3
+            txpacket[PKT_LENGTH_H] = 0
+            txpacket[PKT_INSTRUCTION] = INST_PING
+            header, id_index = b"\xff\xff\xfd\x00", 4
+        else:
+            txpacket = [0xFF, 0xFF, motor_id, 2, INST_PING, 0]
+            header, id_index = b"\xff\xff", 2
+        
+        self.portHandler.clearPort()
+        dxl_comm_result = self.packetHandler.txPacket(self.portHandler, txpacket)
+        if dxl_comm_result != COMM_SUCCESS:
+            self.portHandler.is_using = False
+            return False
+        
+        rxpacket = bytearray()
+        deadline = time.perf_counter() + timeout_s
+        try:
+            while time.perf_counter() < deadline:
+                rxpacket += bytes(self.portHandler.readPort(status_length - len(rxpacket)))
+                idx = rxpacket.find(header)
+                if idx >= 0 and len(rxpacket) > idx + id_index:
+                    return rxpacket[idx + id_index] == motor_id
+                time.sleep(0.0002)
+            return False
+        finally:
+            self.portHandler.is_using = False
+    
+    def enable_torque(self, motor_id):
+        """
+        토크 활성화
+        하드웨어 에러 셧다운/재부팅 시 모터가 스스로 토크를 끄므로 캐시와 관계없이 항상 전송
+        """
+        self._write_register(motor_id, ADDR_TORQUE_ENABLE, 1, TORQUE_ENABLE, "토크 활성화", verify=True)
+        # 토크 ON 시 Goal Position이 현재 위치로 재설정되므로 확인 대기 중인 목표값은 무의미
+        self._pending_verify.get(motor_id, {}).pop(ADDR_PROFILE_VELOCITY, None)
+        self._pending_verify.get(motor_id, {}).pop(ADDR_GOAL_POSITION, None)
+        
+        logging.info(f"모터 ID {motor_id} 토크 활성화")
+    
+    def disable_torque(self, motor_id):
+        """토크 비활성화 (항상 전송)"""
+        self._write_register(motor_id, ADDR_TORQUE_ENABLE, 1, TORQUE_DISABLE, "토크 비활성화", verify=True)
         
         logging.info(f"모터 ID {motor_id} 토크 비활성화")
     
@@ -125,13 +759,7 @@ class DynamixelDriver:
         # 위치 범위 체크
         position = max(DXL_MINIMUM_POSITION_VALUE, min(DXL_MAXIMUM_POSITION_VALUE, position))
         
-        dxl_comm_result, dxl_error = self.packetHandler.write4ByteTxRx(
-            self.portHandler, motor_id, ADDR_GOAL_POSITION, position)
-        
-        if dxl_comm_result != COMM_SUCCESS:
-            raise RuntimeError(f"위치 설정 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
-        elif dxl_error != 0:
-            raise RuntimeError(f"위치 설정 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+        self._write_register(motor_id, ADDR_GOAL_POSITION, 4, position, "위치 설정")
     
     def get_present_position(self, motor_id):
         """현재 위치 읽기"""
@@ -146,24 +774,12 @@ class DynamixelDriver:
         return dxl_present_position
     
     def set_profile_velocity(self, motor_id, velocity):
-        """프로파일 속도 설정"""
-        dxl_comm_result, dxl_error = self.packetHandler.write4ByteTxRx(
-            self.portHandler, motor_id, ADDR_PROFILE_VELOCITY, velocity)
-        
-        if dxl_comm_result != COMM_SUCCESS:
-            raise RuntimeError(f"속도 설정 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
-        elif dxl_error != 0:
-            raise RuntimeError(f"속도 설정 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+        """프로파일 속도 설정 (같은 값이면 생략)"""
+        return self._write_cached(motor_id, ADDR_PROFILE_VELOCITY, 4, velocity, "속도 설정")
     
     def set_profile_acceleration(self, motor_id, acceleration):
-        """프로파일 가속도 설정"""
-        dxl_comm_result, dxl_error = self.packetHandler.write4ByteTxRx(
-            self.portHandler, motor_id, ADDR_PROFILE_ACCELERATION, acceleration)
-        
-        if dxl_comm_result != COMM_SUCCESS:
-            raise RuntimeError(f"가속도 설정 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
-        elif dxl_error != 0:
-            raise RuntimeError(f"가속도 설정 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+        """프로파일 가속도 설정 (같은 값이면 생략)"""
+        return self._write_cached(motor_id, ADDR_PROFILE_ACCELERATION, 4, acceleration, "가속도 설정")
     
     def is_moving(self, motor_id):
         """모터 이동 상태 확인"""
@@ -178,40 +794,85 @@ class DynamixelDriver:
         return bool(dxl_moving)
     
     def get_status(self, motor_id):
-        """모터 상태 정보 읽기"""
-        status = {}
-        
+        """모터 상태 정보 읽기 (상태 블록 1회 read)"""
         try:
-            # 현재 위치
-            status['position'] = self.get_present_position(motor_id)
-            
-            # 현재 속도
-            dxl_present_velocity, _, _ = self.packetHandler.read4ByteTxRx(
-                self.portHandler, motor_id, ADDR_PRESENT_VELOCITY)
-            status['velocity'] = dxl_present_velocity
-            
-            # 현재 전류
-            dxl_present_current, _, _ = self.packetHandler.read2ByteTxRx(
-                self.portHandler, motor_id, ADDR_PRESENT_CURRENT)
-            status['current'] = dxl_present_current
-            
-            # 온도
-            dxl_present_temperature, _, _ = self.packetHandler.read1ByteTxRx(
-                self.portHandler, motor_id, ADDR_PRESENT_TEMPERATURE)
-            status['temperature'] = dxl_present_temperature
-            
-            # 전압
-            dxl_present_voltage, _, _ = self.packetHandler.read2ByteTxRx(
-                self.portHandler, motor_id, ADDR_PRESENT_VOLTAGE)
-            status['voltage'] = dxl_present_voltage / 10.0  # 0.1V 단위
-            
-            # 이동 상태
-            status['moving'] = self.is_moving(motor_id)
-            
+            return self.read_status_block([motor_id])[motor_id]
         except Exception as e:
             logging.error(f"상태 읽기 실패: {e}")
-            
-        return status
+            return {}
+    
+    @staticmethod
+    def _decode_status(data, start, timestamp, fields=STATUS_FIELDS):
+        """상태 블록 바이트열 → 스냅샷 dict (fields에 있는 필드만)"""
+        snapshot = {'timestamp': timestamp}
+        for name in fields:
+            addr, size, signed = STATUS_FIELDS[name]
+            offset = addr - start
+            snapshot[name] = int.from_bytes(bytes(data[offset:offset + size]), 'little', signed=signed)
+        if 'moving' in snapshot:
+            snapshot['moving'] = bool(snapshot['moving'])
+        if 'voltage' in snapshot:
+            snapshot['voltage'] = snapshot['voltage'] / 10.0  # 0.1V 단위
+        return snapshot
+    
+    def _get_sync_reader(self, start, length, motor_ids):
+        key = (start, length, tuple(motor_ids))
+        reader = self._sync_readers.get(key)
+        if reader is None:
+            reader = GroupSyncRead(self.portHandler, self.packetHandler, start, length)
+            for motor_id in motor_ids:
+                if not reader.addParam(motor_id):
+                    raise RuntimeError(f"GroupSyncRead 파라미터 추가 실패: 모터 ID {motor_id}")
+            self._sync_readers[key] = reader
+        return reader
+    
+    def read_status_block(self, motor_ids, fields=None):
+        """
+        위치/속도/전류/온도/전압/이동상태를 한 번의 트랜잭션으로 읽기
+        (모터 1개: READ 1회, 여러 개: GroupSyncRead 1회)
+        
+        Args:
+            fields: 읽을 STATUS_FIELDS 이름 목록 (None이면 전체 블록)
+                    필드들을 덮는 최소 구간만 읽음 (pack_status_spans)
+        
+        Returns:
+            {motor_id: {'position', 'velocity', 'current', 'temperature', 'voltage', 'moving', 'timestamp'}}
+            (fields 지정 시 해당 필드 + 'timestamp')
+        """
+        if fields is None:
+            return self._read_status_span(motor_ids, STATUS_BLOCK_START, STATUS_BLOCK_LENGTH, STATUS_FIELDS)
+        
+        snapshots = {motor_id: {} for motor_id in motor_ids}
+        for start, length, names in pack_status_spans(fields):
+            for motor_id, snapshot in self._read_status_span(motor_ids, start, length, names).items():
+                snapshots[motor_id].update(snapshot)
+        return snapshots
+    
+    def _read_status_span(self, motor_ids, start, length, fields):
+        """상태 영역의 한 구간 읽기 (모터 1개: READ, 여러 개: GroupSyncRead)"""
+        if len(motor_ids) == 1:
+            motor_id = motor_ids[0]
+            data, dxl_comm_result, dxl_error = self.packetHandler.readTxRx(
+                self.portHandler, motor_id, start, length)
+            if dxl_comm_result != COMM_SUCCESS:
+                raise RuntimeError(f"상태 블록 읽기 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
+            elif dxl_error != 0:
+                raise RuntimeError(f"상태 블록 읽기 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+            return {motor_id: self._decode_status(data, start, time.time(), fields)}
+        
+        reader = self._get_sync_reader(start, length, motor_ids)
+        dxl_comm_result = reader.txRxPacket()
+        if dxl_comm_result != COMM_SUCCESS:
+            raise RuntimeError(f"상태 동기 읽기 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
+        
+        timestamp = time.time()
+        snapshots = {}
+        for motor_id in motor_ids:
+            if not reader.isAvailable(motor_id, start, length):
+                raise RuntimeError(f"상태 동기 읽기 데이터 없음: 모터 ID {motor_id}")
+            data = [reader.getData(motor_id, start + i, 1) for i in range(length)]
+            snapshots[motor_id] = self._decode_status(data, start, timestamp, fields)
+        return snapshots
     
     def move_to_position(self, motor_id, position, velocity=None, acceleration=None, wait=False):
         """위치로 이동 (고급 함수)"""
@@ -224,8 +885,29 @@ class DynamixelDriver:
         self.set_goal_position(motor_id, position)
         
         if wait:
-            while self.is_moving(motor_id):
-                time.sleep(0.01)
+            self.wait_for_motion([motor_id], {motor_id: position})
+    
+    def wait_for_motion(self, motor_ids, targets=None, tolerance=DXL_MOVING_STATUS_THRESHOLD, timeout=10.0, poll=0.02):
+        """
+        여러 모터의 이동 완료 대기 (워커 없이 드라이버만 쓸 때)
+        매 poll마다 전체 모터의 Moving/위치를 한 번에 읽고, 모두 멈췄고 목표와의 차이가 tolerance 이하이면 완료
+        DynamixelWorker를 쓰는 경우에는 worker.completion()이 추가 읽기 없이 같은 일을 함
+        
+        Args:
+            targets: {motor_id: 목표 위치} (없는 모터는 멈춤만 확인)
+        
+        Returns:
+            완료 시 True, timeout 시 False
+        """
+        targets = targets or {}
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            snapshots = self.read_status_block(list(motor_ids), ['moving', 'position'])
+            if all(not s['moving'] and abs(s['position'] - targets.get(i, s['position'])) <= tolerance
+                   for i, s in snapshots.items()):
+                return True
+            time.sleep(poll)
+        return False
     
     def position_to_angle(self, position, resolution=4096):
         """위치 값을 각도로 변환 (0-4095 -> 0-360도)"""
@@ -236,26 +918,54 @@ class DynamixelDriver:
         return int((angle / 360.0) * resolution)
     
     def set_operating_mode(self, motor_id, mode):
-        """동작 모드 설정 (토크 비활성화 상태에서만 가능)"""
-        dxl_comm_result, dxl_error = self.packetHandler.write1ByteTxRx(
-            self.portHandler, motor_id, ADDR_OPERATING_MODE, mode)
+        """동작 모드 설정 (토크 비활성화 상태에서만 가능, 같은 값이면 EEPROM 쓰기 생략)"""
+        if self._write_cached(motor_id, ADDR_OPERATING_MODE, 1, mode, "동작 모드 설정"):
+            logging.info(f"모터 ID {motor_id} 동작 모드 설정: {mode}")
+    
+    def ensure_operating_mode(self, motor_id, mode):
+        """
+        동작 모드가 mode가 되도록 보장
+        이미 mode이면 (캐시, 없으면 1회 읽기) 토크 OFF -> 모드 쓰기 -> 토크 ON 사이클을 생략
         
-        if dxl_comm_result != COMM_SUCCESS:
-            raise RuntimeError(f"동작 모드 설정 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
-        elif dxl_error != 0:
-            raise RuntimeError(f"동작 모드 설정 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+        Returns:
+            모드를 실제로 바꿨으면 True
+        """
+        return self.ensure_eeprom(motor_id, ADDR_OPERATING_MODE, 1, mode, "동작 모드 설정", torque_after=True)
+    
+    def ensure_eeprom(self, motor_id, address, size, value, label, torque_after=None):
+        """
+        EEPROM 값 보장: 이미 같으면 생략, 다르면 토크 OFF -> 쓰기 -> 토크 ON
+        
+        Args:
+            torque_after: 쓰기 후 토크를 켤지 여부 (None이면 쓰기 전 토크 상태 유지)
+        
+        Returns:
+            실제로 썼으면 True
+        """
+        if self._read_cached(motor_id, address, size, label) == value:
+            self.shadow_stats['hits'] += 1
+            self.shadow_stats['eeprom_hits'] += 1
+            self.shadow_stats['torque_cycles_saved'] += 1
+            return False
         
-        logging.info(f"모터 ID {motor_id} 동작 모드 설정: {mode}")
+        # 하드웨어 에러 셧다운으로 토크가 꺼졌을 수 있으므로 토크 상태는 항상 새로 읽음
+        self.invalidate_shadow(motor_id, ADDR_TORQUE_ENABLE)
+        torque_on = self._read_cached(motor_id, ADDR_TORQUE_ENABLE, 1, "토크 상태") == TORQUE_ENABLE
+        if torque_after is None:
+            torque_after = torque_on
+        if torque_on:
+            self.disable_torque(motor_id)
+        self.shadow_stats['misses'] += 1
+        self._write_register(motor_id, address, size, value, label)
+        if address == ADDR_OPERATING_MODE:
+            logging.info(f"모터 ID {motor_id} 동작 모드 설정: {value}")
+        if torque_after:
+            self.enable_torque(motor_id)
+        return True
     
     def set_goal_velocity(self, motor_id, velocity):
         """목표 속도 설정 (velocity control 모드에서 사용)"""
-        dxl_comm_result, dxl_error = self.packetHandler.write4ByteTxRx(
-            self.portHandler, motor_id, ADDR_GOAL_VELOCITY, velocity)
-        
-        if dxl_comm_result != COMM_SUCCESS:
-            raise RuntimeError(f"목표 속도 설정 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
-        elif dxl_error != 0:
-            raise RuntimeError(f"목표 속도 설정 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+        self._write_register(motor_id, ADDR_GOAL_VELOCITY, 4, velocity, "목표 속도 설정")
     
     def get_present_velocity(self, motor_id):
         """현재 속도 읽기"""
@@ -276,26 +986,109 @@ class DynamixelDriver:
     def set_extended_goal_position(self, motor_id, position):
         """Extended Position Control 모드에서 목표 위치 설정 (다중 회전 가능)"""
         # Extended Position Control 모드에서는 위치 범위 제한이 없음
-        dxl_comm_result, dxl_error = self.packetHandler.write4ByteTxRx(
-            self.portHandler, motor_id, ADDR_GOAL_POSITION, position)
+        self._write_register(motor_id, ADDR_GOAL_POSITION, 4, position, "Extended 위치 설정")
+    
+    def write_goal(self, motor_id, velocity, position):
+        """
+        프로파일 속도(112) + 목표 위치(116)를 한 번의 8바이트 쓰기로 설정
+        (set_profile_velocity + set_extended_goal_position 2회 왕복 -> 1회)
+        """
+        data = (velocity & 0xFFFFFFFF).to_bytes(4, 'little') + (position & 0xFFFFFFFF).to_bytes(4, 'little')
+        self._write_bytes(motor_id, ADDR_PROFILE_VELOCITY, data, "속도/위치 설정")
+        self._shadow.setdefault(motor_id, {})[ADDR_PROFILE_VELOCITY] = velocity
+    
+    def fresh_positions(self, motor_ids, snapshots=None, max_age=SNAPSHOT_MAX_AGE):
+        """
+        max_age 이내의 스냅샷 위치는 그대로 쓰고, 없거나 오래된 모터만 버스에서 읽기
         
+        Returns:
+            {motor_id: position}
+        """
+        snapshots = snapshots or {}
+        now = time.time()
+        positions = {}
+        stale = []
+        for motor_id in motor_ids:
+            snapshot = snapshots.get(motor_id)
+            if snapshot and now - snapshot.get('timestamp', 0.0) <= max_age:
+                positions[motor_id] = snapshot['position']
+            else:
+                stale.append(motor_id)
+        
+        if stale:
+            for motor_id, snapshot in self.read_status_block(stale).items():
+                positions[motor_id] = snapshot['position']
+        return positions
+    
+    def sync_write(self, address, length, values):
+        """
+        여러 모터에 같은 주소를 한 패킷으로 쓰기 (GroupSyncWrite, 응답 없음)
+        
+        Args:
+            address: 시작 주소
+            length: 모터당 바이트 수
+            values: {motor_id: int 또는 bytes}
+        """
+        key = (address, length)
+        writer = self._sync_writers.get(key)
+        if writer is None:
+            writer = GroupSyncWrite(self.portHandler, self.packetHandler, address, length)
+            self._sync_writers[key] = writer
+        
+        writer.clearParam()
+        for motor_id, value in values.items():
+            data = value if isinstance(value, (bytes, bytearray)) else \
+                (value & ((1 << (8 * length)) - 1)).to_bytes(length, 'little')
+            if not writer.addParam(motor_id, list(data)):
+                raise RuntimeError(f"GroupSyncWrite 파라미터 추가 실패: 모터 ID {motor_id}")
+        
+        dxl_comm_result = writer.txPacket()
         if dxl_comm_result != COMM_SUCCESS:
-            raise RuntimeError(f"Extended 위치 설정 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
-        elif dxl_error != 0:
-            raise RuntimeError(f"Extended 위치 설정 에러: {self.packetHandler.getRxPacketError(dxl_error)}")
+            raise RuntimeError(f"동기 쓰기 실패: {self.packetHandler.getTxRxResult(dxl_comm_result)}")
+        
+        # 응답 없는 쓰기이므로 덮어쓴 영역의 캐시 값을 그대로 믿지 않고, 확인 대기 중인 옛 값도 버림
+        for motor_id in values:
+            self._supersede_pending(motor_id, address, length)
+            shadow = self._shadow.get(motor_id, {})
+            for cached_address in [a for a in shadow if address <= a < address + length]:
+                del shadow[cached_address]
     
-    def move_to_angle_counterclockwise(self, motor_id, target_angle, velocity=100):
+    def sync_write_goals(self, goals):
         """
-        Extended Position Control 모드로 반시계방향으로만 특정 각도까지 이동
+        프로파일 속도(112) + 목표 위치(116)를 여러 모터에 한 패킷으로 쓰기
         
         Args:
-            motor_id: 모터 ID
-            target_angle: 목표 각도 (0-360도)
-            velocity: 이동 속도
+            goals: {motor_id: (profile_velocity, goal_position)}
         """
-        # 현재 위치 읽기 (Extended 모드에서는 다중 회전 위치)
-        current_position = self.get_present_position(motor_id)
+        self.sync_write(ADDR_PROFILE_VELOCITY, 8, {
+            motor_id: (velocity & 0xFFFFFFFF).to_bytes(4, 'little') + (position & 0xFFFFFFFF).to_bytes(4, 'little')
+            for motor_id, (velocity, position) in goals.items()
+        })
+    
+    def sync_write_goal_positions(self, positions):
+        """목표 위치를 여러 모터에 한 패킷으로 쓰기 {motor_id: position}"""
+        self.sync_write(ADDR_GOAL_POSITION, 4, positions)
+    
+    def sync_write_profile_velocities(self, velocities):
+        """프로파일 속도를 여러 모터에 한 패킷으로 쓰기 {motor_id: velocity}"""
+        self.sync_write(ADDR_PROFILE_VELOCITY, 4, velocities)
+    
+    def sync_write_goal_velocities(self, velocities):
+        """목표 속도를 여러 모터에 한 패킷으로 쓰기 {motor_id: velocity} (velocity control 모드)"""
+        self.sync_write(ADDR_GOAL_VELOCITY, 4, velocities)
+    
+    @staticmethod
+    def degrees_per_second_to_velocity(degrees_per_second):
+        """각속도(도/초)를 Goal Velocity 값(0.229 rpm 단위)으로 변환"""
+        return int(round(degrees_per_second / 6.0 / VELOCITY_UNIT_RPM))
+    
+    def _plan_counterclockwise(self, motor_id, current_position, target_angle):
+        """
+        반시계방향 목표 위치 계산 (버스 I/O 없음)
         
+        Returns:
+            (new_target_position, current_angle_in_rotation, target_angle, angle_diff)
+        """
         # 현재 각도 계산 (다중 회전 고려)
         current_angle_in_rotation = (current_position % 4096) / 4096 * 360
         target_angle = target_angle % 360
@@ -308,22 +1101,72 @@ class DynamixelDriver:
             # 목표 각도가 현재 각도보다 작으면 한 바퀴 돌아서 이동
             angle_diff = (360 - current_angle_in_rotation) + target_angle
 
-        if target_angle == self.target_angle_prev:
+        if target_angle == self.target_angle_prev.get(motor_id, 0):
             angle_diff = 360
         
         # 새로운 목표 위치 계산 (현재 위치 + 각도 차이)
         position_diff = int((angle_diff / 360) * 4096)
         new_target_position = current_position + position_diff
         
-        logging.info(f"Extended Position Control: Motor {motor_id} from {current_angle_in_rotation:.1f}° to {target_angle:.1f}° "
-                    f"(position: {current_position} -> {new_target_position}, diff: +{angle_diff:.1f}°)")
+        self.target_angle_prev[motor_id] = target_angle
+        
+        return new_target_position, current_angle_in_rotation, target_angle, angle_diff
+    
+    def move_to_angles_counterclockwise(self, target_angles, velocity=100, snapshots=None, max_age=SNAPSHOT_MAX_AGE):
+        """
+        여러 모터를 반시계방향으로 동시에 이동 (상태 동기 읽기 최대 1회 + 동기 쓰기 1회)
         
-        # 프로파일 속도 설정
-        self.set_profile_velocity(motor_id, velocity)
+        Args:
+            target_angles: {motor_id: 목표 각도 (0-360도)}
+            velocity: 이동 속도
+            snapshots: 워커가 읽어 둔 {motor_id: read_status_block 스냅샷} (선택)
+            max_age: 이보다 오래된 스냅샷은 버리고 다시 읽음 (초)
+        
+        Returns:
+            {motor_id: (new_target_position, current_position)}
+        """
+        motor_ids = list(target_angles)
+        positions = self.fresh_positions(motor_ids, snapshots, max_age)
         
-        # 목표 위치로 이동
-        self.set_extended_goal_position(motor_id, new_target_position)
+        goals = {}
+        result = {}
+        for motor_id in motor_ids:
+            current_position = positions[motor_id]
+            new_target_position, current_angle, target_angle, angle_diff = self._plan_counterclockwise(
+                motor_id, current_position, target_angles[motor_id])
+            logging.info(f"Extended Position Control: Motor {motor_id} from {current_angle:.1f}° to {target_angle:.1f}° "
+                         f"(position: {current_position} -> {new_target_position}, diff: +{angle_diff:.1f}°)")
+            goals[motor_id] = (velocity, new_target_position)
+            result[motor_id] = (new_target_position, current_position)
+        
+        self.sync_write_goals(goals)
+        return result
+    
+    def move_to_angle_counterclockwise(self, motor_id, target_angle, velocity=100, snapshot=None,
+                                       max_age=SNAPSHOT_MAX_AGE):
+        """
+        Extended Position Control 모드로 반시계방향으로만 특정 각도까지 이동
+        
+        Args:
+            motor_id: 모터 ID
+            target_angle: 목표 각도 (0-360도)
+            velocity: 이동 속도
+            snapshot: 워커가 읽어 둔 read_status_block 스냅샷 (선택, 'position'/'timestamp')
+            max_age: 스냅샷이 이보다 오래됐으면 버스에서 다시 읽음 (초)
+        """
+        # 현재 위치 (Extended 모드에서는 다중 회전 위치): 최근 스냅샷이 있으면 읽기 생략
+        if snapshot and time.time() - snapshot.get('timestamp', 0.0) <= max_age:
+            current_position = snapshot['position']
+        else:
+            current_position = self.get_present_position(motor_id)
+        
+        new_target_position, current_angle_in_rotation, target_angle, angle_diff = self._plan_counterclockwise(
+            motor_id, current_position, target_angle)
+        
+        logging.info(f"Extended Position Control: Motor {motor_id} from {current_angle_in_rotation:.1f}° to {target_angle:.1f}° "
+                    f"(position: {current_position} -> {new_target_position}, diff: +{angle_diff:.1f}°)")
         
-        self.target_angle_prev = target_angle
+        # 프로파일 속도 + 목표 위치를 한 번에 쓰기
+        self.write_goal(motor_id, velocity, new_target_position)
         
         return new_target_position, current_position
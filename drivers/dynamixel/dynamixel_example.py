@@ -158,30 +158,21 @@ def multi_motor_example():
         
         # 모든 모터 토크 활성화
         for motor in motors:
-            motor_id = motor['id']
-            driver.enable_torque(motor_id)
-            driver.set_profile_velocity(motor_id, 150)
+            driver.enable_torque(motor['id'])
         
-        # 동시에 다른 위치로 이동
+        # 동시에 다른 위치로 이동 (프로파일 속도 + 목표 위치를 동기 쓰기 1회로)
         target_positions = [1024, 2048, 3072]  # 각각 다른 위치
         
+        goals = {}
         for i, motor in enumerate(motors[:3]):  # 최대 3개 모터
-            motor_id = motor['id']
             pos = target_positions[i % len(target_positions)]
-            driver.set_goal_position(motor_id, pos)
-            print(f"모터 ID {motor_id}: 위치 {pos}로 이동 시작")
-        
-        # 모든 모터가 이동 완료될 때까지 대기
-        while True:
-            all_stopped = True
-            for motor in motors[:3]:
-                if driver.is_moving(motor['id']):
-                    all_stopped = False
-                    break
-            
-            if all_stopped:
-                break
-            
+            goals[motor['id']] = (150, pos)
+            print(f"모터 ID {motor['id']}: 위치 {pos}로 이동 시작")
+        driver.sync_write_goals(goals)
+        
+        # 모든 모터가 이동 완료될 때까지 대기 (동기 읽기 1회로 전체 확인)
+        motor_ids = list(goals)
+        while any(s['moving'] for s in driver.read_status_block(motor_ids).values()):
             time.sleep(0.1)
         
         print("모든 모터 이동 완료")
@@ -2,20 +2,28 @@
 """
 Test script for Arduino worker thread functionality
 This script tests the ArduinoWorker class independently
+
+  python drivers/dynamixel/test_arduino_thread.py              # real board on COM4
+  python drivers/dynamixel/test_arduino_thread.py --emulator   # pty emulator (Linux)
 """
 
+import os
+import sys
 import time
 import logging
-from ardu_worker import ArduinoWorker
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from src.ardu_worker import ArduinoWorker
 
-def test_arduino_worker():
+def test_arduino_worker(port="COM4", emulator=None):
     """Test Arduino worker functionality"""
     logging.basicConfig(level=logging.INFO)
     
     logging.info("Testing Arduino Worker Thread...")
     
     # Create Arduino worker instance
-    arduino_worker = ArduinoWorker(port="COM4", baudrate=115200, tick=0.1)
+    arduino_worker = ArduinoWorker(port=port, baudrate=115200, tick=0.1)
     
     try:
         # Try to connect
@@ -27,6 +35,8 @@ def test_arduino_worker():
             print("✓ Arduino worker thread started")
             
             # Run for 10 seconds and monitor status
+            if emulator is not None:
+                emulator.press_switch(0x80, duration=1.0, delay=3.0)
             start_time = time.time()
             while time.time() - start_time < 10:
                 status = arduino_worker.get_status()
@@ -47,7 +57,7 @@ def test_arduino_worker():
             
         else:
             print("✗ Failed to connect to Arduino")
-            print("Note: This is expected if no Arduino is connected to COM4")
+            print(f"Note: This is expected if no Arduino is connected to {port}")
             
     except Exception as e:
         print(f"✗ Error during test: {e}")
@@ -58,6 +68,20 @@ def test_arduino_worker():
         arduino_worker.stop()
         arduino_worker.join()
         print("✓ Arduino worker stopped")
+        if emulator is not None:
+            emulator.stop()
+            emulator.join()
 
 if __name__ == "__main__":
-    test_arduino_worker()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", default="COM4")
+    parser.add_argument("--emulator", action="store_true", help="run against tools/arduino_emulator.py")
+    args = parser.parse_args()
+
+    if args.emulator:
+        from tools.arduino_emulator import ArduinoEmulator
+        emu = ArduinoEmulator()
+        emu.start()
+        test_arduino_worker(emu.device, emu)
+    else:
+        test_arduino_worker(args.port)
@@ -0,0 +1,274 @@
+"""
+Headless runner: connect, home and run the schedule loop without Qt
+
+Uses the same config.json / schedule.txt as the GUI and the same drivers and
+workers, but never imports PyQt5, so it starts fast and runs on rigs without
+a display. Status snapshots are written as JSON lines, to stdout (logs go to
+stderr and the rotating log file) and/or to clients of a local TCP socket:
+
+    python headless.py                          # status on stdout every second
+    python headless.py --status socket --port 8765
+    nc 127.0.0.1 8765                           # one JSON line per interval
+
+Ctrl+C / SIGTERM stops the loop (or aborts homing with an E-STOP) and
+releases every device.
+"""
+
+import sys
+import json
+import time
+import socket
+import signal
+import logging
+import argparse
+import threading
+
+from src.app_config import app_dir, load_config, save_config, load_schedule
+from src.schedule_command import parse_schedule
+from src.motor_worker import MotorWorker
+from src.ardu_worker import ArduinoWorker
+from src.ardu_protocol import PROTOCOL_V1
+from src.device_setup import open_motor_driver, open_dynamixel, close_dynamixel, create_dynamixel_worker, stop_worker
+from src.log_pipeline import LoggingPipeline, config_handlers
+
+HOME_TIMEOUT = 60.0     # seconds to wait for the homing-complete flag
+STATUS_INTERVAL = 1.0   # seconds between status lines
+
+
+def thaw(value):
+    """Frozen status snapshot -> plain JSON-serialisable containers"""
+    if hasattr(value, 'items'):
+        return {str(key): thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+class StatusServer:
+    """Local TCP socket streaming status lines to every connected client"""
+
+    def __init__(self, host, port):
+        self.sock = socket.create_server((host, port))
+        self.clients = []
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self._accept, daemon=True, name="StatusServer")
+        self.thread.start()
+        logging.info(f"Status socket listening on {host}:{port}")
+
+    def _accept(self):
+        while True:
+            try:
+                conn, addr = self.sock.accept()
+            except OSError:
+                return  # socket closed
+            conn.settimeout(1.0)
+            with self.lock:
+                self.clients.append(conn)
+            logging.info(f"Status client connected from {addr[0]}:{addr[1]}")
+
+    def send(self, line):
+        with self.lock:
+            clients = list(self.clients)
+        for conn in clients:
+            try:
+                conn.sendall(line)
+            except OSError:
+                with self.lock:
+                    self.clients.remove(conn)
+                conn.close()
+
+    def close(self):
+        self.sock.close()
+        with self.lock:
+            for conn in self.clients:
+                conn.close()
+            self.clients.clear()
+
+
+class HeadlessRunner:
+    def __init__(self, config, schedule, use_arduino=True, use_dynamixel=True, home=True):
+        self.config = config
+        self.base_schedule = schedule
+        self.cycle_period = schedule[-1].t if schedule else 0
+        self.use_arduino = use_arduino
+        self.use_dynamixel = use_dynamixel
+        self.home = home
+
+        self.drv = None
+        self.motor_worker = None
+        self.arduino_worker = None
+        self.dynamixel_driver = None
+        self.dynamixel_worker = None
+
+    # ── bring-up ──────────────────────────────────────────────
+    def start(self, stop_evt=None):
+        """
+        Connect every configured device, home the servo and start the schedule loop
+
+        stop_evt (set by the signal handlers) aborts homing with an E-STOP, and
+        the loop is not started once it is set. Returns True when the loop runs.
+        """
+        if stop_evt is None:
+            stop_evt = threading.Event()
+        ports = self.config.get("ports", {})
+        baudrates = self.config.get("baudrates", {})
+
+        if not ports.get("motor_driver") or not baudrates.get("motor_driver"):
+            raise ValueError("Motor driver port or baudrate not configured in config.json")
+        self.drv = open_motor_driver(ports["motor_driver"], baudrates["motor_driver"])
+        self.drv.zoffset = self.config.get("zoffset", 0)
+        self.motor_worker = MotorWorker(self.drv, self.base_schedule, self.cycle_period)
+        self.motor_worker.start()
+
+        if self.use_arduino:
+            self._start_arduino(ports.get("arduino"))
+        if self.use_dynamixel:
+            self._start_dynamixel(ports.get("dynamixel"), baudrates.get("dynamixel"))
+
+        if stop_evt.is_set() or (self.home and not self.home_servo(stop_evt=stop_evt)):
+            return False
+        self.motor_worker.start_loop()
+        return True
+
+    def _start_arduino(self, port):
+        if not port:
+            logging.warning("Arduino port not configured, skipping")
+            return
+        worker = ArduinoWorker(port=port, protocol=self.config.get("arduino", {}).get("protocol", PROTOCOL_V1))
+        if not worker.connect():
+            logging.error(f"Failed to connect Arduino on {port}, continuing without it")
+            return
+        worker.start()
+        self.arduino_worker = worker
+
+    def _start_dynamixel(self, port, baudrate):
+        if not port or not baudrate:
+            logging.warning("Dynamixel port or baudrate not configured, skipping")
+            return
+        dxl_config = self.config.setdefault("dynamixel", {})
+        try:
+            driver, found_motors, bus_map = open_dynamixel(port, baudrate, dxl_config)
+        except Exception as e:
+            logging.error(f"Dynamixel connection failed: {e}, continuing without it")
+            return
+        if bus_map is not None:
+            dxl_config["bus_map"] = bus_map
+            save_config(self.config)
+        logging.info(f"Dynamixel connected on {port} at {baudrate} baud: {len(found_motors)} motors found")
+        self.dynamixel_driver = driver
+        self.dynamixel_worker = create_dynamixel_worker(driver, dxl_config)
+        self.dynamixel_worker.start()
+
+    def home_servo(self, timeout=HOME_TIMEOUT, stop_evt=None):
+        """
+        Start homing and wait for the homing-complete flag in the worker's status
+
+        Returns False when stop_evt was set while waiting (the axis is stopped with an E-STOP)
+        """
+        if stop_evt is None:
+            stop_evt = threading.Event()
+        with self.motor_worker.lock:
+            self.drv.homing()
+        logging.info("Homing started")
+        wait = self.motor_worker.tick * 3  # skip samples polled before the drive accepted the command
+        deadline = time.monotonic() + timeout
+        while not stop_evt.wait(wait):
+            status = self.motor_worker.notifier.latest()
+            if status is not None and status.get('homing') and not status.get('run'):
+                logging.info("Homing complete")
+                return True
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Homing did not complete within {timeout:.0f} s")
+            wait = 0.1
+        with self.motor_worker.lock:
+            self.drv.estop()
+        logging.warning("Homing interrupted, E-STOP sent")
+        return False
+
+    # ── status ────────────────────────────────────────────────
+    def status(self):
+        """{device: latest snapshot} for every running worker"""
+        workers = {"motor": self.motor_worker, "arduino": self.arduino_worker, "dynamixel": self.dynamixel_worker}
+        line = {"time": round(time.time(), 3), "looping": bool(self.motor_worker and self.motor_worker.looping)}
+        for name, worker in workers.items():
+            if worker is not None:
+                line[name] = thaw(worker.notifier.latest())
+        return line
+
+    # ── teardown ──────────────────────────────────────────────
+    def stop(self):
+        """Stop the loop and release every device (safe to call after a partial start)"""
+        if self.motor_worker is not None:
+            self.motor_worker.stop_loop()
+            stop_worker(self.motor_worker, "Motor worker")
+            self.motor_worker = None
+        if self.drv is not None:
+            self.drv.client.close()
+            self.drv = None
+            logging.info("Driver disconnected")
+        if self.arduino_worker is not None:
+            stop_worker(self.arduino_worker, "Arduino worker")
+            self.arduino_worker = None
+        if self.dynamixel_worker is not None:
+            stop_worker(self.dynamixel_worker, "Dynamixel worker")
+            self.dynamixel_worker = None
+        if self.dynamixel_driver is not None:
+            close_dynamixel(self.dynamixel_driver)
+            self.dynamixel_driver = None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the schedule loop without the GUI")
+    parser.add_argument("--status", choices=("stdout", "socket", "both", "none"), default="stdout",
+                        help="where to write JSON status lines (default: stdout)")
+    parser.add_argument("--host", default="127.0.0.1", help="status socket address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="status socket port (default: 8765)")
+    parser.add_argument("--interval", type=float, default=STATUS_INTERVAL, help="seconds between status lines")
+    parser.add_argument("--duration", type=float, default=None, help="stop after this many seconds")
+    parser.add_argument("--no-home", action="store_true", help="skip homing before starting the loop")
+    parser.add_argument("--no-arduino", action="store_true", help="do not connect the Arduino")
+    parser.add_argument("--no-dynamixel", action="store_true", help="do not connect the Dynamixel ring")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = load_config()
+    log_pipeline = LoggingPipeline(config_handlers(config.get("logging", {}), app_dir()), logging.INFO)
+
+    stop_evt = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_evt.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_evt.set())
+
+    runner = HeadlessRunner(config, parse_schedule(load_schedule()),
+                            use_arduino=not args.no_arduino, use_dynamixel=not args.no_dynamixel,
+                            home=not args.no_home)
+    server = StatusServer(args.host, args.port) if args.status in ("socket", "both") else None
+    exit_code = 0
+    try:
+        if runner.start(stop_evt):
+            logging.info("Headless loop running")
+        deadline = time.monotonic() + args.duration if args.duration is not None else None
+        while not stop_evt.wait(args.interval):
+            line = (json.dumps(runner.status(), default=str) + "\n").encode()
+            if args.status in ("stdout", "both"):
+                sys.stdout.buffer.write(line)
+                sys.stdout.flush()
+            if server is not None:
+                server.send(line)
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+    except Exception as e:
+        logging.error(f"Headless run failed: {e}")
+        exit_code = 1
+    finally:
+        runner.stop()
+        if server is not None:
+            server.close()
+        logging.info("Headless runner stopped")
+        log_pipeline.stop()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,64 +1,161 @@
-import sys, time, logging, pathlib
-from PyQt5 import QtWidgets, uic
-from PyQt5.QtCore import QTimer, pyqtSignal, QObject
-from PyQt5.QtGui import QTextCursor
-import json, pathlib
+from __future__ import annotations
+import sys, time, math, hashlib, logging, functools
+from typing import TYPE_CHECKING
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
+from PyQt5.QtGui import QTextCursor, QFontDatabase
 # ──────────────────────────────────────────────────────────────
-# Driver 클래스는 별도 driver.py에 그대로 넣어 두었다고 가정
-from drivers.motor_driver import Driver, CNT2RAD, RAD2DEG, ZERO_POS
-from drivers.dynamixel.dynamixel_driver import DynamixelDriver, VELOCITY_CONTROL_MODE, POSITION_CONTROL_MODE, EXTENDED_POSITION_CONTROL_MODE
+# 장치 스택(pymodbus, pyserial, dynamixel_sdk)은 시작 시간을 줄이기 위해 처음 연결할 때 import
+# (src.device_setup, start_arduino_worker 참조)
+if TYPE_CHECKING:
+    from drivers.motor_driver import Driver
+    from drivers.dynamixel.dynamixel_driver import DynamixelDriver
+    from src.ardu_worker import ArduinoWorker
+    from src.dynamixel_worker import DynamixelWorker
 # ──────────────────────────────────────────────────────────────
 
-from src.schedule_command import parse_schedule, Command
+from src.schedule_command import parse_schedule
 from src.motor_worker import MotorWorker
-from src.ardu_worker import ArduinoWorker
-from src.dynamixel_worker import DynamixelWorker
-
-def app_dir() -> pathlib.Path:
-    """exe가 있는 폴더(개발 중에는 소스 폴더)"""
-    if getattr(sys, 'frozen', False):
-        return pathlib.Path(sys.executable).parent
-    return pathlib.Path(__file__).parent
-
-def resource_path(relative: str) -> pathlib.Path:
-    """번들 내부 리소스(.ui, .json)에 접근 (sys._MEIPASS)"""
-    base = pathlib.Path(getattr(sys, '_MEIPASS', app_dir()))
-    return base / relative
-
-OFFSET_FILE = app_dir() / "offset.json"
-SCHEDULE_FILE = app_dir() / "schedule.txt"
-CONFIG_FILE = app_dir() / "config.json"
-
+from src.link_stats import format_rtt_hist
+from src.status_notifier import StatusNotifier
+from src.view_model import WidgetCache, FrameTimer
+from src.telemetry import TelemetryChannel
+from src.telemetry_plot import TelemetryPlot
+from src.log_buffer import LogRing, LogRingHandler, matches, DEVICES, DEFAULT_CAPACITY as LOG_CAPACITY
+from src.log_pipeline import LoggingPipeline, config_handlers, LOG_FORMAT, LOG_DATEFMT
+from src.device_tasks import DeviceExecutor
+from src.device_setup import open_motor_driver, open_dynamixel, close_dynamixel, create_dynamixel_worker, stop_worker
+from src.app_config import app_dir, resource_path, load_config, save_config, load_schedule, save_offset
 
 
 VEL_DEF = 2      # RPM / 입력축 : 출력축 = 1rpm : 0.086deg/s 
 ACC_DEF = 100    # 기본 가속도(도/초^2)
+DIAG_EVERY_TICKS = 30  # 진단 패널 갱신 주기 (60 Hz 기준 0.5초)
+FRAME_MS = 17          # 상태 repaint 최소 간격 (60 Hz)
+SHUTDOWN_TIMEOUT_MS = 5000  # 종료 시 장치 정리 작업을 기다리는 최대 시간
 
 
-# ── QTextBrowser 로깅 핸들러 ────────────────────────────────────
-class LogSignalEmitter(QObject):
-    log_signal = pyqtSignal(str)
+# ── 로그 뷰 (유한 링 버퍼 + 프레임당 일괄 출력) ─────────────────
+LOG_LEVELS = (("ALL", logging.NOTSET), ("INFO+", logging.INFO), ("WARNING+", logging.WARNING),
+              ("ERROR", logging.ERROR))
+LOG_MAX_LINES = 5000  # QTextBrowser에 유지할 최대 줄 수 (config gui.log_lines)
 
-class QTextBrowserHandler(logging.Handler):
-    def __init__(self, text_browser):
-        super().__init__()
+class LogView(QObject):
+    """LogRing의 새 레코드를 프레임당 한 번 QTextBrowser에 일괄 추가 (줄 수 제한, 레벨/장치 필터)"""
+
+    def __init__(self, text_browser, ring: LogRing, max_lines: int = LOG_MAX_LINES, parent=None):
+        super().__init__(parent)
         self.text_browser = text_browser
-        self.signal_emitter = LogSignalEmitter()
-        self.signal_emitter.log_signal.connect(self.text_browser.append)
-        
-    def emit(self, record):
-        msg = self.format(record)
-        # 시그널을 통해 GUI 스레드에서 안전하게 텍스트 추가
-        self.signal_emitter.log_signal.emit(msg)
+        self.ring = ring
+        self.max_lines = max_lines
+        self.min_level = logging.NOTSET
+        self.device = None
+        # 오래된 줄은 문서에서 자동으로 제거
+        text_browser.document().setMaximumBlockCount(max_lines)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(FRAME_MS)
+        self.timer.timeout.connect(self.flush)
+        self.timer.start()
+
+    def flush(self):
+        entries = [e.text for e in self.ring.drain() if matches(e, self.min_level, self.device)]
+        if not entries:
+            return
+        document = self.text_browser.document()
+        bar = self.text_browser.verticalScrollBar()
+        follow = bar.value() >= bar.maximum() - 4  # 사용자가 위로 스크롤 중이면 위치 유지
+
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        prefix = "\n" if not document.isEmpty() else ""
+        cursor.insertText(prefix + "\n".join(entries[-self.max_lines:]))
+        if follow:
+            bar.setValue(bar.maximum())
+
+    def set_filter(self, min_level: int, device: str | None):
+        """필터 변경 시 링 버퍼에 남아 있는 레코드로 다시 그림"""
+        self.min_level = min_level
+        self.device = device
+        entries = [e.text for e in self.ring.entries(clear_pending=True) if matches(e, min_level, device)]
+        self.text_browser.setPlainText("\n".join(entries[-self.max_lines:]))
+        bar = self.text_browser.verticalScrollBar()
+        bar.setValue(bar.maximum())
+
+
+# ── 워커 상태 → Qt 시그널 브리지 ────────────────────────────────
+class StatusSignalBridge(QObject):
+    """StatusNotifier 알림을 GUI 스레드 시그널로 전달 (워커 스레드에서 emit → queued 연결)"""
+    status_ready = pyqtSignal(str)
+
+    def __init__(self, name: str, notifier: StatusNotifier, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.notifier = notifier
+        notifier.subscribe(self._notify)
+
+    def _notify(self):
+        self.status_ready.emit(self.name)
+
+    def close(self):
+        self.notifier.unsubscribe(self._notify)
+
+
+# ── 장치 I/O 작업 완료 → Qt 시그널 브리지 ───────────────────────
+class TaskResultBridge(QObject):
+    """DeviceExecutor Future 완료를 GUI 스레드 콜백으로 전달 (I/O 스레드에서 emit → queued 연결)"""
+    task_done = pyqtSignal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 이미 끝난 Future도 호출한 핸들러가 반환된 뒤에 콜백되도록 항상 queued
+        self.task_done.connect(self._dispatch, Qt.QueuedConnection)
+
+    def watch(self, future, callback):
+        """future 완료 시 GUI 스레드에서 callback(future) 호출"""
+        future.add_done_callback(lambda f: self.task_done.emit(callback, f))
+
+    def _dispatch(self, callback, future):
+        callback(future)
+
+
+# ── UI: 미리 컴파일된 모듈 (tools/build_ui.py) 우선, 없거나 .ui가 바뀌었으면 실행 시 파싱 ──
+UI_FILE = "resource/mainwindow.ui"
+
+class LoadedUi:
+    """.ui 파일을 실행 시 파싱 (uic.loadUi, exe에 포함된 리소스 파일 접근)"""
+    def setupUi(self, window):
+        from PyQt5 import uic
+        uic.loadUi(resource_path(UI_FILE), window)
+
+@functools.lru_cache(maxsize=None)
+def stale_ui_warning():
+    """컴파일된 UI가 .ui와 다르면 경고 문구, 최신이거나 없으면 None (로깅 파이프라인 설치 후 MainWindow가 기록)"""
+    try:
+        from src.ui_mainwindow import UI_SHA256
+    except ImportError:
+        return None
+    ui_file = resource_path(UI_FILE)
+    # 줄바꿈(CRLF/LF)과 무관하게 비교 (tools/build_ui.py ui_digest와 동일)
+    if ui_file.exists() and hashlib.sha256(ui_file.read_bytes().replace(b"\r\n", b"\n")).hexdigest() != UI_SHA256:
+        return (f"{UI_FILE} changed after src/ui_mainwindow.py was built "
+                "(run python tools/build_ui.py), loading the .ui file instead")
+    return None
+
+def main_window_ui():
+    # 클래스 정의 시점(import)에 호출되므로 여기서는 로그를 남기지 않음 (아직 로그 파일/GUI 핸들러 없음)
+    try:
+        from src.ui_mainwindow import Ui_MainWindow
+    except ImportError:
+        return LoadedUi
+    return LoadedUi if stale_ui_warning() else Ui_MainWindow
 
 
 # ── 메인 윈도우 ────────────────────────────────────────────────
-class MainWindow(QtWidgets.QMainWindow):
+class MainWindow(QtWidgets.QMainWindow, main_window_ui()):
     def __init__(self):
         super().__init__()
-        # .ui 파일 로드 (exe에 포함된 리소스 파일 접근)
-        ui_path = resource_path("resource/mainwindow.ui")
-        uic.loadUi(ui_path, self)
+        self.setupUi(self)
 
         # 내부 상태
         self.drv: Driver | None = None
@@ -70,16 +167,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self.connected = False
         self.arduino_connected = False
         self.dynamixel_connected = False
+        self.dynamixel_connecting = False
 
-        self.schedule_text = self.scheduleload()
+        self.schedule_text = load_schedule()
         self.base_schedule = parse_schedule(self.schedule_text)
         self.cycle_period = self.base_schedule[-1].t if self.base_schedule else 0
 
         # Config 로드 및 초기화
-        self.config = self.load_config()
+        self.config = load_config()
         self.saved_offset = self.config.get("zoffset", 0)
         self.lineEdit.setText(str(self.saved_offset))  # 초기 오프셋 표시
-        
+
+        # 상태 표시 위젯은 값이 바뀐 경우에만 갱신 (gui.diff_render=false면 매번 갱신, 비교 측정용)
+        self.view = WidgetCache(enabled=self.config.get("gui", {}).get("diff_render", True))
+        self.frame_timer = FrameTimer()
+
+        # 블로킹 장치 I/O(연결, 스캔, 홈, 조그, 종료)는 장치별 I/O 스레드에서 실행, 완료는 시그널로 수신
+        self.device_tasks = DeviceExecutor()
+        self.task_bridge = TaskResultBridge(self)
+        self.pending_buttons = {}     # {버튼: 대기 표시 전 텍스트}
+        self.tasks_in_flight = 0      # 제출했지만 GUI 완료 콜백이 아직 끝나지 않은 작업 수
+        self.closing = False
+        self.shutdown_done = False
+
         # Ring position 초기값 설정 - config에서 불러온 값으로 GUI 업데이트
         ring_positions = self.config.get("ring_positions", {})
         if hasattr(self, 'lineEdit_ringpos1'):
@@ -91,7 +201,15 @@ class MainWindow(QtWidgets.QMainWindow):
             self.lineEidit_ringpos2.setText(str(ring2_value))
             logging.info(f"Ring Position 2 loaded from config: {ring2_value}°")
 
-        # 타이머: 60 Hz
+        # 워커 상태 push: 알림이 온 장치만 프레임당 최대 1회 repaint
+        self.status_bridges: dict[str, StatusSignalBridge] = {}
+        self.status_dirty: set[str] = set()
+        self.last_repaint = 0.0
+        self.repaint_timer = QTimer(self)
+        self.repaint_timer.setSingleShot(True)
+        self.repaint_timer.timeout.connect(self.repaint_status)
+
+        # 타이머: 60 Hz (경과 시간, 진단 패널)
         self.timer = QTimer(self)
         self.timer.setInterval(17)  # 1000ms / 60Hz ≈ 16.67ms
         self.timer.timeout.connect(self.on_tick)
@@ -105,15 +223,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
 
-        self.pushButton_homing.setEnabled(False)  # 홈 버튼은 연결 후 활성화
-        self.pushButton_estop.setEnabled(False)    # E-STOP 버튼은 연결 후 활성화
+        self.view.set_enabled(self.pushButton_homing, False)  # 홈 버튼은 연결 후 활성화
+        self.view.set_enabled(self.pushButton_estop, False)    # E-STOP 버튼은 연결 후 활성화
         
-        self.pushButton_runloop.setEnabled(False)  # 루프 버튼은 연결 후 활성화
-        self.pushButton_gozero.setEnabled(False)
-        self.pushButton_m0.setEnabled(False)       # M0 버튼은 연결 후 활성화
-        self.pushButton_m1.setEnabled(False)       # M1 버튼은 연결 후 활성화
-        self.pushButton_m2.setEnabled(False)       # M2 버튼은 연결 후 활성화
-        self.pushButton_m3.setEnabled(False)       # M3 버튼은 연결 후 활성화
+        self.view.set_enabled(self.pushButton_runloop, False)  # 루프 버튼은 연결 후 활성화
+        self.view.set_enabled(self.pushButton_gozero, False)
+        self.view.set_enabled(self.pushButton_m0, False)       # M0 버튼은 연결 후 활성화
+        self.view.set_enabled(self.pushButton_m1, False)       # M1 버튼은 연결 후 활성화
+        self.view.set_enabled(self.pushButton_m2, False)       # M2 버튼은 연결 후 활성화
+        self.view.set_enabled(self.pushButton_m3, False)       # M3 버튼은 연결 후 활성화
 
 
         self.pushButton_homing.clicked.connect(self.on_homing_clicked)
@@ -128,6 +246,8 @@ class MainWindow(QtWidgets.QMainWindow):
         # Arduino UI 요소 연결
         self.setup_arduino_ui()
         self.setup_logging()
+        if stale_ui_warning():
+            logging.warning(stale_ui_warning())
 
         # Arduino 연결 버튼 연결
         self.pushButton_arduino_connect.clicked.connect(self.on_arduino_connect_clicked)
@@ -156,70 +276,30 @@ class MainWindow(QtWidgets.QMainWindow):
         if hasattr(self, 'pushButton_ringc'):
             self.pushButton_ringc.clicked.connect(self.on_ringc_clicked)
 
-    def scheduleload(self) -> str:
-        """앱 시작 시 호출 schedule.txt 전체를 문자열로 반환"""
-        if SCHEDULE_FILE.exists():
-            try:
-                return SCHEDULE_FILE.read_text(encoding="utf-8")
-            except Exception as e:
-                logging.warning(f"schedule load error: {e}")
-        # 파일이 없거나 오류일 때 기본 샘플 제공
-        return """
-          # t, deg, vel, acc, dwell
-            0.0,  +2.0, 10, 100, 0
-            3.0,  -2.0, 10, 100, 0
-            6.0,   0.0, 10, 100, 0
-        """
-
-    def offsetload(self) -> int:
-        if OFFSET_FILE.exists():
-            try:
-                with OFFSET_FILE.open() as f:
-                    data = json.load(f)
-                    return int(data.get("zoffset", 0))
-            except Exception as e:
-                logging.warning(f"offset load error: {e}")
-        return 0        # 기본값
-
-    def load_config(self) -> dict:
-        """config.json 파일 로드"""
-        if not CONFIG_FILE.exists():
-            raise FileNotFoundError(f"Configuration file not found: {CONFIG_FILE}")
-        
-        try:
-            with CONFIG_FILE.open() as f:
-                return json.load(f)
-        except Exception as e:
-            raise RuntimeError(f"Failed to load config file: {e}")
-
-    def save_config(self, config: dict):
-        """config.json 파일 저장"""
-        try:
-            with CONFIG_FILE.open("w") as f:
-                json.dump(config, f, indent=2)
-            logging.info("Configuration saved to config.json")
-        except Exception as e:
-            logging.error(f"Error saving config: {e}")
+        # 진단 패널, 실시간 텔레메트리 그래프
+        self.setup_diagnostics_ui()
+        self.setup_telemetry_ui()
 
     def start_motor_worker(self):
         """워커 스레드 시작"""
         if self.motor_worker is None:
             self.motor_worker = MotorWorker(self.drv, self.base_schedule, self.cycle_period)
+            self.attach_status("motor", self.motor_worker.notifier)
             self.motor_worker.start()
             logging.info("Motor worker started")
         else:
             logging.warning("Motor worker already running")
     
     def stop_motor_worker(self):
-        """워커 스레드 중지"""
-        if self.motor_worker is not None:
-            self.motor_worker.stop()
-            self.motor_worker.join()
-            self.motor_worker = None
-            logging.info("Motor worker stopped")
-
-    def start_arduino_worker(self):
-        """Arduino 워커 스레드 시작"""
+        """워커 스레드 중지 (join은 servo I/O 스레드에서), 완료 Future 반환"""
+        worker, self.motor_worker = self.motor_worker, None
+        if worker is None:
+            return None
+        self.detach_status("motor")
+        return self.run_device_task("servo", stop_worker, worker, "Motor worker")
+
+    def start_arduino_worker(self, button=None):
+        """Arduino 연결(시리얼 열기, 프로토콜 협상)을 I/O 스레드에 제출, 완료 Future 반환 (결과는 _on_arduino_opened)"""
         if self.arduino_worker is None:
             # config에서 Arduino 포트 가져오기
             ports = self.config.get("ports", {})
@@ -227,41 +307,78 @@ class MainWindow(QtWidgets.QMainWindow):
             
             if not port:
                 logging.error("Arduino port not configured in config.json")
-                return False
+                return None
             
-            self.arduino_worker = ArduinoWorker(port=port)
-            if self.arduino_worker.connect():
-                self.arduino_worker.start()
-                self.arduino_connected = True
-                logging.info(f"Arduino worker started on {port}")
-                return True
-            else:
-                self.arduino_worker = None
-                self.arduino_connected = False
-                logging.error(f"Failed to connect Arduino on {port}")
-                return False
+            from src.ardu_worker import ArduinoWorker  # pyserial은 첫 연결 때 로드
+            from src.ardu_protocol import PROTOCOL_V1
+            # 프로토콜 v2는 config의 arduino.protocol = 2 일 때만 협상
+            protocol = self.config.get("arduino", {}).get("protocol", PROTOCOL_V1)
+            self.arduino_worker = ArduinoWorker(port=port, protocol=protocol)
+            return self.run_device_task("arduino", self.arduino_worker.connect, on_done=self._on_arduino_opened,
+                                        button=button, pending_text="CONNECTING…")
         else:
             logging.warning("Arduino worker already running")
-            return False
-    
-    def stop_arduino_worker(self):
-        """Arduino 워커 스레드 중지"""
-        if self.arduino_worker is not None:
-            self.arduino_worker.stop()
-            self.arduino_worker.join()
+            return None
+
+    def _on_arduino_opened(self, future):
+        """Arduino 연결 결과 처리 (GUI 스레드): 성공 시 워커 시작, 버튼 활성화"""
+        worker = self.arduino_worker
+        if worker is None:
+            return  # 연결 도중 해제/종료됨 (포트 정리는 뒤이은 arduino 작업이 처리)
+        if future.cancelled() or future.exception() is not None or not future.result():
             self.arduino_worker = None
             self.arduino_connected = False
-            logging.info("Arduino worker stopped")
+            logging.error(f"Failed to connect Arduino on {worker.port}")
+            if not self.closing:
+                QtWidgets.QMessageBox.critical(self, "Arduino Connect Error", f"Failed to connect to Arduino on {worker.port}")
+            return
+        
+        self.attach_status("arduino", worker.notifier)
+        worker.start()
+        self.arduino_connected = True
+        logging.info(f"Arduino worker started on {worker.port}")
+        
+        self.pushButton_arduino_connect.setText("SERIAL DISCONNECT")
+        self.label_arduino_status.setText("ON")
+        self.pushButton_motoron.setEnabled(True)
+        # LED 제어 버튼들 활성화
+        if hasattr(self, 'pushButton_ledon'):
+            self.pushButton_ledon.setEnabled(True)
+        if hasattr(self, 'pushButton_ledoff'):
+            self.pushButton_ledoff.setEnabled(True)
+        if hasattr(self, 'pushButton_ledcmd'):
+            self.pushButton_ledcmd.setEnabled(True)
+        logging.info("Arduino connected successfully")
+    
+    def stop_arduino_worker(self, button=None):
+        """Arduino 워커 스레드 중지 (join·시리얼 닫기는 arduino I/O 스레드에서), 완료 Future 반환"""
+        worker, self.arduino_worker = self.arduino_worker, None
+        self.arduino_connected = False
+        if worker is None:
+            return None
+        self.detach_status("arduino")
+        if not worker.is_alive():
+            # 연결 실패 전의 워커: 스레드가 시작되지 않았으므로 포트만 정리
+            return self.run_device_task("arduino", worker.disconnect, on_done=self._on_arduino_closed, button=button)
+        return self.run_device_task("arduino", stop_worker, worker, "Arduino worker", on_done=self._on_arduino_closed,
+                                    button=button, pending_text="DISCONNECTING…")
+
+    def _on_arduino_closed(self, future):
+        # 버튼의 원래 텍스트가 복원된 뒤 호출되므로 연결 표시는 여기서 갱신
+        self.pushButton_arduino_connect.setText("SERIAL CONNECT")
+        self.label_arduino_status.setText("NO")
+        if not future.cancelled() and future.exception() is not None:
+            logging.error(f"Error disconnecting Arduino: {future.exception()}")
+        else:
+            logging.info("Arduino disconnected")
 
     def start_dynamixel_worker(self):
         """Dynamixel 워커 스레드 시작"""
         if self.dynamixel_worker is None and self.dynamixel_driver is not None:
-            # config에서 모터 ID 가져오기
-            motor_id = self.config.get("dynamixel", {}).get("motor_id", 1)
-            
-            self.dynamixel_worker = DynamixelWorker(self.dynamixel_driver, motor_id, update_rate=20.0)
+            # 스캔된 모든 모터를 하나의 워커가 동기 읽기/쓰기로 관리
+            self.dynamixel_worker = create_dynamixel_worker(self.dynamixel_driver, self.config.get("dynamixel", {}))
+            self.attach_status("dynamixel", self.dynamixel_worker.notifier)
             self.dynamixel_worker.start()
-            logging.info(f"Dynamixel worker started for motor {motor_id}")
             return True
         else:
             if self.dynamixel_worker is not None:
@@ -271,12 +388,106 @@ class MainWindow(QtWidgets.QMainWindow):
             return False
     
     def stop_dynamixel_worker(self):
-        """Dynamixel 워커 스레드 중지"""
-        if self.dynamixel_worker is not None:
-            self.dynamixel_worker.stop()
-            self.dynamixel_worker.join()
-            self.dynamixel_worker = None
-            logging.info("Dynamixel worker stopped")
+        """Dynamixel 워커 스레드 중지 (join은 ring I/O 스레드에서), 완료 Future 반환"""
+        worker, self.dynamixel_worker = self.dynamixel_worker, None
+        if worker is None:
+            return None
+        self.detach_status("dynamixel")
+        return self.run_device_task("ring", stop_worker, worker, "Dynamixel worker")
+
+    # ─────────────────────────────────────────────────────────
+    # 장치 I/O 작업 실행 (버튼 대기 표시 → 완료 시 GUI 스레드 콜백)
+    def run_device_task(self, lane, fn, *args, on_done=None, button=None, pending_text=None):
+        """
+        블로킹 장치 I/O를 장치별 I/O 스레드에서 실행
+
+        Args:
+            lane: "servo", "arduino", "ring" (같은 lane의 작업은 제출 순서대로 하나씩 실행)
+            on_done: 완료 시 GUI 스레드에서 호출할 on_done(future), 없으면 실패만 로그
+            button: 완료까지 비활성화할 버튼 (pending_text가 있으면 그동안 텍스트도 교체)
+        """
+        if button is not None:
+            self.set_button_pending(button, pending_text)
+        future = self.device_tasks.submit(lane, fn, *args)
+        self.tasks_in_flight += 1
+
+        def finished(f):
+            try:
+                if button is not None:
+                    self.clear_button_pending(button)
+                if on_done is not None:
+                    on_done(f)
+                elif not f.cancelled() and f.exception() is not None:
+                    logging.error(f"{lane} task {getattr(fn, '__name__', fn)} failed: {f.exception()}")
+            finally:
+                self.tasks_in_flight -= 1
+                if self.closing and self.tasks_in_flight == 0:
+                    self.finish_shutdown()
+
+        self.task_bridge.watch(future, finished)
+        return future
+
+    def set_button_pending(self, button, pending_text=None):
+        if button not in self.pending_buttons:
+            self.pending_buttons[button] = button.text()
+        if pending_text:
+            button.setText(pending_text)
+        self.view.set_enabled(button, False)
+
+    def clear_button_pending(self, button):
+        text = self.pending_buttons.pop(button, None)
+        if text is not None:
+            button.setText(text)
+        self.view.set_enabled(button, True)
+
+    def attach_status(self, name: str, notifier: StatusNotifier):
+        """워커 notifier 구독 (새 샘플이 있을 때만 시그널, 텔레메트리는 모든 샘플 기록)"""
+        self.detach_status(name)
+        bridge = StatusSignalBridge(name, notifier, self)
+        bridge.status_ready.connect(self.on_status_ready)
+        self.status_bridges[name] = bridge
+        recorder = self.telemetry_recorders.get(name)
+        if recorder is not None:
+            notifier.subscribe_samples(recorder)
+
+    def detach_status(self, name: str):
+        bridge = self.status_bridges.pop(name, None)
+        if bridge is not None:
+            recorder = self.telemetry_recorders.get(name)
+            if recorder is not None:
+                bridge.notifier.unsubscribe_samples(recorder)
+                recorder(None)  # 연결 해제 구간은 그래프에서 끊어 표시
+            bridge.close()
+            bridge.deleteLater()
+        self.status_dirty.discard(name)
+
+    def on_status_ready(self, name: str):
+        """새 샘플 알림: 장치를 dirty로 표시하고 다음 프레임에 한 번만 repaint"""
+        self.status_dirty.add(name)
+        if not self.repaint_timer.isActive():
+            wait_ms = FRAME_MS - (time.perf_counter() - self.last_repaint) * 1000.0
+            self.repaint_timer.start(max(0, int(wait_ms)))
+
+    def repaint_status(self):
+        """dirty 장치의 최신 스냅샷만 화면에 반영"""
+        self.last_repaint = time.perf_counter()
+        token = self.frame_timer.start()
+        dirty, self.status_dirty = self.status_dirty, set()
+        displays = {
+            "motor": self.update_motor_status_display,
+            "arduino": self.update_arduino_status_display,
+            "dynamixel": self.update_dynamixel_status_display,
+        }
+        for name in dirty:
+            bridge = self.status_bridges.get(name)
+            snapshot = bridge.notifier.take() if bridge is not None else None
+            if snapshot is None:
+                continue
+            try:
+                displays[name](snapshot)
+            except Exception as e:
+                logging.error(f"{name} status update error: {e}")
+        self.frame_timer.stop(token)
 
     def setup_arduino_ui(self):
         """Arduino UI 요소 설정"""
@@ -292,15 +503,15 @@ class MainWindow(QtWidgets.QMainWindow):
             if hasattr(self, label_name):
                 label = getattr(self, label_name)
                 self.led_labels.append(label)
-                label.setText("OFF")
+                self.view.set_text(label, "OFF")
                 # label.setStyleSheet("background-color: gray; color: white; padding: 2px;")
         
         # 스위치 라벨 초기화
         if hasattr(self, 'label_sw1'):
-            self.label_sw1.setText("OFF")
+            self.view.set_text(self.label_sw1, "OFF")
             # self.label_sw1.setStyleSheet("background-color: gray; color: white; padding: 2px;")
         if hasattr(self, 'label_sw2'):
-            self.label_sw2.setText("OFF")
+            self.view.set_text(self.label_sw2, "OFF")
             # self.label_sw2.setStyleSheet("background-color: gray; color: white; padding: 2px;")
 
     def setup_dynamixel_ui(self):
@@ -308,106 +519,260 @@ class MainWindow(QtWidgets.QMainWindow):
         # Ring position 버튼들 연결
         if hasattr(self, 'pushButton_ringp1'):
             self.pushButton_ringp1.clicked.connect(self.on_ringp1_clicked)
-            self.pushButton_ringp1.setEnabled(False)  # 초기 비활성화
+            self.view.set_enabled(self.pushButton_ringp1, False)  # 초기 비활성화
         
         if hasattr(self, 'pushButton_ringp2'):
             self.pushButton_ringp2.clicked.connect(self.on_ringp2_clicked)
-            self.pushButton_ringp2.setEnabled(False)  # 초기 비활성화
+            self.view.set_enabled(self.pushButton_ringp2, False)  # 초기 비활성화
         
         if hasattr(self, 'pushButton_ringpos_save'):
             self.pushButton_ringpos_save.clicked.connect(self.on_ringpos_save_clicked)
 
+    def setup_diagnostics_ui(self):
+        """진단 패널 (시리얼 링크 통계) - .ui 수정 없이 도크 위젯으로 추가"""
+        self.diag_tick = 0
+        self.label_diag = QtWidgets.QLabel("Serial link: not connected")
+        self.label_diag.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.label_diag.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.label_diag.setTextInteractionFlags(Qt.TextSelectableByMouse)
+
+        self.dock_diag = QtWidgets.QDockWidget("Diagnostics", self)
+        self.dock_diag.setObjectName("dock_diag")
+        self.dock_diag.setWidget(self.label_diag)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.dock_diag)
+
+    def setup_telemetry_ui(self):
+        """실시간 텔레메트리 그래프 (채널별 고정 크기 링 버퍼, 화면 폭으로 min/max 축소)"""
+        self.telemetry = {
+            "servo_position": TelemetryChannel("Servo position", "deg"),
+            "servo_velocity": TelemetryChannel("Servo velocity", "deg/s"),
+            "servo_torque": TelemetryChannel("Servo torque"),
+            "ring_angle": TelemetryChannel("Ring angle", "deg"),
+            "ring_current": TelemetryChannel("Ring current"),
+        }
+        # 워커 스레드에서 호출되는 샘플 기록기 (snapshot이 None이면 연결 끊김)
+        self.telemetry_recorders = {
+            "motor": self.record_motor_sample,
+            "dynamixel": self.record_dynamixel_sample,
+        }
+        self.plot_telemetry = TelemetryPlot(self.telemetry.values(), span=30.0)
+        self.plot_telemetry.setToolTip("Double-click to change the time span")
+
+        self.dock_telemetry = QtWidgets.QDockWidget("Telemetry", self)
+        self.dock_telemetry.setObjectName("dock_telemetry")
+        self.dock_telemetry.setWidget(self.plot_telemetry)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.dock_telemetry)
+
+    def record_motor_sample(self, st):
+        t = time.monotonic()
+        ok = bool(st)
+        self.telemetry["servo_position"].append(t, st['qdeg'] if ok else None)
+        self.telemetry["servo_velocity"].append(t, math.degrees(st['vel']) if ok else None)
+        self.telemetry["servo_torque"].append(t, st['torque'] if ok else None)
+
+    def record_dynamixel_sample(self, status):
+        t = time.monotonic()
+        ok = bool(status) and status.get('connected', False)
+        self.telemetry["ring_angle"].append(t, status['angle'] if ok else None)
+        self.telemetry["ring_current"].append(t, status['current'] if ok else None)
+
+    def update_diagnostics_display(self):
+        """진단 패널 갱신"""
+        lines = []
+        if self.arduino_worker is None:
+            lines.append("Serial link: not connected")
+        else:
+            status = self.arduino_worker.get_status()
+            link = status['link']
+            lines += [
+                f"Serial link {self.arduino_worker.port}: {'UP' if status['connected'] else 'DOWN'}  "
+                f"protocol v{status['protocol']} ({status['channels']} ch)",
+                f"  frames/s {link['frames_per_sec']:6.1f}   ok {link['frames_ok']}   "
+                f"bytes/frame tx {link['bytes_tx'] / max(1, link['frames_ok']):.1f} "
+                f"rx {link['bytes_rx'] / max(1, link['frames_ok']):.1f}",
+                f"  RTT ms   last {link['rtt_last_ms']:.1f}  avg {link['rtt_avg_ms']:.1f}  max {link['rtt_max_ms']:.1f}",
+                f"  RTT hist {format_rtt_hist(link['rtt_hist'])}",
+                f"  timeouts {link['timeouts']}  short {link['short_reads']}  length {link['length_errors']}  "
+                f"crc {link['crc_errors']}  resync {link['resyncs']}",
+                f"  reconnects {link['reconnects']}  disconnected {link['disconnected_time']:.1f}s  "
+                f"last recovery {status['last_recovery_time']:.2f}s  retrying #{status['reconnect_attempts']}",
+            ]
+
+        if self.dynamixel_worker is not None:
+            dxl_status = self.dynamixel_worker.get_status()
+            shadow = dxl_status.get('shadow') or {}
+            tx_only = dxl_status.get('tx_only') or {}
+            if shadow:
+                lines.append(
+                    f"Dynamixel writes skipped {shadow['hits']} (EEPROM {shadow['eeprom_hits']}, "
+                    f"torque cycles {shadow['torque_cycles_saved']})  sent {shadow['misses']}  fills {shadow['fills']}"
+                )
+            ages = dxl_status.get('field_ages') or {}
+            if ages:
+                lines.append("Dynamixel field age " + "  ".join(
+                    f"{name} {'-' if age is None else f'{age * 1000:.0f}ms'}" for name, age in ages.items()))
+            if tx_only.get('writes'):
+                lines.append(
+                    f"  unacknowledged writes {tx_only['writes']}  verified {tx_only['verified']}  "
+                    f"mismatches {tx_only['mismatches']}"
+                )
+
+        # 워커 스레드별 로그 enqueue 비용
+        log_stats = self.log_pipeline.get_stats()
+        workers = [name for name in ("MotorWorker", "ArduinoWorker", "DynamixelWorker") if name in log_stats]
+        if workers:
+            lines.append("Log enqueue " + "  ".join(
+                f"{name} {log_stats[name]['records']} rec avg {log_stats[name]['avg_us']:.1f}us "
+                f"max {log_stats[name]['max_us']:.0f}us" for name in workers))
+
+        if hasattr(self, 'log_ring'):
+            lines.append(f"Log ring {len(self.log_ring)}/{self.log_ring.capacity}  "
+                         f"view lines {self.textBrowser.document().blockCount()}/{self.log_view.max_lines}  "
+                         f"dropped {self.log_ring.dropped}")
+        frame = self.frame_timer.get_report()
+        widgets = self.view.stats()
+        lines.append(
+            f"GUI frames/s {frame['frames_per_sec']:5.1f}  avg {frame['avg_ms']:.2f} ms  max {frame['max_ms']:.2f} ms  "
+            f"cpu {frame['cpu_pct']:.1f}%  widgets set {widgets['applied']} skipped {widgets['skipped']}"
+            f"{'' if self.view.enabled else ' (diff render off)'}"
+        )
+        self.label_diag.setText("\n".join(lines))
+
     def setup_logging(self):
-        """로깅 시스템 설정"""
-        # QTextBrowser가 있는지 확인하고 로깅 핸들러 설정
+        """
+        로깅 시스템 설정: 루트 로거는 큐에 넣기만 하고, 리스너 스레드가 포맷 후
+        GUI 로그 링 / 회전 로그 파일 / 콘솔로 분배 (config "logging": file, max_bytes, backups, console)
+        """
+        log_config = self.config.get("logging", {})
+        handlers = []
+
+        # 유한 링 버퍼 핸들러 (레코드마다 Qt 시그널을 보내지 않음)
         if hasattr(self, 'textBrowser'):
-            # 기존 핸들러 제거
-            logger = logging.getLogger()
-            for handler in logger.handlers[:]:
-                logger.removeHandler(handler)
-            
-            # QTextBrowser 핸들러 추가
-            text_handler = QTextBrowserHandler(self.textBrowser)
-            text_handler.setFormatter(logging.Formatter(
-                '%(asctime)s - %(levelname)s - %(message)s',
-                datefmt='%H:%M:%S'
-            ))
-            logger.addHandler(text_handler)
-            logger.setLevel(logging.INFO)
-            
+            gui_config = self.config.get("gui", {})
+            self.log_ring = LogRing(gui_config.get("log_capacity", LOG_CAPACITY))
+            ring_handler = LogRingHandler(self.log_ring)
+            ring_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+            handlers.append(ring_handler)
+
+        handlers += config_handlers(log_config, app_dir())
+
+        self.log_pipeline = LoggingPipeline(handlers, logging.INFO)
+
+        if hasattr(self, 'textBrowser'):
+            self.log_view = LogView(self.textBrowser, self.log_ring, gui_config.get("log_lines", LOG_MAX_LINES), self)
+            self.setup_log_filter_ui()
             logging.info("Logging system initialized with QTextBrowser")
         else:
             logging.warning("textBrowser not found, using console logging")
 
-    def connect_dynamixel(self):
-        """Dynamixel 연결"""
-        try:
-            # config에서 포트와 통신속도 가져오기
-            ports = self.config.get("ports", {})
-            baudrates = self.config.get("baudrates", {})
-            
-            port = ports.get("dynamixel")
-            baudrate = baudrates.get("dynamixel")
-            
-            if not port or not baudrate:
-                raise ValueError("Dynamixel port or baudrate not configured in config.json")
-            
-            self.dynamixel_driver = DynamixelDriver(device_name=port, baudrate=baudrate)
-            self.dynamixel_driver.connect()
-            
-            # 모터 스캔
-            found_motors = self.dynamixel_driver.scan_motors()
-            if found_motors:
-                # 토크 활성화
-                for motor in found_motors:
-                    self.dynamixel_driver.enable_torque(motor['id'])
-                
-                self.dynamixel_connected = True
-                logging.info(f"Dynamixel connected on {port} at {baudrate} baud: {len(found_motors)} motors found")
-                
-                # Dynamixel 워커 시작
-                self.start_dynamixel_worker()
-                
-                # Ring position 버튼들 활성화
-                if hasattr(self, 'pushButton_ringp1'):
-                    self.pushButton_ringp1.setEnabled(True)
-                if hasattr(self, 'pushButton_ringp2'):
-                    self.pushButton_ringp2.setEnabled(True)
-                
-                return True
-            else:
-                logging.error("No Dynamixel motors found")
-                return False
-                
-        except Exception as e:
-            logging.error(f"Dynamixel connection failed: {e}")
+    def setup_log_filter_ui(self):
+        """로그 레벨/장치 필터 콤보박스 - .ui 수정 없이 로그 창 위쪽에 배치"""
+        geometry = self.textBrowser.geometry()
+        parent = self.textBrowser.parentWidget()
+        self.textBrowser.setGeometry(geometry.x(), geometry.y() + 24, geometry.width(), geometry.height() - 24)
+
+        self.comboBox_log_level = QtWidgets.QComboBox(parent)
+        for name, level in LOG_LEVELS:
+            self.comboBox_log_level.addItem(name, level)
+        self.comboBox_log_level.setGeometry(geometry.x(), geometry.y(), 100, 22)
+
+        self.comboBox_log_device = QtWidgets.QComboBox(parent)
+        self.comboBox_log_device.addItem("all devices", None)
+        for device in DEVICES:
+            self.comboBox_log_device.addItem(device, device)
+        self.comboBox_log_device.setGeometry(geometry.x() + 104, geometry.y(), 110, 22)
+
+        self.comboBox_log_level.currentIndexChanged.connect(self.on_log_filter_changed)
+        self.comboBox_log_device.currentIndexChanged.connect(self.on_log_filter_changed)
+
+    def on_log_filter_changed(self, _index):
+        self.log_view.set_filter(self.comboBox_log_level.currentData(), self.comboBox_log_device.currentData())
+
+    def connect_dynamixel(self, then=None):
+        """Dynamixel 연결 (포트 열기·스캔·토크 활성화는 ring I/O 스레드), 성공 시 GUI 스레드에서 then() 호출"""
+        # config에서 포트와 통신속도 가져오기
+        ports = self.config.get("ports", {})
+        baudrates = self.config.get("baudrates", {})
+        
+        port = ports.get("dynamixel")
+        baudrate = baudrates.get("dynamixel")
+        
+        if not port or not baudrate:
+            logging.error("Dynamixel connection failed: port or baudrate not configured in config.json")
+            QtWidgets.QMessageBox.critical(self, "Dynamixel Error", "Dynamixel port or baudrate not configured in config.json")
+            return None
+        if self.dynamixel_connecting:
+            return None
+        
+        self.dynamixel_connecting = True
+        dxl_config = dict(self.config.get("dynamixel", {}))  # I/O 스레드에는 복사본 전달
+        return self.run_device_task("ring", open_dynamixel, port, baudrate, dxl_config,
+                                    on_done=lambda f: self._on_dynamixel_opened(f, port, baudrate, then),
+                                    button=getattr(self, 'pushButton_ringc', None), pending_text="CONNECTING…")
+
+    def _on_dynamixel_opened(self, future, port, baudrate, then):
+        """Dynamixel 연결 결과 처리 (GUI 스레드): 버스 맵 저장, 워커 시작, 버튼 활성화"""
+        self.dynamixel_connecting = False
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logging.error(f"Dynamixel connection failed: {future.exception()}")
             self.dynamixel_driver = None
-            return False
+            if not self.closing:
+                QtWidgets.QMessageBox.critical(self, "Dynamixel Error", "Failed to connect to Dynamixel motors")
+            return
+        
+        driver, found_motors, bus_map = future.result()
+        if self.closing:
+            # 연결 도중 종료 요청: 워커를 시작하지 않고 바로 해제
+            self.run_device_task("ring", close_dynamixel, driver)
+            return
+        if bus_map is not None:
+            self.config.setdefault("dynamixel", {})["bus_map"] = bus_map
+            save_config(self.config)
+        
+        self.dynamixel_driver = driver
+        self.dynamixel_connected = True
+        logging.info(f"Dynamixel connected on {port} at {baudrate} baud: {len(found_motors)} motors found")
+        
+        # Dynamixel 워커 시작
+        self.start_dynamixel_worker()
+        
+        # Ring position 버튼들 활성화
+        if hasattr(self, 'pushButton_ringp1'):
+            self.view.set_enabled(self.pushButton_ringp1, True)
+        if hasattr(self, 'pushButton_ringp2'):
+            self.view.set_enabled(self.pushButton_ringp2, True)
+        if hasattr(self, 'pushButton_ringc'):
+            self.pushButton_ringc.setText("RING DISCON")
+        
+        if then is not None:
+            then()
 
     def disconnect_dynamixel(self):
-        """Dynamixel 연결 해제"""
+        """Dynamixel 연결 해제 (워커 join, 토크 해제, 포트 닫기는 ring I/O 스레드에서 순서대로)"""
         # Dynamixel 워커 중지
         self.stop_dynamixel_worker()
         
-        if self.dynamixel_driver is not None:
-            try:
-                # 모든 모터의 토크 비활성화
-                for motor_id in self.dynamixel_driver.connected_motors.keys():
-                    self.dynamixel_driver.disable_torque(motor_id)
-                
-                self.dynamixel_driver.disconnect()
-                self.dynamixel_driver = None
-                self.dynamixel_connected = False
-                
-                # Ring position 버튼들 비활성화
-                if hasattr(self, 'pushButton_ringp1'):
-                    self.pushButton_ringp1.setEnabled(False)
-                if hasattr(self, 'pushButton_ringp2'):
-                    self.pushButton_ringp2.setEnabled(False)
-                
-                logging.info("Dynamixel disconnected")
-            except Exception as e:
-                logging.error(f"Error disconnecting Dynamixel: {e}")
+        driver, self.dynamixel_driver = self.dynamixel_driver, None
+        self.dynamixel_connected = False
+        
+        # Ring position 버튼들 비활성화
+        if hasattr(self, 'pushButton_ringp1'):
+            self.view.set_enabled(self.pushButton_ringp1, False)
+        if hasattr(self, 'pushButton_ringp2'):
+            self.view.set_enabled(self.pushButton_ringp2, False)
+        
+        if driver is None:
+            return None
+        return self.run_device_task("ring", close_dynamixel, driver, on_done=self._on_dynamixel_closed,
+                                    button=getattr(self, 'pushButton_ringc', None), pending_text="DISCONNECTING…")
+
+    def _on_dynamixel_closed(self, future):
+        if hasattr(self, 'pushButton_ringc'):
+            self.pushButton_ringc.setText("RING CON")
+        if not future.cancelled() and future.exception() is not None:
+            logging.error(f"Error disconnecting Dynamixel: {future.exception()}")
 
     def on_motoron_clicked(self):
         """Motor On/Off 버튼 핸들러"""
@@ -427,6 +792,33 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             logging.warning("Arduino worker not available")
 
+    def update_motor_status_display(self, st):
+        """모터 상태를 GUI에 업데이트"""
+        if not st:
+            return
+        # stat_word = self.drv.rd16(0x6002)
+        self.view.set_text(self.label_q, f"{st['qdeg']:+7.3f}")
+        self.view.set_text(self.label_qdot, f"{math.degrees(st['vel']):+7.3f}")
+        self.view.set_text(self.label_torque, str(st['torque']))
+        self.view.set_text(self.label_rdy, "●" if st['ready'] else "")
+        self.view.set_text(self.label_run, "●" if st['run'] else "")
+        self.view.set_text(self.label_err, "●" if st['error'] else "")
+        self.view.set_text(self.label_hom, "●" if st['homing'] else "")
+        self.view.set_text(self.label_cnt, f"{st['q']:+10d}") # cnt 단위
+
+        # 명령 처리 중(대기 표시)인 버튼은 완료 콜백이 다시 활성화
+        pending = self.pending_buttons
+        self.view.set_enabled(self.pushButton_homing, self.pushButton_homing not in pending)  # 홈 버튼은 연결 후 활성화
+        self.view.set_enabled(self.pushButton_estop, self.pushButton_estop not in pending)    # E-STOP 버튼은 연결 후 활성화
+
+        if st['homing']: # 호밍 완료 상태
+            self.view.set_enabled(self.pushButton_runloop, True) 
+            self.view.set_enabled(self.pushButton_gozero, self.pushButton_gozero not in pending)
+            self.view.set_enabled(self.pushButton_m0, self.pushButton_m0 not in pending)
+            self.view.set_enabled(self.pushButton_m1, self.pushButton_m1 not in pending)
+            self.view.set_enabled(self.pushButton_m2, self.pushButton_m2 not in pending)
+            self.view.set_enabled(self.pushButton_m3, self.pushButton_m3 not in pending)
+
     def update_arduino_status_display(self, status):
         """Arduino 상태를 GUI에 업데이트"""
 
@@ -439,7 +831,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 #     label.setText(f"{brightness}")
                 #     # label.setStyleSheet("background-color: green; color: white; padding: 2px;")
                 # else:
-                label.setText(f"{brightness}")
+                self.view.set_text(label, f"{brightness}")
                     # label.setStyleSheet("background-color: gray; color: white; padding: 2px;")
         
         # 스위치 상태 업데이트
@@ -448,7 +840,7 @@ class MainWindow(QtWidgets.QMainWindow):
             
             if hasattr(self, 'label_sw1'):
                 sw1_state = bool(switch_states & 0x80)  # 7
-                self.label_sw1.setText("ON" if sw1_state else "OFF")
+                self.view.set_text(self.label_sw1, "ON" if sw1_state else "OFF")
 
                 if hasattr(self, 'prev_sw1_state'):
                     if sw1_state and self.prev_sw1_state is not sw1_state:
@@ -463,7 +855,7 @@ class MainWindow(QtWidgets.QMainWindow):
             
             if hasattr(self, 'label_sw2'):
                 sw2_state = bool(switch_states & 0xF0)  # 7
-                self.label_sw2.setText("ON" if sw2_state else "OFF")
+                self.view.set_text(self.label_sw2, "ON" if sw2_state else "OFF")
                 # self.label_sw2.setStyleSheet(
                 #     "background-color: blue; color: white; padding: 2px;" if sw2_state
                 #     else "background-color: gray; color: white; padding: 2px;"
@@ -474,87 +866,121 @@ class MainWindow(QtWidgets.QMainWindow):
         # Ring 연결 상태 표시
         if hasattr(self, 'label_ring_status'):
             if status.get('connected', False):
-                self.label_ring_status.setText("ON")
+                self.view.set_text(self.label_ring_status, "ON")
             else:
-                self.label_ring_status.setText("NO")
+                self.view.set_text(self.label_ring_status, "NO")
         
         # 현재 각도 표시
         if hasattr(self, 'label_ring_angle'):
             angle = status.get('angle', 0.0)
-            self.label_ring_angle.setText(f"{angle:+7.1f}°")
+            self.view.set_text(self.label_ring_angle, f"{angle:+7.1f}°")
         
         # 이동 상태 표시
         if hasattr(self, 'label_ring_moving'):
             moving = status.get('moving', False)
-            self.label_ring_moving.setText("●" if moving else "")
+            self.view.set_text(self.label_ring_moving, "●" if moving else "")
         
         # 온도 표시
         if hasattr(self, 'label_ring_temp'):
             temperature = status.get('temperature', 0)
-            self.label_ring_temp.setText(f"{temperature}°C")
+            self.view.set_text(self.label_ring_temp, f"{temperature}°C")
         
         # 전압 표시
         if hasattr(self, 'label_ring_voltage'):
             voltage = status.get('voltage', 0.0)
-            self.label_ring_voltage.setText(f"{voltage:.1f}V")
+            self.view.set_text(self.label_ring_voltage, f"{voltage:.1f}V")
         
         # Revolution 표시 (position / 4096)
         if hasattr(self, 'label_ring_position'):
             position = status.get('position', 0)
             revolution = position / 4096.0
-            self.label_ring_position.setText(f"{revolution:+7.3f}")
+            self.view.set_text(self.label_ring_position, f"{revolution:+7.3f}")
 
     
     # ─────────────────────────────────────────────────────────
     # 버튼 핸들러
     def on_connect_clicked(self):
         if not self.connected:
-            try:
-                # config에서 포트와 통신속도 가져오기
-                ports = self.config.get("ports", {})
-                baudrates = self.config.get("baudrates", {})
-                
-                motor_port = ports.get("motor_driver")
-                motor_baudrate = baudrates.get("motor_driver")
-                
-                if not motor_port or not motor_baudrate:
-                    raise ValueError("Motor driver port or baudrate not configured in config.json")
-                
-                self.drv = Driver(port=motor_port, baudrate=motor_baudrate)
-                self.drv.connect()
-                self.drv.zoffset = self.saved_offset  # 저장된 오프셋 적용
-                self.connected = True
-                self.t0 = time.perf_counter()
-                self.label_connect.setText("ON")
-                logging.info(f"Driver connected on {motor_port} at {motor_baudrate} baud")
-                self.pushButton_connect.setText("DISCONNECT")
-                self.start_motor_worker()
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(self, "Connect Error", str(e))
+            # config에서 포트와 통신속도 가져오기
+            ports = self.config.get("ports", {})
+            baudrates = self.config.get("baudrates", {})
+            
+            motor_port = ports.get("motor_driver")
+            motor_baudrate = baudrates.get("motor_driver")
+            
+            if not motor_port or not motor_baudrate:
+                QtWidgets.QMessageBox.critical(self, "Connect Error",
+                                               "Motor driver port or baudrate not configured in config.json")
+                return
+            
+            self.run_device_task("servo", open_motor_driver, motor_port, motor_baudrate,
+                                 on_done=self._on_motor_driver_opened,
+                                 button=self.pushButton_connect, pending_text="CONNECTING…")
         else:
             # 이미 연결됨 → 해제
-            self.stop_motor_worker()
-
-            self.drv.client.close()
-            self.connected = False
-            self.label_connect.setText("NO")
-            logging.info("Driver disconnected")
-            self.pushButton_connect.setText("CONNECT")
-
-            self.pushButton_runloop.setEnabled(False)  # 루프 버튼 비활성화
-            self.pushButton_gozero.setEnabled(False)
-            self.pushButton_m0.setEnabled(False)       # M0 버튼 비활성화
-            self.pushButton_m1.setEnabled(False)       # M1 버튼 비활성화
-            self.pushButton_m2.setEnabled(False)       # M2 버튼 비활성화
-            self.pushButton_m3.setEnabled(False)       # M3 버튼 비활성화
-            self.pushButton_homing.setEnabled(False)  # 홈 버튼 비활성화
-            self.pushButton_estop.setEnabled(False)    # E-STOP 버튼 비활성화
+            self.disconnect_motor_driver()
 
+    def _on_motor_driver_opened(self, future):
+        """서보 드라이버 연결 결과 처리 (GUI 스레드): 오프셋 적용, 워커 시작"""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            if not self.closing:
+                QtWidgets.QMessageBox.critical(self, "Connect Error", str(future.exception()))
+            return
+        drv = future.result()
+        if self.closing:
+            self.run_device_task("servo", drv.client.close)
+            return
         
+        self.drv = drv
+        self.drv.zoffset = self.saved_offset  # 저장된 오프셋 적용
+        self.connected = True
+        self.t0 = time.perf_counter()
+        self.label_connect.setText("ON")
+        self.pushButton_connect.setText("DISCONNECT")
+        self.start_motor_worker()
+
+    def disconnect_motor_driver(self):
+        """서보 드라이버 연결 해제 (워커 join, 포트 닫기는 servo I/O 스레드에서 순서대로)"""
+        self.connected = False  # 이후 버튼 명령은 무시
+        self.stop_motor_worker()
+        return self.run_device_task("servo", self.drv.client.close, on_done=self._on_motor_driver_closed,
+                                    button=self.pushButton_connect, pending_text="DISCONNECTING…")
+
+    def _on_motor_driver_closed(self, future):
+        # 같은 lane의 앞선 명령 완료 콜백이 모두 끝난 뒤 호출되므로 여기서 버튼을 비활성화
+        self.label_connect.setText("NO")
+        logging.info("Driver disconnected")
+        self.pushButton_connect.setText("CONNECT")
+
+        self.view.set_enabled(self.pushButton_runloop, False)  # 루프 버튼 비활성화
+        self.view.set_enabled(self.pushButton_gozero, False)
+        self.view.set_enabled(self.pushButton_m0, False)       # M0 버튼 비활성화
+        self.view.set_enabled(self.pushButton_m1, False)       # M1 버튼 비활성화
+        self.view.set_enabled(self.pushButton_m2, False)       # M2 버튼 비활성화
+        self.view.set_enabled(self.pushButton_m3, False)       # M3 버튼 비활성화
+        self.view.set_enabled(self.pushButton_homing, False)  # 홈 버튼 비활성화
+        self.view.set_enabled(self.pushButton_estop, False)    # E-STOP 버튼 비활성화
+        if not future.cancelled() and future.exception() is not None:
+            logging.error(f"Error closing motor driver: {future.exception()}")
+
+    def run_motor_command(self, button, command, *args, lane="servo"):
+        """서보 명령(홈/이동/정지)을 I/O 스레드에서 워커 lock을 잡고 실행, 완료까지 버튼 대기 표시"""
+        if not self.connected or self.motor_worker is None:
+            return None
+        return self.run_device_task(lane, self._locked_motor_command, self.motor_worker.lock, command, *args,
+                                    button=button)
+
+    @staticmethod
+    def _locked_motor_command(lock, command, *args):
+        """[I/O 스레드] 워커 폴링과 Modbus 접근이 겹치지 않도록 lock 안에서 실행"""
+        with lock:
+            command(*args)
+
     def on_homing_clicked(self):
         if self.connected:
-            with self.motor_worker.lock:
-                self.drv.homing()
+            self.run_motor_command(self.pushButton_homing, self.drv.homing)
 
     def on_runloop_clicked(self):
         if not self.connected:
@@ -574,40 +1000,36 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def on_estop_clicked(self):
         if self.connected:
-            with self.motor_worker.lock:
-                self.drv.estop()
+            # 대기 중인 조그/홈 명령은 취소하고, 별도 lane에서 바로 정지 (진행 중인 명령 하나만 기다림)
+            self.device_tasks.cancel_pending("servo")
+            self.run_motor_command(self.pushButton_estop, self.drv.estop, lane="servo-estop")
             
             self.motor_worker.looping = False  # M2 버튼 클릭 시 루프 중지
 
     def on_gozero_clicked(self):
         if self.connected:
-            with self.motor_worker.lock:
-                self.drv.move(0.0, VEL_DEF, ACC_DEF, 0)
+            self.run_motor_command(self.pushButton_gozero, self.drv.move, 0.0, VEL_DEF, ACC_DEF, 0)
             self.motor_worker.looping = False  # M2 버튼 클릭 시 루프 중지
 
     def on_m0_clicked(self):
         if self.connected:
-            with self.motor_worker.lock:
-                self.drv.move(self.drv.qdeg - 0.1, VEL_DEF, ACC_DEF, 0)
+            self.run_motor_command(self.pushButton_m0, self.drv.move, self.drv.qdeg - 0.1, VEL_DEF, ACC_DEF, 0)
             self.motor_worker.looping = False  # M2 버튼 클릭 시 루프 중지
     
     def on_m1_clicked(self):
         if self.connected:
-            with self.motor_worker.lock:
-                self.drv.move(self.drv.qdeg - 0.05, VEL_DEF, ACC_DEF, 0)
+            self.run_motor_command(self.pushButton_m1, self.drv.move, self.drv.qdeg - 0.05, VEL_DEF, ACC_DEF, 0)
             self.motor_worker.looping = False  # M2 버튼 클릭 시 루프 중지
             
 
     def on_m2_clicked(self):
         if self.connected:
-            with self.motor_worker.lock:
-                self.drv.move(self.drv.qdeg + 0.05, VEL_DEF, ACC_DEF, 0)
+            self.run_motor_command(self.pushButton_m2, self.drv.move, self.drv.qdeg + 0.05, VEL_DEF, ACC_DEF, 0)
             self.motor_worker.looping = False  # M2 버튼 클릭 시 루프 중지
 
     def on_m3_clicked(self):
         if self.connected:
-            with self.motor_worker.lock:
-                self.drv.move(self.drv.qdeg + 0.1, VEL_DEF, ACC_DEF, 0)
+            self.run_motor_command(self.pushButton_m3, self.drv.move, self.drv.qdeg + 0.1, VEL_DEF, ACC_DEF, 0)
             self.motor_worker.looping = False  # M2 버튼 클릭 시 루프 중지
 
 
@@ -626,40 +1048,26 @@ class MainWindow(QtWidgets.QMainWindow):
         try:
             # config에 zoffset 업데이트
             self.config["zoffset"] = int(self.drv.zoffset)
-            self.save_config(self.config)
+            save_config(self.config)
             
             # 기존 offset.json도 호환성을 위해 유지 (선택사항)
-            with OFFSET_FILE.open("w") as f:
-                json.dump({"zoffset": int(self.drv.zoffset)}, f)
+            save_offset(self.drv.zoffset)
                 
             logging.info(f"Z Offset saved to config.json: {self.drv.zoffset} cnt")
         except Exception as e:
             logging.error(f"Error saving offset: {e}")
 
     def on_arduino_connect_clicked(self):
-        """Arduino 연결/해제 버튼 핸들러"""
+        """Arduino 연결/해제 버튼 핸들러 (연결 결과는 _on_arduino_opened에서 처리)"""
         if not self.arduino_connected:
             # Arduino 연결 시도
-            if self.start_arduino_worker():
-                self.pushButton_arduino_connect.setText("SERIAL DISCONNECT")
-                self.label_arduino_status.setText("ON")
-                self.pushButton_motoron.setEnabled(True)
-                # LED 제어 버튼들 활성화
-                if hasattr(self, 'pushButton_ledon'):
-                    self.pushButton_ledon.setEnabled(True)
-                if hasattr(self, 'pushButton_ledoff'):
-                    self.pushButton_ledoff.setEnabled(True)
-                if hasattr(self, 'pushButton_ledcmd'):
-                    self.pushButton_ledcmd.setEnabled(True)
-                logging.info("Arduino connected successfully")
-            else:
-                logging.error("Failed to connect Arduino")
-                QtWidgets.QMessageBox.critical(self, "Arduino Connect Error", "Failed to connect to Arduino on COM4")
+            if self.arduino_worker is not None:
+                return  # 연결 진행 중
+            if self.start_arduino_worker(button=self.pushButton_arduino_connect) is None:
+                QtWidgets.QMessageBox.critical(self, "Arduino Connect Error", "Arduino port not configured in config.json")
         else:
             # Arduino 연결 해제
-            self.stop_arduino_worker()
-            self.pushButton_arduino_connect.setText("SERIAL CONNECT")
-            self.label_arduino_status.setText("NO")
+            self.stop_arduino_worker(button=self.pushButton_arduino_connect)
             self.pushButton_motoron.setEnabled(False)
             # LED 제어 버튼들 비활성화
             if hasattr(self, 'pushButton_ledon'):
@@ -672,7 +1080,6 @@ class MainWindow(QtWidgets.QMainWindow):
             if hasattr(self, 'motor_on'):
                 self.motor_on = False
                 self.pushButton_motoron.setText("MOTOR ON")
-            logging.info("Arduino disconnected")
 
     def on_ledon_clicked(self):
         """LED ON 버튼 핸들러 - 모든 LED를 255로 설정"""
@@ -738,10 +1145,9 @@ class MainWindow(QtWidgets.QMainWindow):
     def on_ringp1_clicked(self):
         """Ring Position 1 버튼 핸들러 - DynamixelWorker를 통한 이동"""
         if not self.dynamixel_connected or self.dynamixel_worker is None:
-            # Dynamixel 연결 시도
-            if not self.connect_dynamixel():
-                QtWidgets.QMessageBox.critical(self, "Dynamixel Error", "Failed to connect to Dynamixel motors")
-                return
+            # Dynamixel 연결 시도 (I/O 스레드), 연결되면 이 핸들러를 다시 호출해 이동
+            self.connect_dynamixel(then=self.on_ringp1_clicked)
+            return
         
         try:
             # lineEdit_ringpos1에서 목표 각도 값 가져오기
@@ -753,10 +1159,12 @@ class MainWindow(QtWidgets.QMainWindow):
                 velocity = self.config.get("dynamixel", {}).get("velocity", 100)
                 
                 # Extended Position Control 모드 설정
+                from drivers.dynamixel.dynamixel_driver import EXTENDED_POSITION_CONTROL_MODE  # 연결 시 이미 로드됨
                 self.dynamixel_worker.set_operating_mode(EXTENDED_POSITION_CONTROL_MODE)
                 
-                # 워커를 통해 이동 명령 전송
-                self.dynamixel_worker.move_to_angle(target_angle, velocity)
+                # 워커를 통해 이동 명령 전송 (결과는 Future 콜백으로 확인)
+                future = self.dynamixel_worker.move_to_angle(target_angle, velocity)
+                future.add_done_callback(lambda f: self._log_ring_command_result("Ring Position 1", f))
                 
                 logging.info(f"Ring Position 1 command sent: {target_angle}° at velocity {velocity}")
                 
@@ -772,10 +1180,9 @@ class MainWindow(QtWidgets.QMainWindow):
     def on_ringp2_clicked(self):
         """Ring Position 2 버튼 핸들러 - DynamixelWorker를 통한 이동"""
         if not self.dynamixel_connected or self.dynamixel_worker is None:
-            # Dynamixel 연결 시도
-            if not self.connect_dynamixel():
-                QtWidgets.QMessageBox.critical(self, "Dynamixel Error", "Failed to connect to Dynamixel motors")
-                return
+            # Dynamixel 연결 시도 (I/O 스레드), 연결되면 이 핸들러를 다시 호출해 이동
+            self.connect_dynamixel(then=self.on_ringp2_clicked)
+            return
         
         try:
             # lineEidit_ringpos2에서 목표 각도 값 가져오기
@@ -787,10 +1194,12 @@ class MainWindow(QtWidgets.QMainWindow):
                 velocity = self.config.get("dynamixel", {}).get("velocity", 100)
                 
                 # Extended Position Control 모드 설정
+                from drivers.dynamixel.dynamixel_driver import EXTENDED_POSITION_CONTROL_MODE  # 연결 시 이미 로드됨
                 self.dynamixel_worker.set_operating_mode(EXTENDED_POSITION_CONTROL_MODE)
                 
-                # 워커를 통해 이동 명령 전송
-                self.dynamixel_worker.move_to_angle(target_angle, velocity)
+                # 워커를 통해 이동 명령 전송 (결과는 Future 콜백으로 확인)
+                future = self.dynamixel_worker.move_to_angle(target_angle, velocity)
+                future.add_done_callback(lambda f: self._log_ring_command_result("Ring Position 2", f))
                 
                 logging.info(f"Ring Position 2 command sent: {target_angle}° at velocity {velocity}")
                 
@@ -803,6 +1212,16 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception as e:
             logging.error(f"Error moving Ring Position 2: {e}")
 
+    def _log_ring_command_result(self, name, future):
+        """링 이동 명령 Future 완료 콜백 (워커 스레드에서 호출되므로 로그만 남김)"""
+        if future.cancelled():
+            logging.warning(f"{name} command cancelled")
+        elif future.exception() is not None:
+            logging.error(f"{name} command failed: {future.exception()}")
+        else:
+            target_position, start_position = future.result()
+            logging.info(f"{name} command issued: position {start_position} -> {target_position}")
+
     def on_ringpos_save_clicked(self):
         """Ring Position Save 버튼 핸들러"""
         try:
@@ -827,7 +1246,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.config["ring_positions"]["ring2"] = ring2_angle
             
             # config.json에 저장
-            self.save_config(self.config)
+            save_config(self.config)
             
             logging.info(f"Configuration saved - Z Offset: {current_zoffset}, Ring1: {ring1_angle}°, Ring2: {ring2_angle}°")
             
@@ -838,99 +1257,53 @@ class MainWindow(QtWidgets.QMainWindow):
             logging.error(f"Error saving ring positions: {e}")
 
     def on_ringc_clicked(self):
-        """Ring Connect 버튼 핸들러 - Dynamixel 연결/해제"""
+        """Ring Connect 버튼 핸들러 - Dynamixel 연결/해제 (버튼 텍스트는 완료 콜백에서 갱신)"""
         if not self.dynamixel_connected:
             # Dynamixel 연결 시도
-            if self.connect_dynamixel():
-                self.pushButton_ringc.setText("RING DISCON")
-                logging.info("Dynamixel connected successfully via Ring Connect button")
-                
-                
-            else:
-                QtWidgets.QMessageBox.critical(self, "Dynamixel Error", "Failed to connect to Dynamixel motors")
+            self.connect_dynamixel()
         else:
             # Dynamixel 연결 해제
             self.disconnect_dynamixel()
-            self.pushButton_ringc.setText("RING CON")
-            logging.info("Dynamixel disconnected via Ring Connect button")
+            logging.info("Dynamixel disconnecting via Ring Connect button")
 
 
     # ─────────────────────────────────────────────────────────
-    # 60 Hz 주기 함수
+    # 60 Hz 주기 함수 (장치 상태 표시는 repaint_status가 push 방식으로 처리)
     def on_tick(self):
-        # 1) 연결상태 업데이트
+        # 1) 경과 시간
+        token = self.frame_timer.start()
         if self.connected:
-            try:
-                self.label_time.setText(f"{time.perf_counter() - self.t0:6.2f}")
-
-                with self.motor_worker.lock:
-                    st = self.motor_worker.stat.copy()
-
-                if st:
-                # stat_word = self.drv.rd16(0x6002)
-                    self.label_q.setText(f"{st['qdeg']:+7.3f}")
-                    self.label_qdot.setText(f"{st['vel']*RAD2DEG:+7.3f}")
-                    self.label_torque.setText(str(st['torque']))
-                    self.label_rdy.setText("●" if st['ready'] else "")
-                    self.label_run.setText("●" if st['run'] else "")
-                    self.label_err.setText("●" if st['error'] else "")
-                    self.label_hom.setText("●" if st['homing'] else "")
-                    self.label_cnt.setText(f"{st['q']:+10d}") # cnt 단위
-
-                    self.pushButton_homing.setEnabled(True)  # 홈 버튼은 연결 후 활성화
-                    self.pushButton_estop.setEnabled(True)    # E-STOP 버튼은 연결 후 활성화
-
-                    if st['homing']: # 호밍 완료 상태
-                        self.pushButton_runloop.setEnabled(True) 
-                        self.pushButton_gozero.setEnabled(True)
-                        self.pushButton_m0.setEnabled(True)
-                        self.pushButton_m1.setEnabled(True)
-                        self.pushButton_m2.setEnabled(True)
-                        self.pushButton_m3.setEnabled(True)
-            except Exception as e:
-                logging.error(e)
-        
+            self.view.set_text(self.label_time, f"{time.perf_counter() - self.t0:6.2f}")
         else:
-            self.label_time.setText("--")
-
-        # 2) Arduino 상태 업데이트
-        if self.arduino_worker is not None:
-            try:
-                arduino_status = self.arduino_worker.get_status()
-                # Arduino 상태를 GUI에 업데이트
-                self.update_arduino_status_display(arduino_status)
-                
-                # 상세 로그는 debug 레벨로만 출력
-                logging.debug(f"Arduino Status: Connected={arduino_status['connected']}, "
-                            f"Digital Output={arduino_status['digital_output']}, "
-                            f"Switch States={bin(arduino_status['switch_states'])}, "
-                            f"Error Count={arduino_status['error_count']}")
-            except Exception as e:
-                logging.error(f"Arduino status update error: {e}")
+            self.view.set_text(self.label_time, "--")
+        self.frame_timer.stop(token)
 
-        # 3) Dynamixel 상태 업데이트
-        if self.dynamixel_worker is not None:
-            try:
-                dynamixel_status = self.dynamixel_worker.get_status()
-                self.update_dynamixel_status_display(dynamixel_status)
-                
-                # 상세 로그는 debug 레벨로만 출력
-                logging.debug(f"Dynamixel Status: Connected={dynamixel_status['connected']}, "
-                            f"Angle={dynamixel_status['angle']:.1f}°, "
-                            f"Moving={dynamixel_status['moving']}, "
-                            f"Temperature={dynamixel_status['temperature']}°C")
-            except Exception as e:
-                logging.error(f"Dynamixel status update error: {e}")
+        # 2) 진단 패널 (저주기)
+        self.diag_tick += 1
+        if self.diag_tick >= DIAG_EVERY_TICKS:
+            self.diag_tick = 0
+            self.update_diagnostics_display()
 
     def closeEvent(self, event):
-        """애플리케이션 종료 시 정리 작업"""
+        """애플리케이션 종료: 장치 정리는 I/O 스레드에서 진행하고, 모두 끝나면(또는 시간 초과 시) 창을 닫음"""
+        if self.shutdown_done:
+            event.accept()
+            self.device_tasks.shutdown(wait=False)
+            logging.info("Application closed")
+            self.log_pipeline.stop()  # 큐에 남은 레코드 출력 후 리스너 종료
+            return
+        
+        event.ignore()
+        if self.closing:
+            return
+        self.closing = True
         logging.info("Application closing, stopping workers...")
+        self.centralWidget().setEnabled(False)
+        self.setWindowTitle(f"{self.windowTitle()} - closing…")
         
         # Motor worker 정리
         if self.connected:
-            self.stop_motor_worker()
-            if self.drv:
-                self.drv.client.close()
+            self.disconnect_motor_driver()
         
         # Arduino worker 정리
         self.stop_arduino_worker()
@@ -938,8 +1311,19 @@ class MainWindow(QtWidgets.QMainWindow):
         # Dynamixel 정리
         self.disconnect_dynamixel()
         
-        event.accept()
-        logging.info("Application closed")
+        QTimer.singleShot(SHUTDOWN_TIMEOUT_MS, self.finish_shutdown)
+        if self.tasks_in_flight == 0:
+            # close()는 closeEvent 안에서 다시 부르면 무시되므로 이벤트 루프로 미룸
+            QTimer.singleShot(0, self.finish_shutdown)
+
+    def finish_shutdown(self):
+        """장치 정리 완료(또는 시간 초과) 후 실제로 창을 닫음"""
+        if self.shutdown_done:
+            return
+        if self.tasks_in_flight:
+            logging.warning(f"Closing with {self.tasks_in_flight} device task(s) still running")
+        self.shutdown_done = True
+        self.close()
 
 
 # ── 진입점 ─────────────────────────────────────────────────────
@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('resource/mainwindow.ui', 'resource')],
+    datas=[('resource/mainwindow.ui', 'resource')],  # compiled UI freshness check and uic fallback
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -16,12 +16,12 @@ a = Analysis(
 )
 pyz = PYZ(a.pure)
 
+# one-folder build: no per-launch unpacking to a temp dir (the one-file build did this on every start)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='main',
     debug=False,
     bootloader_ignore_signals=False,
@@ -36,3 +36,12 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='main',
+)
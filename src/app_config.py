@@ -0,0 +1,79 @@
+"""
+애플리케이션 경로, config.json, schedule.txt, offset.json 로드/저장 (Qt 의존성 없음)
+
+GUI(main.py)와 헤드리스 실행기(headless.py)가 같이 사용
+"""
+
+import sys
+import json
+import logging
+import pathlib
+
+
+def app_dir() -> pathlib.Path:
+    """exe가 있는 폴더(개발 중에는 소스 폴더)"""
+    if getattr(sys, 'frozen', False):
+        return pathlib.Path(sys.executable).parent
+    return pathlib.Path(__file__).resolve().parent.parent
+
+def resource_path(relative: str) -> pathlib.Path:
+    """번들 내부 리소스(.ui, .json)에 접근 (sys._MEIPASS)"""
+    base = pathlib.Path(getattr(sys, '_MEIPASS', app_dir()))
+    return base / relative
+
+OFFSET_FILE = app_dir() / "offset.json"
+SCHEDULE_FILE = app_dir() / "schedule.txt"
+CONFIG_FILE = app_dir() / "config.json"
+
+# 파일이 없거나 오류일 때 사용하는 기본 스케줄
+DEFAULT_SCHEDULE = """
+          # t, deg, vel, acc, dwell
+            0.0,  +2.0, 10, 100, 0
+            3.0,  -2.0, 10, 100, 0
+            6.0,   0.0, 10, 100, 0
+        """
+
+
+def load_schedule(path: pathlib.Path = SCHEDULE_FILE) -> str:
+    """schedule.txt 전체를 문자열로 반환"""
+    if path.exists():
+        try:
+            return path.read_text(encoding="utf-8")
+        except Exception as e:
+            logging.warning(f"schedule load error: {e}")
+    # 파일이 없거나 오류일 때 기본 샘플 제공
+    return DEFAULT_SCHEDULE
+
+def load_offset(path: pathlib.Path = OFFSET_FILE) -> int:
+    if path.exists():
+        try:
+            with path.open() as f:
+                data = json.load(f)
+                return int(data.get("zoffset", 0))
+        except Exception as e:
+            logging.warning(f"offset load error: {e}")
+    return 0        # 기본값
+
+def save_offset(zoffset: int, path: pathlib.Path = OFFSET_FILE):
+    with path.open("w") as f:
+        json.dump({"zoffset": int(zoffset)}, f)
+
+def load_config(path: pathlib.Path = CONFIG_FILE) -> dict:
+    """config.json 파일 로드"""
+    if not path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {path}")
+
+    try:
+        with path.open() as f:
+            return json.load(f)
+    except Exception as e:
+        raise RuntimeError(f"Failed to load config file: {e}")
+
+def save_config(config: dict, path: pathlib.Path = CONFIG_FILE):
+    """config.json 파일 저장"""
+    try:
+        with path.open("w") as f:
+            json.dump(config, f, indent=2)
+        logging.info(f"Configuration saved to {path.name}")
+    except Exception as e:
+        logging.error(f"Error saving config: {e}")
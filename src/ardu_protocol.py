@@ -0,0 +1,138 @@
+"""
+Arduino serial protocol v2
+
+Frame layout:
+  [SYNC 0xA5][TYPE][SEQ][LEN][PAYLOAD x LEN][CRC8 over TYPE..PAYLOAD]
+
+PC -> Arduino
+  HELLO     0x01  [version][max_channels][pad]   always 8 bytes, built so that it
+                                                 fails the v1 CRC check and old
+                                                 firmware drops it
+  UPDATE    0x02  [signal<<7 | n][idx][val]...   sparse LED deltas (n <= 127)
+  FULL      0x03  [signal][v0]...[vN-1]          all channels (refresh)
+Arduino -> PC
+  HELLO_ACK 0x81  [version][channels]
+  STATUS    0x82  [digital_output][switch_states]   SEQ echoes the request
+
+v1 (fixed 8-byte frames, see ArduinoWorker) stays the fallback when the
+firmware does not answer HELLO.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+SYNC = 0xA5
+PROTOCOL_V1 = 1
+PROTOCOL_V2 = 2
+HEADER_LEN = 4
+MAX_PAYLOAD = 64
+MAX_CHANNELS = 32
+MAX_SCAN = 64  # bytes discarded while hunting for SYNC before giving up
+
+MSG_HELLO = 0x01
+MSG_UPDATE = 0x02
+MSG_FULL = 0x03
+MSG_HELLO_ACK = 0x81
+MSG_STATUS = 0x82
+
+
+def _make_crc_table(poly=0x07):
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table.append(crc)
+    return bytes(table)
+
+
+_CRC_TABLE = _make_crc_table()
+
+
+def crc8(data, crc=0):
+    """CRC-8 (poly 0x07, init 0) over all bytes of data"""
+    for b in data:
+        crc = _CRC_TABLE[crc ^ b]
+    return crc
+
+
+class FrameError(Exception):
+    """kind: 'timeout' | 'short' | 'length' | 'crc'"""
+
+    def __init__(self, kind, nbytes=0, skipped=0):
+        super().__init__(f"{kind} (received {nbytes} bytes, skipped {skipped})")
+        self.kind = kind
+        self.nbytes = nbytes
+        self.skipped = skipped
+
+
+def encode(msg_type, seq, payload=b"") -> bytes:
+    body = bytes([msg_type, seq & 0xFF, len(payload)]) + bytes(payload)
+    return bytes([SYNC]) + body + bytes([crc8(body)])
+
+
+def encode_hello(seq, max_channels=MAX_CHANNELS) -> bytes:
+    """HELLO padded to 8 bytes with a pad byte chosen so the v1 CRC (over 6 or 7 bytes) never matches"""
+    for pad in range(256):
+        frame = encode(MSG_HELLO, seq, bytes([PROTOCOL_V2, max_channels, pad]))
+        if crc8(frame[:6]) != frame[7] and crc8(frame[:7]) != frame[7]:
+            return frame
+    raise RuntimeError("no HELLO pad byte avoids the v1 CRC")
+
+
+def encode_led_update(seq, signal, values: Sequence[int], acked: Optional[Sequence[int]]) -> bytes:
+    """
+    Smallest frame that brings the firmware from acked to values:
+    sparse UPDATE with the changed channels, or FULL when that is shorter
+    (or nothing has been acknowledged yet).
+    """
+    if acked is not None and len(acked) == len(values):
+        deltas = [(i, v) for i, (v, a) in enumerate(zip(values, acked)) if v != a]
+        if len(deltas) <= 127 and 1 + 2 * len(deltas) <= 1 + len(values):
+            payload = bytearray([(1 if signal else 0) << 7 | len(deltas)])
+            for i, v in deltas:
+                payload += bytes((i, v))
+            return encode(MSG_UPDATE, seq, payload)
+    return encode(MSG_FULL, seq, bytes([signal & 0xFF]) + bytes(values))
+
+
+def read_frame(ser) -> Tuple[int, int, bytes, int]:
+    """
+    Read one v2 frame from a pyserial-like port.
+    Returns (msg_type, seq, payload, skipped) where skipped counts bytes
+    discarded before SYNC. Raises FrameError on timeout/short/length/crc.
+    """
+    skipped = 0
+    while True:
+        b = ser.read(1)
+        if not b:
+            raise FrameError('timeout' if skipped == 0 else 'short', skipped, skipped)
+        if b[0] == SYNC:
+            break
+        skipped += 1
+        if skipped > MAX_SCAN:
+            raise FrameError('length', skipped, skipped)
+
+    header = ser.read(3)
+    if len(header) < 3:
+        raise FrameError('short', 1 + len(header), skipped)
+    length = header[2]
+    if length > MAX_PAYLOAD:
+        raise FrameError('length', 1 + len(header), skipped)
+
+    rest = ser.read(length + 1)
+    if len(rest) < length + 1:
+        raise FrameError('short', 4 + len(rest), skipped)
+    if crc8(header + rest[:-1]) != rest[-1]:
+        raise FrameError('crc', 4 + len(rest), skipped)
+    return header[0], header[1], bytes(rest[:-1]), skipped
+
+
+def decode_update(payload: bytes, values: List[int]) -> int:
+    """Apply an UPDATE payload to values in place, returns the signal bit (firmware side)"""
+    signal = payload[0] >> 7
+    n = payload[0] & 0x7F
+    for k in range(n):
+        idx, val = payload[1 + 2 * k], payload[2 + 2 * k]
+        if idx < len(values):
+            values[idx] = val
+    return signal
@@ -1,9 +1,17 @@
 import threading
 import time
 import math
+import random
 import serial
 import logging
 
+from src.led_animation import LedAnimation, LedAnimator
+from src.link_stats import LinkStats
+from src.status_notifier import StatusNotifier
+from src.ardu_protocol import (PROTOCOL_V1, PROTOCOL_V2, HEADER_LEN, MAX_CHANNELS, MSG_FULL,
+                               MSG_HELLO_ACK, MSG_STATUS, FrameError, encode_hello,
+                               encode_led_update, read_frame)
+
 def calculate_crc(data):
     crc = 0
     for byte in data[:-1]:  # Exclude the last byte (CRC byte)
@@ -17,11 +25,14 @@ def calculate_crc(data):
     return crc
 
 class ArduinoWorker(threading.Thread):
-    def __init__(self, port="COM4", baudrate=115200, tick=0.01):
-        super().__init__(daemon=True)
+    def __init__(self, port="COM4", baudrate=115200, tick=0.01, read_timeout=1.0,
+                 backoff_initial=0.25, backoff_max=10.0, backoff_jitter=0.2,
+                 protocol=PROTOCOL_V1, hello_timeout=0.3, hello_attempts=3, full_refresh_frames=100):
+        super().__init__(daemon=True, name="ArduinoWorker")
         self.port = port
         self.baudrate = baudrate
         self.tick = tick
+        self.read_timeout = read_timeout  # a lost/short response blocks the loop this long (s)
         self.stop_evt = threading.Event()
         self.lock = threading.Lock()
         
@@ -29,6 +40,9 @@ class ArduinoWorker(threading.Thread):
         self.signal = 1
         self.brightness_values = [0xFF, 0xFF, 0x80, 0x40, 0x20, 0x00]
         
+        # LED animation (precomputed tables, one frame per tick)
+        self.animator = LedAnimator(frame_rate=1.0 / max(tick, 0.001))
+        
         # Status data
         self.status = {
             'connected': False,
@@ -36,26 +50,109 @@ class ArduinoWorker(threading.Thread):
             'received_brightness': [0] * 6,
             'switch_states': 0,
             'last_update': 0,
-            'error_count': 0
+            'error_count': 0,
+            'reconnect_attempts': 0,
+            'last_recovery_time': 0.0,
+            'protocol': PROTOCOL_V1,
+            'channels': 6
         }
+        # Immutable status snapshots pushed to the GUI; link stats stay pull-only (get_status)
+        self.notifier = StatusNotifier(volatile=('last_update',))
+        
+        # Protocol negotiation (v2 when the firmware answers HELLO, else v1). v2 is opt-in
+        # (config arduino.protocol = 2): v1 firmware drops the HELLO, so negotiating
+        # with it costs hello_attempts x hello_timeout on every connect
+        self.preferred_protocol = protocol
+        self.hello_timeout = hello_timeout
+        self.hello_attempts = hello_attempts
+        self.full_refresh_frames = full_refresh_frames  # resend all channels every N acked frames
+        self.protocol = PROTOCOL_V1
+        self._seq = 0
+        self._acked = None              # brightness the firmware has acknowledged (v2)
+        self._frames_since_full = 0
+        
+        # Link statistics (updated by the worker thread only)
+        self.link_stats = LinkStats()
+        self._ever_connected = False
+        
+        # Reconnect state machine: the first retry after a link loss is
+        # immediate, then exponential backoff with jitter. Port opens run on a
+        # helper thread so a blocking open never stalls the loop or stop().
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.backoff_jitter = backoff_jitter
+        self._reconnect_attempts = 0
+        self._next_attempt = 0.0
+        self._attempt_thread = None
+        self._attempt_result = None
         
         # Serial connection
         self.ser = None
         self.t0 = 0
         
+    def _negotiate(self, ser):
+        """Send HELLO and wait for HELLO_ACK; returns (protocol, channels)"""
+        if self.preferred_protocol < PROTOCOL_V2:
+            return PROTOCOL_V1, 6
+        
+        timeout = ser.timeout
+        ser.timeout = self.hello_timeout
+        try:
+            for attempt in range(self.hello_attempts):
+                ser.reset_input_buffer()
+                ser.write(encode_hello(attempt, MAX_CHANNELS))
+                try:
+                    msg_type, _, payload, _ = read_frame(ser)
+                except FrameError:
+                    continue
+                if msg_type == MSG_HELLO_ACK and len(payload) >= 2 and payload[0] >= PROTOCOL_V2:
+                    return PROTOCOL_V2, max(1, min(payload[1], MAX_CHANNELS))
+        finally:
+            ser.timeout = timeout
+        ser.reset_input_buffer()
+        return PROTOCOL_V1, 6
+    
+    def _open_serial(self):
+        """Open the port and negotiate the protocol, returns (ser, protocol, channels)"""
+        ser = serial.Serial(self.port, baudrate=self.baudrate, timeout=self.read_timeout)
+        try:
+            protocol, channels = self._negotiate(ser)
+        except Exception:
+            ser.close()
+            raise
+        return ser, protocol, channels
+    
+    def _on_connected(self, link):
+        """Adopt an opened port, returns the outage duration in seconds"""
+        self.ser, protocol, channels = link
+        with self.lock:
+            self.protocol = protocol
+            self._acked = None
+            self._frames_since_full = 0
+            if len(self.brightness_values) != channels:
+                self.brightness_values = (self.brightness_values + [0] * channels)[:channels]
+            self.status['protocol'] = protocol
+            self.status['channels'] = channels
+            self.status['connected'] = True
+            outage = self.link_stats.mark_connected()
+            if self._ever_connected:
+                self.link_stats.reconnects += 1
+                self.status['last_recovery_time'] = outage
+            self._ever_connected = True
+        return outage
+    
     def connect(self):
         """Connect to Arduino"""
         try:
-            self.ser = serial.Serial(self.port, baudrate=self.baudrate, timeout=1)
-            with self.lock:
-                self.status['connected'] = True
-            logging.info(f"Serial connected to {self.port}")
-            return True
+            link = self._open_serial()
         except Exception as e:
             logging.error(f"Failed to connect to Serial: {e}")
             with self.lock:
                 self.status['connected'] = False
             return False
+        self._on_connected(link)
+        logging.info(f"Serial connected to {self.port} (protocol v{self.protocol}, {self.status['channels']} channels)")
+        return True
     
     def disconnect(self):
         """Disconnect from Arduino"""
@@ -63,25 +160,57 @@ class ArduinoWorker(threading.Thread):
             self.ser.close()
         with self.lock:
             self.status['connected'] = False
+            self.link_stats.mark_disconnected()
+        self._publish()
         logging.info("Serial disconnected")
     
     def set_brightness_values(self, values):
-        """Set brightness values (6 bytes)"""
-        if len(values) == 6:
-            with self.lock:
-                self.brightness_values = values.copy()
+        """Set brightness values (one byte per channel, 6 on v1), stops any running animation"""
+        with self.lock:
+            if len(values) == len(self.brightness_values):
+                self.animator.clear()
+                self.brightness_values = list(values)
     
     def set_led_brightness(self, led_index, brightness):
-        """Set specific LED brightness (led_index: 0-5, brightness: 0-255)"""
-        if 0 <= led_index <= 5 and 0 <= brightness <= 255:
-            with self.lock:
-                self.brightness_values[led_index] = brightness
+        """Set specific LED brightness (led_index: 0-5, brightness: 0-255), stops any running animation"""
+        self.set_leds({led_index: brightness})
+    
+    def set_leds(self, updates):
+        """
+        Batched LED update {led_index: brightness}, applied atomically so all
+        changes go out in the same frame (one v2 delta frame). Stops any running animation.
+        """
+        with self.lock:
+            valid = {i: b for i, b in updates.items()
+                     if 0 <= i < len(self.brightness_values) and 0 <= b <= 255}
+            if valid:
+                self.animator.clear()
+                for i, b in valid.items():
+                    self.brightness_values[i] = b
     
     def set_all_leds(self, brightness):
-        """Set all LEDs to same brightness (brightness: 0-255)"""
+        """Set all LEDs to same brightness (brightness: 0-255), stops any running animation"""
         if 0 <= brightness <= 255:
             with self.lock:
-                self.brightness_values = [brightness] * 6
+                self.animator.clear()
+                self.brightness_values = [brightness] * len(self.brightness_values)
+    
+    def load_animation(self, specs, fade_time=1.0):
+        """
+        Load a per-channel LED animation (6 channel specs, see led_animation.build_table).
+        Tables are precomputed here, outside the worker loop, and the LEDs
+        cross-fade from their current values over fade_time seconds.
+        """
+        animation = specs if isinstance(specs, LedAnimation) else \
+            LedAnimation.from_specs(specs, self.animator.frame_rate)
+        with self.lock:
+            self.animator.load(animation, fade_time, current=self.brightness_values[:6])
+        logging.info(f"LED animation loaded (fade {fade_time:.2f}s)")
+    
+    def stop_animation(self):
+        """Stop the LED animation and hold the last frame"""
+        with self.lock:
+            self.animator.clear()
     
     def set_signal(self, signal):
         """Set signal value (0 or 1)"""
@@ -89,85 +218,233 @@ class ArduinoWorker(threading.Thread):
             self.signal = signal
     
     def get_status(self):
-        """Get current status"""
+        """Get current status (link statistics under 'link')"""
+        with self.lock:
+            status = self.status.copy()
+            status['link'] = self.link_stats.snapshot()
+            return status
+    
+    def _publish(self):
         with self.lock:
-            return self.status.copy()
+            status = self.status.copy()
+        self.notifier.publish(status)
+    
+    def _backoff_delay(self):
+        """Exponential backoff with +/- jitter for the current failure count"""
+        base = min(self.backoff_max, self.backoff_initial * 2 ** (self._reconnect_attempts - 1))
+        return base * random.uniform(1.0 - self.backoff_jitter, 1.0 + self.backoff_jitter)
+    
+    def _attempt_open(self):
+        """Reconnect helper thread: open the port and hand the result to the worker loop"""
+        try:
+            result = self._open_serial()
+        except Exception as e:
+            result = e
+        if self.stop_evt.is_set() and not isinstance(result, Exception):
+            result[0].close()
+            return
+        self._attempt_result = result
+    
+    def _reconnect_step(self):
+        """Advance the reconnect state machine (called from the worker loop while disconnected)"""
+        if self._attempt_thread is not None:
+            if self._attempt_thread.is_alive():
+                return
+            result, self._attempt_thread = self._attempt_result, None
+            self._reconnect_attempts += 1
+            
+            if isinstance(result, Exception):
+                delay = self._backoff_delay()
+                self._next_attempt = time.monotonic() + delay
+                # Only the first failure is worth a warning; the rest would flood the log
+                log = logging.warning if self._reconnect_attempts == 1 else logging.debug
+                log(f"Reconnect attempt {self._reconnect_attempts} to {self.port} failed: {result} "
+                    f"(next in {delay:.2f}s)")
+                with self.lock:
+                    self.status['reconnect_attempts'] = self._reconnect_attempts
+            elif result is not None:
+                outage = self._on_connected(result)
+                logging.info(f"Serial reconnected to {self.port} after {outage:.2f}s "
+                             f"({self._reconnect_attempts} attempts)")
+                self._reconnect_attempts = 0
+                with self.lock:
+                    self.status['reconnect_attempts'] = 0
+            return
+        
+        if time.monotonic() >= self._next_attempt:
+            self._attempt_result = None
+            self._attempt_thread = threading.Thread(target=self._attempt_open, daemon=True,
+                                                    name="ArduinoReconnect")
+            self._attempt_thread.start()
+    
+    def _link_lost(self, error):
+        """Transient error on a live link: drop the port and retry immediately"""
+        logging.warning(f"Serial communication error: {error}")
+        with self.lock:
+            self.status['error_count'] += 1
+        self.disconnect()
+        self._reconnect_attempts = 0
+        self._next_attempt = 0.0
+    
+    def _resync(self):
+        """Drop any partial frame left in the input buffer so the next response is aligned"""
+        self.ser.reset_input_buffer()
+        self.link_stats.resyncs += 1
     
     def stop(self):
         """Stop the worker thread"""
         self.stop_evt.set()
     
+    def _exchange_v1(self, signal, brightness_data):
+        """One v1 exchange: fixed 8-byte request and response"""
+        data = bytearray([signal]) + bytearray(brightness_data[:6])
+        crc = calculate_crc(data)
+        data.append(crc)
+        
+        t_send = time.perf_counter()
+        self.ser.write(data)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):  # skip the hex dump on every frame
+            logging.debug("Data sent to %s: %s", self.port, data.hex(' '))
+        
+        # Read response
+        response = self.ser.read(8)  # Expecting 8 bytes
+        rtt = time.perf_counter() - t_send
+        self.link_stats.bytes_tx += len(data)
+        self.link_stats.bytes_rx += len(response)
+        
+        if len(response) == 8:
+            received_crc = response[-1]
+            calculated_crc = calculate_crc(response)
+            
+            if received_crc == calculated_crc:
+                # Parse response (v1 firmware overlaps SW states with the last brightness byte)
+                digital_output = response[0]
+                brightness_values = list(response[1:7])
+                switch_states = response[6]
+                
+                # Update status
+                with self.lock:
+                    self.status.update({
+                        'digital_output': digital_output,
+                        'received_brightness': brightness_values,
+                        'switch_states': switch_states,
+                        'last_update': time.time(),
+                        'connected': True
+                    })
+                    self.link_stats.record_frame(rtt)
+                
+                logging.debug("Digital Output: %d, Brightness Values: %s, Switch States: %#010b",
+                              digital_output, brightness_values, switch_states)
+            else:
+                logging.warning("CRC mismatch in response")
+                with self.lock:
+                    self.status['error_count'] += 1
+                    # Trailing bytes mean the frame was misaligned rather than corrupted
+                    if self.ser.in_waiting:
+                        self.link_stats.length_errors += 1
+                    else:
+                        self.link_stats.crc_errors += 1
+                    self._resync()
+        else:
+            logging.warning(f"Invalid response length: {len(response)}")
+            with self.lock:
+                self.status['error_count'] += 1
+                self.link_stats.record_read_error(len(response))
+                self._resync()
+    
+    def _exchange_v2(self, signal, brightness_data):
+        """One v2 exchange: LED deltas against the last acknowledged values, STATUS reply"""
+        self._seq = (self._seq + 1) & 0xFF
+        if self._frames_since_full >= self.full_refresh_frames:
+            self._acked = None
+        data = encode_led_update(self._seq, signal, brightness_data, self._acked)
+        
+        t_send = time.perf_counter()
+        self.ser.write(data)
+        try:
+            msg_type, seq, payload, skipped = read_frame(self.ser)
+        except FrameError as e:
+            logging.warning(f"Invalid v2 response: {e}")
+            with self.lock:
+                self.status['error_count'] += 1
+                self.link_stats.bytes_tx += len(data)
+                self.link_stats.bytes_rx += e.nbytes
+                if e.kind == 'crc':
+                    self.link_stats.crc_errors += 1
+                elif e.kind == 'length':
+                    self.link_stats.length_errors += 1
+                else:
+                    self.link_stats.record_read_error(0 if e.kind == 'timeout' else e.nbytes)
+                self._resync()
+            return
+        rtt = time.perf_counter() - t_send
+        
+        with self.lock:
+            self.link_stats.bytes_tx += len(data)
+            self.link_stats.bytes_rx += HEADER_LEN + len(payload) + 1 + skipped
+            if skipped:
+                self.link_stats.resyncs += 1
+            
+            if msg_type != MSG_STATUS or len(payload) < 2:
+                self.status['error_count'] += 1
+                self.link_stats.length_errors += 1
+                self._resync()
+                return
+            if seq != self._seq:
+                # Stale reply to an earlier request: realign and resend the deltas next frame
+                self.status['error_count'] += 1
+                self._resync()
+                return
+            
+            self._frames_since_full = 0 if data[1] == MSG_FULL else self._frames_since_full + 1
+            self._acked = list(brightness_data)
+            self.status.update({
+                'digital_output': payload[0],
+                'received_brightness': list(brightness_data),
+                'switch_states': payload[1],
+                'last_update': time.time(),
+                'connected': True
+            })
+            self.link_stats.record_frame(rtt)
+    
     def run(self):
         """Main thread loop"""
         self.t0 = time.time()
         
         while not self.stop_evt.is_set():
             if not self.status['connected']:
-                time.sleep(self.tick)
+                self._reconnect_step()
+                self._publish()
+                self.stop_evt.wait(max(self.tick, 0.01))
                 continue
                 
             try:
                 # Construct the data packet
                 with self.lock:
                     signal = self.signal
+                    frame = self.animator.next_frame()
+                    if frame is not None:
+                        # the animator always renders 6 channels; keep the negotiated channel count
+                        n = min(len(frame), len(self.brightness_values))
+                        self.brightness_values[:n] = frame[:n]
                     brightness_data = self.brightness_values.copy()
                 
-                data = bytearray([signal]) + bytearray(brightness_data)
-                crc = calculate_crc(data)
-                data.append(crc)
-                
                 # Send data
                 if self.ser and self.ser.is_open:
-                    self.ser.write(data)
-                    logging.debug(f"Data sent to {self.port}: {list(data)}")
-                    
-                    # Read response
-                    response = self.ser.read(8)  # Expecting 8 bytes
-                    
-                    if len(response) == 8:
-                        received_crc = response[-1]
-                        calculated_crc = calculate_crc(response)
-                        
-                        if received_crc == calculated_crc:
-                            # Parse response
-                            digital_output = response[0]
-                            brightness_values = list(response[1:7])
-                            switch_states = response[6]
-                            
-                            # Update status
-                            with self.lock:
-                                self.status.update({
-                                    'digital_output': digital_output,
-                                    'received_brightness': brightness_values,
-                                    'switch_states': switch_states,
-                                    'last_update': time.time(),
-                                    'connected': True
-                                })
-                            
-                            logging.debug(f"Digital Output: {digital_output}")
-                            logging.debug(f"Brightness Values: {brightness_values}")
-                            logging.debug(f"Switch States: {bin(switch_states)}")
-                        else:
-                            logging.warning("CRC mismatch in response")
-                            with self.lock:
-                                self.status['error_count'] += 1
+                    if self.protocol >= PROTOCOL_V2:
+                        self._exchange_v2(signal, brightness_data)
                     else:
-                        logging.warning(f"Invalid response length: {len(response)}")
-                        with self.lock:
-                            self.status['error_count'] += 1
+                        self._exchange_v1(signal, brightness_data)
                             
             except Exception as e:
-                logging.error(f"Serial communication error: {e}")
-                with self.lock:
-                    self.status['error_count'] += 1
-                    self.status['connected'] = False
-                
-                # Try to reconnect
-                self.disconnect()
-                time.sleep(1)  # Wait before retry
-                self.connect()
+                self._link_lost(e)
+                continue
             
-            time.sleep(self.tick)
+            self._publish()
+            self.stop_evt.wait(self.tick)
         
-        # Cleanup on exit
+        # Cleanup on exit (including a port opened by an in-flight reconnect attempt)
         self.disconnect()
+        pending = self._attempt_result
+        if pending is not None and not isinstance(pending, Exception) and pending[0] is not self.ser:
+            pending[0].close()
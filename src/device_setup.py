@@ -0,0 +1,100 @@
+"""
+Blocking device bring-up and teardown shared by the GUI and the headless runner
+
+Plain functions with no Qt dependency. They block on serial I/O, so the
+GUI runs them on its DeviceExecutor lanes (see main.py) while headless.py
+calls them directly. Each device stack (pymodbus, dynamixel_sdk) is imported
+on first use, so neither entry point pays for it before a device is
+connected, and the import cost lands on the I/O thread rather than the GUI.
+"""
+
+import logging
+
+
+def open_motor_driver(port, baudrate):
+    """Open the Modbus port and clear alarms, returns the connected Driver"""
+    from drivers.motor_driver import Driver
+    drv = Driver(port=port, baudrate=baudrate)
+    try:
+        drv.connect()
+    except Exception:
+        drv.client.close()
+        raise
+    logging.info(f"Driver connected on {port} at {baudrate} baud")
+    return drv
+
+
+def open_dynamixel(port, baudrate, dxl_config):
+    """
+    Open the port, find the motors and enable torque
+
+    Args:
+        dxl_config: the "dynamixel" config section (read only)
+
+    Returns:
+        (driver, found_motors, new_bus_map) where new_bus_map is the bus map to
+        cache in config (None when the cached one was still valid)
+    """
+    from drivers.dynamixel.dynamixel_driver import DynamixelDriver
+    driver = DynamixelDriver(device_name=port, baudrate=baudrate)
+    driver.connect()
+    try:
+        # A cached bus map for the same port/baudrate only needs its known IDs verified, else broadcast scan
+        bus_map = dxl_config.get("bus_map") or {}
+        new_bus_map = None
+        if (bus_map.get("port") == port and bus_map.get("baudrate") == baudrate
+                and driver.verify_motors(bus_map.get("motors", []))):
+            found_motors = list(driver.connected_motors.values())
+        else:
+            found_motors = driver.scan_motors()
+            if found_motors:
+                new_bus_map = {"port": port, "baudrate": baudrate, "motors": found_motors}
+
+        if not found_motors:
+            raise RuntimeError("No Dynamixel motors found")
+
+        # A previous session may have left Status Return Level at 1 (RAM survives a port close)
+        driver.detect_status_return_levels([motor['id'] for motor in found_motors])
+
+        for motor in found_motors:
+            driver.enable_torque(motor['id'])
+
+        # Writes without status packets (config: dynamixel.fast_writes, dynamixel.return_delay_us)
+        if dxl_config.get("fast_writes", False):
+            driver.configure_fast_writes([motor['id'] for motor in found_motors],
+                                         return_delay_us=dxl_config.get("return_delay_us", 0))
+    except Exception:
+        driver.disconnect()
+        raise
+    return driver, found_motors, new_bus_map
+
+
+def close_dynamixel(driver):
+    """Disable torque on every motor, then close the port"""
+    try:
+        for motor_id in list(driver.connected_motors.keys()):
+            driver.disable_torque(motor_id)
+    finally:
+        driver.disconnect()
+    logging.info("Dynamixel disconnected")
+
+
+def create_dynamixel_worker(driver, dxl_config, update_rate=20.0):
+    """One worker for every scanned motor (sync read/write), primary motor from dxl_config["motor_id"]"""
+    from drivers.dynamixel.dynamixel_driver import SNAPSHOT_MAX_AGE
+    from src.dynamixel_worker import DynamixelWorker
+    motor_id = dxl_config.get("motor_id", 1)
+    motor_ids = sorted(driver.connected_motors) or [motor_id]
+    if motor_id not in motor_ids:
+        motor_id = motor_ids[0]
+    worker = DynamixelWorker(driver, motor_id, update_rate=update_rate, motor_ids=motor_ids,
+                             snapshot_max_age=dxl_config.get("snapshot_max_age", SNAPSHOT_MAX_AGE))
+    logging.info(f"Dynamixel worker created for motors {motor_ids} (primary {motor_id})")
+    return worker
+
+
+def stop_worker(worker, name):
+    """Stop a worker thread and wait for it (up to one loop period)"""
+    worker.stop()
+    worker.join()
+    logging.info(f"{name} stopped")
@@ -0,0 +1,60 @@
+"""
+Device task executor: blocking device I/O off the GUI thread
+
+One single-thread executor per device lane keeps each bus strictly
+sequential (connect, scan, home, jog, shutdown run in submission order and
+never overlap on the same port) while different devices proceed in
+parallel. Results come back as concurrent.futures.Future; the Qt side turns
+completion into a queued signal (see TaskResultBridge in main.py).
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class DeviceExecutor:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lanes = {}        # {lane: ThreadPoolExecutor(max_workers=1)}
+        self._pending = {}      # {lane: set of not-yet-finished futures}
+        self._closed = False
+
+    def submit(self, lane, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) on the lane's thread, returns a Future"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("DeviceExecutor is shut down")
+            executor = self._lanes.get(lane)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{lane}-io")
+                self._lanes[lane] = executor
+            future = executor.submit(fn, *args, **kwargs)
+            self._pending.setdefault(lane, set()).add(future)
+        future.add_done_callback(lambda f: self._discard(lane, f))
+        return future
+
+    def _discard(self, lane, future):
+        with self._lock:
+            self._pending.get(lane, set()).discard(future)
+
+    def cancel_pending(self, lane):
+        """Cancel tasks queued on lane that have not started, returns how many were cancelled"""
+        with self._lock:
+            futures = list(self._pending.get(lane, ()))
+        cancelled = sum(1 for future in futures if future.cancel())
+        if cancelled:
+            logging.info(f"{lane}: cancelled {cancelled} queued task(s)")
+        return cancelled
+
+    def busy(self, lane):
+        """True while lane has queued or running tasks"""
+        with self._lock:
+            return bool(self._pending.get(lane))
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            self._closed = True
+            lanes = list(self._lanes.values())
+        for executor in lanes:
+            executor.shutdown(wait=wait, cancel_futures=True)
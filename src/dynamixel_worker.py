@@ -1,28 +1,67 @@
 """
 Dynamixel Worker Thread
 지속적으로 Dynamixel 모터의 상태와 위치를 모니터링하는 워커 스레드
+명령 메서드는 즉시 반환하며, 명령 실행 결과/에러는 반환된 concurrent.futures.Future로 전달
 """
 
 import threading
 import time
 import logging
-from typing import Dict, Any, Optional
-from drivers.dynamixel.dynamixel_driver import DynamixelDriver
+from collections import deque
+from concurrent.futures import Future, InvalidStateError, CancelledError, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional, Iterable
+from drivers.dynamixel.dynamixel_driver import (DynamixelDriver, SNAPSHOT_MAX_AGE, DXL_MOVING_STATUS_THRESHOLD,
+                                                 EXTENDED_POSITION_CONTROL_MODE, VELOCITY_CONTROL_MODE)
+from src.ring_trajectory import Trajectory
+from src.status_notifier import StatusNotifier
+
+# 필드별 샘플링 주기 (초, 0 = 매 주기)
+# 위치/이동상태/속도는 매 주기, 전류는 중간, 온도/전압은 분 단위로 변하므로 느리게
+TELEMETRY_PERIODS = {
+    'position': 0.0,
+    'moving': 0.0,
+    'velocity': 0.0,
+    'current': 0.2,
+    'voltage': 2.0,
+    'temperature': 2.0,
+}
+
+# 궤적 스트리밍 기본 주기 (Hz)
+STREAM_RATE = 100.0
+
+# 스트림을 중단시키는 명령 (같은 모터에 다른 목표를 쓰는 명령)
+STREAM_PREEMPTING_COMMANDS = {'move_to_angle', 'move_to_angles', 'set_goal_positions', 'set_velocity', 'stop',
+                              'disable_torque', 'set_operating_mode', 'stream_trajectory', 'stop_stream'}
 
 
 class DynamixelWorker(threading.Thread):
-    def __init__(self, driver: DynamixelDriver, motor_id: int = 1, update_rate: float = 20.0):
+    def __init__(self, driver: DynamixelDriver, motor_id: int = 1, update_rate: float = 20.0,
+                 motor_ids: Optional[Iterable[int]] = None, snapshot_max_age: float = SNAPSHOT_MAX_AGE,
+                 field_periods: Optional[Dict[str, float]] = None):
         """
         Dynamixel 워커 스레드 초기화
         
         Args:
             driver: DynamixelDriver 인스턴스
-            motor_id: 모니터링할 모터 ID
+            motor_id: 기본(대표) 모터 ID - 최상위 상태 필드와 단일 모터 명령에 사용
             update_rate: 업데이트 주기 (Hz)
+            motor_ids: 함께 관리할 전체 모터 ID 목록 (None이면 motor_id 하나)
+                       매 주기 GroupSyncRead 1회로 전부 읽음
+            snapshot_max_age: 이동 명령이 마지막 상태 읽기 결과를 재사용할 수 있는 최대 나이 (초)
+            field_periods: 필드별 샘플링 주기 (초), 기본값 TELEMETRY_PERIODS
+                           매 주기 때가 된 필드만 최소 구간으로 묶어 읽음
         """
-        super().__init__(daemon=True)
+        super().__init__(daemon=True, name="DynamixelWorker")
         self.driver = driver
         self.motor_id = motor_id
+        ids = list(motor_ids) if motor_ids else [motor_id]
+        self.motor_ids = [motor_id] + [i for i in ids if i != motor_id]
+        self.snapshot_max_age = snapshot_max_age
+        self._snapshots = {}  # {motor_id: {'position', 'timestamp'}} 마지막 위치 읽기 (워커 스레드 전용)
+        self.field_periods = dict(TELEMETRY_PERIODS if field_periods is None else field_periods)
+        self._field_times = {}  # {field: 마지막으로 읽은 시각 (time.time())}
+        self.verify_interval = 1.0  # 응답 없는 쓰기 모드에서 남은 쓰기를 read-back 검증하는 주기 (초)
+        self._last_verify = 0.0
         self.update_interval = 1.0 / update_rate  # 초 단위
         
         # 스레드 제어
@@ -41,30 +80,61 @@ class DynamixelWorker(threading.Thread):
             'voltage': 0.0,
             'moving': False,
             'error_count': 0,
-            'last_update': 0.0
+            'last_update': 0.0,
+            'motors': {},       # {motor_id: 모터별 상태 (position, angle, velocity, ...)}
+            'shadow': {},       # 드라이버 섀도 캐시 통계 (생략된 쓰기 수 등)
+            'tx_only': {},      # 응답 없는 쓰기 통계 (writes, verified, mismatches)
+            'field_ages': {},   # {field: 마지막으로 읽은 뒤 지난 시간 (초), 아직 안 읽었으면 None}
+            'stream': {}        # 궤적 스트리밍 진행 상태 (active, index, total, late, skipped, max_lateness_ms)
         }
+        # 값이 바뀐 상태만 불변 스냅샷으로 GUI에 push (진단용 통계는 get_status()로 pull)
+        self.notifier = StatusNotifier(volatile=('last_update', 'shadow', 'tx_only'))
+        
+        # 명령 큐: submit 즉시 워커를 깨우고, 명령마다 Future로 완료/에러 전달
+        self.command_queue = deque()        # [(command, Future)]
+        self.command_cv = threading.Condition()
+        self._submitted = 0                 # submit된 명령 수 (command_cv 보호)
+        self._executed = 0                  # 실행 완료된 명령 수 (워커 스레드)
+        
+        # 이동 완료 대기: 상태 읽기마다 워커가 확인해 Future 완료
+        self._targets = {}                  # {motor_id: 마지막 목표 위치} (워커 스레드 전용)
+        self._waiters = []                  # [(motor_ids, tolerance, 대기 시작 시 submit 수, Future)]
+        self._waiters_lock = threading.Lock()
         
-        # 명령 큐
-        self.command_queue = []
-        self.command_lock = threading.Lock()
+        # 궤적 스트리밍 (워커 스레드 전용, None이면 비활성)
+        self._stream = None
         
-        logging.info(f"DynamixelWorker initialized for motor {motor_id} at {update_rate} Hz")
+        logging.info(f"DynamixelWorker initialized for motors {self.motor_ids} at {update_rate} Hz")
     
     def run(self):
         """워커 스레드 메인 루프"""
         self._running = True
-        logging.info(f"DynamixelWorker started for motor {self.motor_id}")
+        logging.info(f"DynamixelWorker started for motors {self.motor_ids}")
         
+        next_update = time.perf_counter()
         while not self._stop_event.is_set():
             try:
-                # 명령 처리
+                # 명령 처리 (대기 중인 명령은 항상 다음 상태 읽기보다 먼저)
                 self._process_commands()
                 
-                # 상태 업데이트
-                self._update_status()
+                # 상태 업데이트 (주기 도래 시)
+                now = time.perf_counter()
+                if now >= next_update:
+                    self._update_status()
+                    next_update = max(next_update + self.update_interval, now)
+                    if self.driver is not None and now - self._last_verify >= self.verify_interval:
+                        self._last_verify = now
+                        self.driver.verify_writes()
                 
-                # 대기
-                time.sleep(self.update_interval)
+                # 스트리밍 중이면 다음 설정점 마감 시각까지만 대기
+                deadline = next_update
+                if self._stream is not None:
+                    self._stream_step()
+                    if self._stream is not None:
+                        deadline = min(deadline, self._stream_deadline())
+                
+                # 다음 주기까지 대기, 명령이 들어오면 즉시 깨어남
+                self._wait_for_work(deadline)
                 
             except Exception as e:
                 logging.error(f"DynamixelWorker error: {e}")
@@ -72,13 +142,28 @@ class DynamixelWorker(threading.Thread):
                     self.status['error_count'] += 1
                 time.sleep(0.1)  # 에러 시 짧은 대기
         
+        # 진행 중인 스트림 종료, 처리되지 못한 명령 취소
+        if self._stream is not None:
+            self._finish_stream(cancelled=True)
+        with self.command_cv:
+            pending = list(self.command_queue)
+            self.command_queue.clear()
+        for _, future in pending:
+            future.cancel()
+        with self._waiters_lock:
+            waiters, self._waiters = self._waiters, []
+        for _, _, _, future in waiters:
+            future.cancel()
+        
         self._running = False
-        logging.info(f"DynamixelWorker stopped for motor {self.motor_id}")
+        logging.info(f"DynamixelWorker stopped for motors {self.motor_ids}")
     
     def stop(self):
         """워커 스레드 중지"""
-        logging.info(f"Stopping DynamixelWorker for motor {self.motor_id}")
+        logging.info(f"Stopping DynamixelWorker for motors {self.motor_ids}")
         self._stop_event.set()
+        with self.command_cv:
+            self.command_cv.notify_all()
     
     def is_running(self) -> bool:
         """워커 스레드 실행 상태 확인"""
@@ -90,79 +175,147 @@ class DynamixelWorker(threading.Thread):
             if self.driver is None:
                 with self.lock:
                     self.status['connected'] = False
+                self._publish()
                 return
             
-            # 현재 위치 읽기
-            position = self.driver.get_present_position(self.motor_id)
-            angle = self.driver.position_to_angle(position)
-            
-            # 현재 속도 읽기
-            velocity = self.driver.get_present_velocity(self.motor_id)
-            
-            # 이동 상태 확인
-            moving = self.driver.is_moving(self.motor_id)
-            
-            # 추가 상태 정보 (에러 처리 포함)
-            current = 0
-            temperature = 0
-            voltage = 0.0
+            # 때가 된 필드만 전체 모터에 대해 읽기 (필드 구간을 묶어 보통 트랜잭션 1회)
+            executed = self._executed
+            now = time.time()
+            due = [name for name, period in self.field_periods.items()
+                   if now - self._field_times.get(name, 0.0) >= period]
+            if not due:
+                return
+            snapshots = self.driver.read_status_block(self.motor_ids, due)
             
-            try:
-                status_info = self.driver.get_status(self.motor_id)
-                current = status_info.get('current', 0)
-                temperature = status_info.get('temperature', 0)
-                voltage = status_info.get('voltage', 0.0)
-            except Exception as e:
-                logging.debug(f"Error reading extended status: {e}")
+            with self.lock:
+                previous = self.status['motors']
+            motors = {}
+            for motor_id, snapshot in snapshots.items():
+                motor = dict(previous.get(motor_id, {}))
+                motor.update((name, snapshot[name]) for name in due)
+                if 'position' in snapshot:
+                    motor['angle'] = self.driver.position_to_angle(snapshot['position']) % 360  # 0-360도 범위로 정규화
+                    self._snapshots[motor_id] = {'position': snapshot['position'], 'timestamp': snapshot['timestamp']}
+                motors[motor_id] = motor
+            timestamp = snapshots[self.motor_id]['timestamp']
+            for name in due:
+                self._field_times[name] = timestamp
+            primary = motors[self.motor_id]
             
             # 스레드 안전하게 상태 업데이트
             with self.lock:
+                self.status.update(primary)
                 self.status.update({
                     'connected': True,
-                    'position': position,
-                    'angle': angle % 360,  # 0-360도 범위로 정규화
-                    'velocity': velocity,
-                    'current': current,
-                    'temperature': temperature,
-                    'voltage': voltage,
-                    'moving': moving,
-                    'last_update': time.time()
+                    'last_update': timestamp,
+                    'motors': motors,
+                    'shadow': self.driver.get_shadow_stats(),
+                    'tx_only': self.driver.get_tx_only_stats()
                 })
+            self._publish()
+            
+            if ('position' in due or 'moving' in due) and self._stream is None:
+                self._check_waiters(motors, executed)
                 
         except Exception as e:
-            logging.debug(f"Status update error for motor {self.motor_id}: {e}")
+            logging.debug("Status update error for motors %s: %s", self.motor_ids, e)
+            # 응답 없는 모터는 재부팅/전압 강하로 RAM(프로파일 속도 등)이 초기화됐을 수 있으므로 캐시를 믿지 않음
+            if self.driver is not None:
+                for motor_id in self.motor_ids:
+                    self.driver.invalidate_shadow(motor_id)
             with self.lock:
                 self.status['connected'] = False
                 self.status['error_count'] += 1
+            self._publish()
+    
+    def _publish(self):
+        """현재 상태를 notifier로 발행 (이전과 같으면 알림 없음)"""
+        with self.lock:
+            status = self.status.copy()
+        self.notifier.publish(status)
+    
+    def _wait_for_work(self, deadline: float):
+        """deadline(perf_counter)까지 대기, 명령 submit 또는 stop 시 즉시 반환"""
+        with self.command_cv:
+            while not self.command_queue and not self._stop_event.is_set():
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self.command_cv.wait(remaining)
+    
+    def _submit(self, command: Dict[str, Any]) -> Future:
+        """명령을 큐에 넣고 워커를 깨움, 명령 결과를 담을 Future 반환 (stop 이후에는 취소된 Future)"""
+        future = Future()
+        with self.command_cv:
+            # stop 이후에는 큐를 읽을 스레드가 없으므로 넣지 않고 바로 취소 (result()가 영원히 막히지 않게)
+            if self._stop_event.is_set():
+                future.cancel()
+                return future
+            self.command_queue.append((command, future))
+            self._submitted += 1
+            self.command_cv.notify()
+        return future
     
     def _process_commands(self):
-        """명령 큐 처리"""
-        with self.command_lock:
-            while self.command_queue:
-                command = self.command_queue.pop(0)
-                try:
-                    self._execute_command(command)
-                except Exception as e:
-                    logging.error(f"Command execution error: {e}")
+        """명령 큐 처리 (실행 중에는 락을 잡지 않아 submit이 막히지 않음)"""
+        while True:
+            with self.command_cv:
+                if not self.command_queue:
+                    return
+                command, future = self.command_queue.popleft()
+            
+            if not future.set_running_or_notify_cancel():
+                self._executed += 1
+                continue
+            try:
+                future.set_result(self._execute_command(command))
+            except Exception as e:
+                logging.error(f"Command execution error: {e}")
+                future.set_exception(e)
+            finally:
+                self._executed += 1
     
     def _execute_command(self, command: Dict[str, Any]):
-        """개별 명령 실행"""
+        """개별 명령 실행, 드라이버 반환값을 명령 결과로 반환"""
         cmd_type = command.get('type')
+        if self._stream is not None and cmd_type in STREAM_PREEMPTING_COMMANDS:
+            self._finish_stream(cancelled=True)
         
         if cmd_type == 'move_to_angle':
             target_angle = command.get('angle', 0)
             velocity = command.get('velocity', 100)
-            logging.info(f"Executing move to angle: {target_angle}° at velocity {velocity}")
-            self.driver.move_to_angle_counterclockwise(self.motor_id, target_angle, velocity)
+            logging.info("Executing move to angle: %s° at velocity %s", target_angle, velocity)
+            result = self.driver.move_to_angle_counterclockwise(
+                self.motor_id, target_angle, velocity,
+                snapshot=self._snapshots.get(self.motor_id), max_age=self.snapshot_max_age)
+            self._targets[self.motor_id] = result[0]
+            return result
+            
+        elif cmd_type == 'move_to_angles':
+            targets = command.get('angles', {})
+            velocity = command.get('velocity', 100)
+            logging.info("Executing synchronized move: %s at velocity %s", targets, velocity)
+            result = self.driver.move_to_angles_counterclockwise(
+                targets, velocity, snapshots=self._snapshots, max_age=self.snapshot_max_age)
+            self._targets.update((motor_id, goal) for motor_id, (goal, _) in result.items())
+            return result
+            
+        elif cmd_type == 'set_goal_positions':
+            goals = command.get('goals', {})
+            logging.info("Executing synchronized goal positions: %s", goals)
+            self.driver.sync_write_goals(goals)
+            self._targets.update((motor_id, position) for motor_id, (_, position) in goals.items())
             
         elif cmd_type == 'set_velocity':
             velocity = command.get('velocity', 0)
-            logging.info(f"Setting velocity: {velocity}")
+            logging.info("Setting velocity: %s", velocity)
             self.driver.set_goal_velocity(self.motor_id, velocity)
+            self._targets.pop(self.motor_id, None)  # 속도 제어: 목표 위치 없음
             
         elif cmd_type == 'stop':
             logging.info("Stopping motor")
             self.driver.stop_motor(self.motor_id)
+            self._targets.pop(self.motor_id, None)  # 정지: 이전 목표 위치로 가지 않음
             
         elif cmd_type == 'enable_torque':
             logging.info("Enabling torque")
@@ -171,81 +324,344 @@ class DynamixelWorker(threading.Thread):
         elif cmd_type == 'disable_torque':
             logging.info("Disabling torque")
             self.driver.disable_torque(self.motor_id)
+            self._targets.pop(self.motor_id, None)  # 토크 OFF: 이전 목표 위치로 가지 않음
             
         elif cmd_type == 'set_operating_mode':
             mode = command.get('mode', 3)
-            logging.info(f"Setting operating mode: {mode}")
-            self.driver.disable_torque(self.motor_id)
-            self.driver.set_operating_mode(self.motor_id, mode)
-            self.driver.enable_torque(self.motor_id)
+            # 이미 같은 모드면 토크 OFF/ON 사이클과 EEPROM 쓰기를 생략
+            if self.driver.ensure_operating_mode(self.motor_id, mode):
+                logging.info("Operating mode set: %s", mode)
+            else:
+                logging.debug("Operating mode already %s", mode)
+            return mode
+            
+        elif cmd_type == 'stream_trajectory':
+            self._start_stream(command)
+            
+        elif cmd_type == 'stop_stream':
+            pass  # 위에서 이미 종료됨
             
         else:
-            logging.warning(f"Unknown command type: {cmd_type}")
+            raise ValueError(f"Unknown command type: {cmd_type}")
     
     def get_status(self) -> Dict[str, Any]:
         """현재 상태 반환 (스레드 안전)"""
         with self.lock:
-            return self.status.copy()
+            status = self.status.copy()
+            status['motors'] = {motor_id: motor.copy() for motor_id, motor in self.status['motors'].items()}
+            status['stream'] = self.status['stream'].copy()
+            field_times = dict(self._field_times)
+        now = time.time()
+        status['field_ages'] = {name: (now - field_times[name]) if name in field_times else None
+                                for name in self.field_periods}
+        return status
     
-    def move_to_angle(self, angle: float, velocity: int = 100):
+    def move_to_angle(self, angle: float, velocity: int = 100) -> Future:
         """각도로 이동 명령 추가"""
         command = {
             'type': 'move_to_angle',
             'angle': angle % 360,
             'velocity': velocity
         }
-        with self.command_lock:
-            self.command_queue.append(command)
-        logging.info(f"Move command queued: {angle}° at velocity {velocity}")
+        future = self._submit(command)
+        logging.info("Move command queued: %s° at velocity %s", angle, velocity)
+        return future
     
-    def set_velocity(self, velocity: int):
+    def move_to_angles(self, angles: Dict[int, float], velocity: int = 100) -> Future:
+        """여러 모터 동시 이동 명령 추가 {motor_id: angle} (동기 쓰기 1회)"""
+        command = {
+            'type': 'move_to_angles',
+            'angles': {motor_id: angle % 360 for motor_id, angle in angles.items()},
+            'velocity': velocity
+        }
+        future = self._submit(command)
+        logging.info("Synchronized move command queued: %s at velocity %s", angles, velocity)
+        return future
+    
+    def set_goal_positions(self, goals: Dict[int, tuple]) -> Future:
+        """여러 모터 목표 위치/프로파일 속도 명령 추가 {motor_id: (profile_velocity, goal_position)}"""
+        command = {
+            'type': 'set_goal_positions',
+            'goals': dict(goals)
+        }
+        return self._submit(command)
+    
+    def set_velocity(self, velocity: int) -> Future:
         """속도 설정 명령 추가"""
         command = {
             'type': 'set_velocity',
             'velocity': velocity
         }
-        with self.command_lock:
-            self.command_queue.append(command)
+        return self._submit(command)
     
-    def stop_motor(self):
+    def stop_motor(self) -> Future:
         """모터 정지 명령 추가"""
         command = {'type': 'stop'}
-        with self.command_lock:
-            self.command_queue.append(command)
+        return self._submit(command)
     
-    def enable_torque(self):
+    def enable_torque(self) -> Future:
         """토크 활성화 명령 추가"""
         command = {'type': 'enable_torque'}
-        with self.command_lock:
-            self.command_queue.append(command)
+        return self._submit(command)
     
-    def disable_torque(self):
+    def disable_torque(self) -> Future:
         """토크 비활성화 명령 추가"""
         command = {'type': 'disable_torque'}
-        with self.command_lock:
-            self.command_queue.append(command)
+        return self._submit(command)
     
-    def set_operating_mode(self, mode: int):
+    def set_operating_mode(self, mode: int) -> Future:
         """동작 모드 설정 명령 추가"""
         command = {
             'type': 'set_operating_mode',
             'mode': mode
         }
-        with self.command_lock:
-            self.command_queue.append(command)
+        return self._submit(command)
+    
+    def stream_trajectory(self, trajectory: Trajectory, rate: float = STREAM_RATE, mode: str = 'position',
+                          motor_ids: Optional[Iterable[int]] = None, start_at: Optional[float] = None) -> Future:
+        """
+        궤적 스트리밍 명령 추가
+        호출 스레드에서 rate(Hz)로 미리 샘플링하고, 워커가 설정점마다 동기 쓰기 1회로 전송
+        워커가 늦어 여러 설정점의 마감이 지났으면 가장 최근 것만 보내고 나머지는 skipped로 집계
+        마감보다 반 주기 이상 늦게 보낸 설정점은 late로 집계
+        이동/정지 명령이나 새 스트림, stop_stream()이 들어오면 중단 (cancelled=True로 보고)
+        
+        Args:
+            trajectory: Trajectory (각도는 스트림 시작 위치 기준 누적 각도, 반시계 +)
+            rate: 설정점 전송 주기 (Hz)
+            mode: 'position' (Extended Position 모드, 프로파일 속도 0으로 목표 위치 추종)
+                  'velocity' (Velocity 모드, 궤적 각속도를 목표 속도로 전송, 끝나면 0)
+            motor_ids: 대상 모터 (None이면 관리 중인 모든 모터, 모두 같은 궤적)
+            start_at: 첫 설정점 시각 (time.perf_counter 기준, 서보 스케줄과 맞출 때), None이면 즉시
+        
+        Returns:
+            Future -> 스트림 보고 {setpoints, sent, late, skipped, max_lateness_ms, duration, cancelled}
+        """
+        if mode not in ('position', 'velocity'):
+            raise ValueError(f"Unknown stream mode: {mode}")
+        done = Future()
+        command = {
+            'type': 'stream_trajectory',
+            'setpoints': trajectory.sample(rate),
+            'period': 1.0 / rate,
+            'mode': mode,
+            'motor_ids': list(motor_ids) if motor_ids is not None else list(self.motor_ids),
+            'start_at': start_at,
+            'future': done
+        }
+        
+        def _propagate(started: Future):
+            # 시작 전에 취소되었거나 시작(모드 전환 등)에 실패하면 보고 Future에 전달
+            if started.cancelled():
+                done.cancel()
+            elif started.exception() is not None and not done.done():
+                done.set_exception(started.exception())
+        
+        self._submit(command).add_done_callback(_propagate)
+        logging.info("Trajectory stream queued: %d setpoints at %s Hz (%s)", len(command['setpoints']), rate, mode)
+        return done
+    
+    def stop_stream(self) -> Future:
+        """진행 중인 궤적 스트리밍 중단 명령 추가 (마지막으로 보낸 목표에서 멈춤)"""
+        return self._submit({'type': 'stop_stream'})
+    
+    def _start_stream(self, command: Dict[str, Any]):
+        """스트림 준비: 동작 모드 보장, 기준 위치 확보 (워커 스레드)"""
+        motor_ids = command['motor_ids']
+        mode = command['mode']
+        if mode == 'position':
+            for motor_id in motor_ids:
+                self.driver.ensure_operating_mode(motor_id, EXTENDED_POSITION_CONTROL_MODE)
+            self.driver.sync_write_profile_velocities({motor_id: 0 for motor_id in motor_ids})  # 0 = 프로파일 없음
+            base = self.driver.fresh_positions(motor_ids, self._snapshots, self.snapshot_max_age)
+        else:
+            for motor_id in motor_ids:
+                self.driver.ensure_operating_mode(motor_id, VELOCITY_CONTROL_MODE)
+            base = {}
+        
+        now = time.perf_counter()
+        start_at = command['start_at']
+        self._stream = {
+            'setpoints': command['setpoints'],
+            'period': command['period'],
+            'mode': mode,
+            'motor_ids': motor_ids,
+            'base': base,
+            'start': now if start_at is None else start_at,
+            'started': now,
+            'index': 0,
+            'sent': 0,
+            'late': 0,
+            'skipped': 0,
+            'max_lateness': 0.0,
+            'future': command['future']
+        }
+        self._publish_stream()
+    
+    def _stream_deadline(self) -> float:
+        stream = self._stream
+        return stream['start'] + stream['index'] * stream['period']
     
-    def wait_for_completion(self, timeout: float = 10.0) -> bool:
-        """이동 완료까지 대기"""
-        start_time = time.time()
+    def _stream_step(self):
+        """마감이 지난 설정점 전송 (밀린 설정점은 건너뛰고 가장 최근 것만)"""
+        stream = self._stream
+        if stream['future'].cancelled():
+            self._finish_stream(cancelled=True)  # 호출자가 보고 Future를 취소하면 중단
+            return
+        now = time.perf_counter()
+        elapsed = now - stream['start']
+        index = stream['index']
+        if elapsed < index * stream['period']:
+            return
+        
+        setpoints = stream['setpoints']
+        latest = min(int(elapsed / stream['period']), len(setpoints) - 1)
+        lateness = elapsed - index * stream['period']
+        stream['skipped'] += latest - index
+        stream['max_lateness'] = max(stream['max_lateness'], lateness)
+        if elapsed - latest * stream['period'] > stream['period'] / 2:
+            stream['late'] += 1
+        
+        setpoint = setpoints[latest]
+        try:
+            if stream['mode'] == 'position':
+                self.driver.sync_write_goal_positions({
+                    motor_id: base + self.driver.angle_to_position(setpoint.angle)
+                    for motor_id, base in stream['base'].items()})
+            else:
+                velocity = self.driver.degrees_per_second_to_velocity(setpoint.velocity)
+                self.driver.sync_write_goal_velocities({motor_id: velocity for motor_id in stream['motor_ids']})
+        except Exception as e:
+            logging.error(f"Trajectory stream write failed: {e}")
+            self._finish_stream(error=e)
+            return
         
-        while time.time() - start_time < timeout:
-            status = self.get_status()
-            if not status.get('moving', False):
-                return True
-            time.sleep(0.1)
+        stream['sent'] += 1
+        stream['index'] = latest + 1
+        if stream['index'] >= len(setpoints):
+            self._finish_stream()
+        elif stream['sent'] % 10 == 0:
+            self._publish_stream()
+    
+    def _finish_stream(self, cancelled: bool = False, error: Optional[Exception] = None):
+        """스트림 종료 및 보고 Future 완료 (워커 스레드)"""
+        stream, self._stream = self._stream, None
+        if stream['mode'] == 'position':
+            # 마지막으로 보낸 설정점을 목표로 기록 (completion()이 도달 여부 판단)
+            sent = stream['setpoints'][max(stream['index'] - 1, 0)]
+            self._targets.update((motor_id, base + self.driver.angle_to_position(sent.angle))
+                                 for motor_id, base in stream['base'].items())
+        elif error is None:
+            try:
+                self.driver.sync_write_goal_velocities({motor_id: 0 for motor_id in stream['motor_ids']})
+            except Exception as e:
+                error = e
+            for motor_id in stream['motor_ids']:
+                self._targets.pop(motor_id, None)
         
-        logging.warning(f"Movement timeout after {timeout} seconds")
-        return False
+        report = {
+            'setpoints': len(stream['setpoints']),
+            'sent': stream['sent'],
+            'late': stream['late'],
+            'skipped': stream['skipped'],
+            'max_lateness_ms': stream['max_lateness'] * 1000.0,
+            'duration': time.perf_counter() - stream['started'],
+            'cancelled': cancelled
+        }
+        self._publish_stream(stream, active=False)
+        logging.info("Trajectory stream %s: %s", 'cancelled' if cancelled else 'finished', report)
+        
+        future = stream['future']
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(report)
+        except InvalidStateError:
+            pass  # 호출자가 취소
+    
+    def _publish_stream(self, stream: Optional[Dict[str, Any]] = None, active: bool = True):
+        stream = stream or self._stream
+        with self.lock:
+            self.status['stream'] = {
+                'active': active,
+                'mode': stream['mode'],
+                'index': stream['index'],
+                'total': len(stream['setpoints']),
+                'late': stream['late'],
+                'skipped': stream['skipped'],
+                'max_lateness_ms': stream['max_lateness'] * 1000.0
+            }
+        self._publish()
+    
+    def completion(self, motor_ids: Optional[Iterable[int]] = None,
+                   tolerance: int = DXL_MOVING_STATUS_THRESHOLD) -> Future:
+        """
+        이동 완료 Future 반환 (폴링 없음)
+        이 호출 전에 submit된 명령이 모두 실행된 뒤의 상태 읽기에서, 대상 모터가 모두 멈춰 있고
+        목표 위치와의 차이가 tolerance 이하이면 워커가 즉시 완료시킴 (목표가 없으면 멈춤만 확인)
+        asyncio에서는 asyncio.wrap_future(worker.completion())로 await 가능
+        
+        Args:
+            motor_ids: 대상 모터 (None이면 관리 중인 모든 모터)
+            tolerance: 목표 위치 허용 오차 (position 단위)
+        
+        Returns:
+            Future -> {motor_id: 완료 시점 위치}
+        """
+        ids = list(motor_ids) if motor_ids is not None else list(self.motor_ids)
+        future = Future()
+        with self.command_cv:
+            submitted = self._submitted
+        with self._waiters_lock:
+            if self._stop_event.is_set():
+                future.cancel()  # 중지된 워커는 더 이상 상태를 읽지 않음
+                return future
+            self._waiters.append((ids, tolerance, submitted, future))
+        return future
+    
+    def _check_waiters(self, motors: Dict[int, Dict[str, Any]], executed: int):
+        """상태 읽기 직후 완료 조건을 만족한 대기자 Future 완료 (워커 스레드)"""
+        with self._waiters_lock:
+            if not self._waiters:
+                return
+            waiters = self._waiters
+            self._waiters = []
+        
+        remaining = []
+        for ids, tolerance, submitted, future in waiters:
+            if future.done():
+                continue
+            if executed < submitted or not all(self._motor_settled(motors.get(i), i, tolerance) for i in ids):
+                remaining.append((ids, tolerance, submitted, future))
+                continue
+            try:
+                future.set_result({i: motors[i]['position'] for i in ids})
+            except InvalidStateError:
+                pass  # 그 사이 호출자가 취소
+        
+        with self._waiters_lock:
+            self._waiters.extend(remaining)
+    
+    def _motor_settled(self, motor: Optional[Dict[str, Any]], motor_id: int, tolerance: int) -> bool:
+        if not motor or motor.get('moving', True):
+            return False
+        target = self._targets.get(motor_id)
+        return target is None or abs(motor['position'] - target) <= tolerance
+    
+    def wait_for_completion(self, timeout: float = 10.0, motor_ids: Optional[Iterable[int]] = None,
+                            tolerance: int = DXL_MOVING_STATUS_THRESHOLD) -> bool:
+        """이동 완료까지 대기 (기본: 관리 중인 모든 모터), completion() 참조"""
+        future = self.completion(motor_ids, tolerance)
+        try:
+            future.result(timeout)
+            return True
+        except FutureTimeoutError:
+            future.cancel()
+            logging.warning("Movement timeout after %s seconds", timeout)
+            return False
+        except CancelledError:
+            return False  # 워커 중지 또는 다른 스레드에서 취소
     
     def get_current_angle(self) -> float:
         """현재 각도 반환"""
@@ -0,0 +1,156 @@
+"""
+LED animation engine for ArduinoWorker
+
+Waveforms are precomputed into per-channel lookup tables sampled at the
+worker frame rate, so the worker loop only advances a frame index instead of
+evaluating math.sin for every channel on every frame.
+"""
+
+import math
+from typing import List, Optional, Sequence, Tuple, Union
+
+NUM_CHANNELS = 6
+
+
+def _clamp(value):
+    return max(0, min(255, int(round(value))))
+
+
+def constant_table(value) -> bytes:
+    """Constant brightness (single entry table)"""
+    return bytes([_clamp(value)])
+
+
+def sine_table(frame_rate, freq, lo=0, hi=255, phase=0.0) -> bytes:
+    """One period of a sine wave between lo and hi (phase in degrees)"""
+    n = max(1, int(round(frame_rate / freq)))
+    mid = (hi + lo) / 2.0
+    amp = (hi - lo) / 2.0
+    ph = math.radians(phase)
+    return bytes(_clamp(mid + amp * math.sin(2.0 * math.pi * i / n + ph)) for i in range(n))
+
+
+def ramp_table(frame_rate, period, lo=0, hi=255) -> bytes:
+    """Sawtooth ramp from lo to hi over period seconds"""
+    n = max(1, int(round(frame_rate * period)))
+    return bytes(_clamp(lo + (hi - lo) * i / n) for i in range(n))
+
+
+def keyframe_table(frame_rate, keyframes: Sequence[Tuple[float, float]]) -> bytes:
+    """
+    Linear interpolation between (time, value) keyframes.
+    The table covers 0 .. last keyframe time and loops back to the first value.
+    """
+    keys = sorted(keyframes)
+    if not keys:
+        return constant_table(0)
+    if len(keys) == 1:
+        return constant_table(keys[0][1])
+
+    n = max(1, int(round(frame_rate * keys[-1][0])))
+    table = bytearray(n)
+    k = 0
+    for i in range(n):
+        t = i / frame_rate
+        while k < len(keys) - 2 and t >= keys[k + 1][0]:
+            k += 1
+        (t0, v0), (t1, v1) = keys[k], keys[k + 1]
+        if t <= t0 or t1 <= t0:
+            table[i] = _clamp(v0)
+        else:
+            table[i] = _clamp(v0 + (v1 - v0) * min(1.0, (t - t0) / (t1 - t0)))
+    return bytes(table)
+
+
+ChannelSpec = Union[int, dict]
+
+
+def build_table(spec: ChannelSpec, frame_rate) -> bytes:
+    """
+    Channel spec -> lookup table
+      255                                              : constant brightness
+      {'type': 'sine', 'freq': 0.05, 'min': 0, 'max': 255, 'phase': 0}
+      {'type': 'ramp', 'period': 2.0, 'min': 0, 'max': 255}
+      {'type': 'keyframes', 'keys': [(0, 0), (1.0, 255), (3.0, 0)]}
+    """
+    if isinstance(spec, (int, float)):
+        return constant_table(spec)
+
+    kind = spec.get('type', 'constant')
+    lo = spec.get('min', 0)
+    hi = spec.get('max', 255)
+    if kind == 'constant':
+        return constant_table(spec.get('value', 0))
+    elif kind == 'sine':
+        return sine_table(frame_rate, spec.get('freq', 0.05), lo, hi, spec.get('phase', 0.0))
+    elif kind == 'ramp':
+        return ramp_table(frame_rate, spec.get('period', 1.0), lo, hi)
+    elif kind == 'keyframes':
+        return keyframe_table(frame_rate, spec.get('keys', []))
+    raise ValueError(f"Unknown waveform type: {kind}")
+
+
+class LedAnimation:
+    """Per-channel lookup tables sharing one frame index"""
+
+    def __init__(self, tables: Sequence[bytes]):
+        if len(tables) != NUM_CHANNELS:
+            raise ValueError(f"LedAnimation needs {NUM_CHANNELS} channels, got {len(tables)}")
+        self.tables = [bytes(t) for t in tables]
+        self.lengths = [len(t) for t in self.tables]
+
+    @classmethod
+    def from_specs(cls, specs: Sequence[ChannelSpec], frame_rate):
+        return cls([build_table(s, frame_rate) for s in specs])
+
+    def frame(self, idx) -> List[int]:
+        return [t[idx % n] for t, n in zip(self.tables, self.lengths)]
+
+
+class LedAnimator:
+    """Advances the active animation one frame per worker tick with cross-fades"""
+
+    def __init__(self, frame_rate):
+        self.frame_rate = frame_rate
+        self.animation: Optional[LedAnimation] = None
+        self.index = 0
+
+        # Cross-fade state: blend from a frozen frame into the new animation
+        self.fade_from: Optional[List[int]] = None
+        self.fade_frames = 0
+        self.fade_pos = 0
+
+    @property
+    def active(self):
+        return self.animation is not None
+
+    def load(self, animation: LedAnimation, fade_time=0.0, current: Optional[List[int]] = None):
+        """Load a new animation, cross-fading from current values over fade_time seconds"""
+        self.animation = animation
+        self.index = 0
+        self.fade_frames = int(round(fade_time * self.frame_rate))
+        self.fade_pos = 0
+        self.fade_from = list(current) if (current is not None and self.fade_frames > 0) else None
+
+    def clear(self):
+        self.animation = None
+        self.fade_from = None
+
+    def _blend(self, a, b, pos):
+        n = self.fade_frames
+        return [(x * (n - pos) + y * pos) // n for x, y in zip(a, b)]
+
+    def next_frame(self) -> Optional[List[int]]:
+        """Brightness values for the next frame (None when no animation is loaded)"""
+        if self.animation is None:
+            return None
+
+        frame = self.animation.frame(self.index)
+        self.index += 1
+
+        if self.fade_from is not None:
+            frame = self._blend(self.fade_from, frame, self.fade_pos)
+            self.fade_pos += 1
+            if self.fade_pos >= self.fade_frames:
+                self.fade_from = None
+        return frame
@@ -0,0 +1,120 @@
+"""
+Serial link statistics for ArduinoWorker
+
+Counters are plain attributes updated only from the worker thread, so the
+hot path costs a few integer increments and one bisect per frame. The
+owner takes a consistent copy with snapshot() under its own status lock.
+"""
+
+import time
+from bisect import bisect_right
+
+# RTT histogram bucket upper edges (ms); the last bucket is open ended
+RTT_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class LinkStats:
+    def __init__(self, rate_window=1.0):
+        self.rate_window = rate_window
+        self.reset()
+
+    def reset(self):
+        self.frames_ok = 0
+        self.timeouts = 0
+        self.short_reads = 0
+        self.length_errors = 0
+        self.crc_errors = 0
+        self.resyncs = 0
+        self.reconnects = 0
+        self.bytes_tx = 0
+        self.bytes_rx = 0
+
+        self.rtt_hist = [0] * (len(RTT_BUCKETS_MS) + 1)
+        self.rtt_last = 0.0
+        self.rtt_max = 0.0
+        self._rtt_sum = 0.0
+
+        self.frames_per_sec = 0.0
+        self._rate_t0 = time.perf_counter()
+        self._rate_frames = 0
+
+        self.disconnected_time = 0.0
+        self.last_outage = 0.0
+        self._disconnected_since = time.perf_counter()
+
+    # ── hot path (worker thread) ─────────────────────────────
+    def record_frame(self, rtt):
+        """Successful request/response exchange, rtt in seconds"""
+        ms = rtt * 1000.0
+        self.frames_ok += 1
+        self.rtt_hist[bisect_right(RTT_BUCKETS_MS, ms)] += 1  # bucket i holds RTT < RTT_BUCKETS_MS[i]
+        self.rtt_last = ms
+        self._rtt_sum += ms
+        if ms > self.rtt_max:
+            self.rtt_max = ms
+
+        self._rate_frames += 1
+        now = time.perf_counter()
+        dt = now - self._rate_t0
+        if dt >= self.rate_window:
+            self.frames_per_sec = self._rate_frames / dt
+            self._rate_frames = 0
+            self._rate_t0 = now
+
+    def record_read_error(self, nbytes):
+        """Response shorter than expected (0 bytes = timeout)"""
+        if nbytes == 0:
+            self.timeouts += 1
+        else:
+            self.short_reads += 1
+
+    # ── connection events ───────────────────────────────────
+    def mark_connected(self):
+        """Returns how long the link was down (s)"""
+        if self._disconnected_since is not None:
+            self.last_outage = time.perf_counter() - self._disconnected_since
+            self.disconnected_time += self.last_outage
+            self._disconnected_since = None
+            self._rate_t0 = time.perf_counter()  # do not spread the first frames over the outage
+            self._rate_frames = 0
+        return self.last_outage
+
+    def mark_disconnected(self):
+        if self._disconnected_since is None:
+            self._disconnected_since = time.perf_counter()
+
+    def rate(self):
+        """Frames per second; decays toward 0 while no frame closes the current window"""
+        dt = time.perf_counter() - self._rate_t0
+        if dt >= self.rate_window:
+            return self._rate_frames / dt
+        return self.frames_per_sec
+
+    def snapshot(self):
+        disconnected = self.disconnected_time
+        if self._disconnected_since is not None:
+            disconnected += time.perf_counter() - self._disconnected_since
+        return {
+            'frames_ok': self.frames_ok,
+            'frames_per_sec': self.rate(),
+            'timeouts': self.timeouts,
+            'short_reads': self.short_reads,
+            'length_errors': self.length_errors,
+            'crc_errors': self.crc_errors,
+            'resyncs': self.resyncs,
+            'reconnects': self.reconnects,
+            'bytes_tx': self.bytes_tx,
+            'bytes_rx': self.bytes_rx,
+            'disconnected_time': disconnected,
+            'last_outage': self.last_outage,
+            'rtt_last_ms': self.rtt_last,
+            'rtt_avg_ms': self._rtt_sum / self.frames_ok if self.frames_ok else 0.0,
+            'rtt_max_ms': self.rtt_max,
+            'rtt_hist': list(self.rtt_hist),
+        }
+
+
+def format_rtt_hist(hist):
+    """'<1ms:12 <2ms:3 ... >500ms:0' (empty buckets omitted)"""
+    labels = [f"<{b}ms" for b in RTT_BUCKETS_MS] + [f">{RTT_BUCKETS_MS[-1]}ms"]
+    return " ".join(f"{label}:{n}" for label, n in zip(labels, hist) if n)
@@ -0,0 +1,87 @@
+"""
+Bounded in-memory log for the GUI log view (no Qt dependency)
+
+LogRingHandler formats each record on the logging thread and appends it to
+a LogRing: a fixed-size deque of entries plus a bounded queue of entries
+the view has not shown yet. Nothing crosses into Qt per record; the GUI
+drains the pending queue once per frame and appends the batch in one
+document edit, and it can rebuild the view from the ring when the level or
+device filter changes. Memory is capped at `capacity` entries however long
+the application runs.
+"""
+
+import logging
+import threading
+from collections import deque, namedtuple
+
+DEFAULT_CAPACITY = 20000
+
+# Source module -> device name shown in the device filter
+MODULE_DEVICES = {
+    'motor_worker': 'servo',
+    'motor_driver': 'servo',
+    'ardu_worker': 'arduino',
+    'ardu_protocol': 'arduino',
+    'led_animation': 'arduino',
+    'dynamixel_worker': 'ring',
+    'dynamixel_driver': 'ring',
+}
+DEVICES = ('servo', 'arduino', 'ring', 'app')
+
+LogEntry = namedtuple('LogEntry', 'levelno device text')
+
+
+class LogRing:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._entries = deque(maxlen=capacity)
+        self._pending = deque(maxlen=capacity)
+        self.dropped = 0        # entries evicted from the pending queue before the view drained them
+
+    def append(self, entry):
+        with self._lock:
+            if len(self._pending) == self.capacity:
+                self.dropped += 1
+            self._entries.append(entry)
+            self._pending.append(entry)
+
+    def drain(self):
+        """Entries appended since the last drain, oldest first"""
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+        return pending
+
+    def entries(self, clear_pending=False):
+        """
+        Everything still in the ring, oldest first
+
+        Args:
+            clear_pending: also mark everything as shown (when the view rebuilds from the ring)
+        """
+        with self._lock:
+            if clear_pending:
+                self._pending.clear()
+            return list(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def matches(entry, min_level=logging.NOTSET, device=None):
+    return entry.levelno >= min_level and (device is None or entry.device == device)
+
+
+class LogRingHandler(logging.Handler):
+    def __init__(self, ring):
+        super().__init__()
+        self.ring = ring
+
+    def emit(self, record):
+        try:
+            text = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self.ring.append(LogEntry(record.levelno, MODULE_DEVICES.get(record.module, 'app'), text))
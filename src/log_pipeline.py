@@ -0,0 +1,145 @@
+"""
+Non-blocking logging pipeline
+
+The root logger gets a single EnqueueHandler. A logging call on a worker
+thread only builds the LogRecord and puts it on a queue; a QueueListener
+thread does the %-formatting and fans records out to the real handlers
+(GUI log ring, rotating file, console). Hot loops should log with lazy
+%-style arguments (logging.debug("x %s", value)) so nothing is formatted
+when the level is disabled, and guard costly argument construction with
+isEnabledFor().
+
+EnqueueHandler times every enqueue per thread so the cost a worker pays
+per loop iteration can be read off the diagnostics panel or measured with
+tools/bench_logging.py.
+"""
+
+import copy
+import sys
+import queue
+import logging
+import logging.handlers
+import threading
+import time
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_DATEFMT = '%H:%M:%S'
+FILE_FORMAT = '%(asctime)s - %(threadName)s - %(levelname)s - %(module)s - %(message)s'
+
+
+class EnqueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers formatting to the listener and records enqueue cost per thread"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self._stats_lock = threading.Lock()
+        self._stats = {}    # {thread name: [records, total seconds, max seconds]}
+
+    def prepare(self, record):
+        # The stock prepare() formats the message on the calling thread; only
+        # pin down what cannot safely cross threads (traceback objects, args
+        # that may be mutated after the call) and leave formatting to the listener.
+        mutable_args = record.args and not _immutable(record.args)
+        if not record.exc_info and not mutable_args:
+            return record   # common case: hand the record over untouched
+        record = copy.copy(record)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        if mutable_args:
+            record.msg = record.getMessage()  # mutable arguments: snapshot the text now
+            record.args = None
+        return record
+
+    def emit(self, record):
+        t0 = time.perf_counter()
+        super().emit(record)
+        elapsed = time.perf_counter() - t0
+        name = record.threadName
+        with self._stats_lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                self._stats[name] = [1, elapsed, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] = max(stats[2], elapsed)
+
+    def get_stats(self):
+        """{thread name: {'records', 'avg_us', 'max_us', 'total_ms'}}"""
+        with self._stats_lock:
+            return {name: {'records': n, 'avg_us': total / n * 1e6, 'max_us': peak * 1e6, 'total_ms': total * 1e3}
+                    for name, (n, total, peak) in self._stats.items()}
+
+
+def _immutable(args):
+    """True when every %-argument is a plain immutable value (safe to format later on another thread)"""
+    values = args.values() if isinstance(args, dict) else args
+    return all(isinstance(v, (str, int, float, bool, bytes, type(None))) for v in values)
+
+
+class LoggingPipeline:
+    def __init__(self, handlers, level=logging.INFO):
+        """
+        Route the root logger through a queue to handlers (formatted on the listener thread)
+
+        Args:
+            handlers: destination handlers, each with its own formatter and level
+            level: root logger level
+        """
+        self.queue = queue.SimpleQueue()
+        self.handler = EnqueueHandler(self.queue)
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(self.handler)
+        root.setLevel(level)
+        self.listener.start()
+
+    def stop(self):
+        """Flush queued records and detach (further records go nowhere until a new pipeline)"""
+        logging.getLogger().removeHandler(self.handler)
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+
+    def get_stats(self):
+        return self.handler.get_stats()
+
+
+def rotating_file_handler(path, max_bytes=1_000_000, backups=5):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding='utf-8')
+    handler.setFormatter(logging.Formatter(FILE_FORMAT))
+    return handler
+
+
+def console_handler(level=logging.INFO):
+    handler = logging.StreamHandler()
+    handler.setLevel(level)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+    return handler
+
+
+def config_handlers(log_config, base_dir):
+    """
+    File and console handlers from the "logging" config section
+
+    Args:
+        log_config: {"file", "max_bytes", "backups", "console"}; file is relative to base_dir, "" disables it
+        base_dir: application directory
+    """
+    handlers = []
+    log_file = log_config.get("file", "logs/outro.log")
+    if log_file:
+        try:
+            handlers.append(rotating_file_handler(base_dir / log_file,
+                                                  log_config.get("max_bytes", 1_000_000),
+                                                  log_config.get("backups", 5)))
+        except OSError as e:
+            print(f"Log file disabled: {e}", file=sys.stderr)
+    if log_config.get("console", True):
+        handlers.append(console_handler())
+    return handlers
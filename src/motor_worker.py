@@ -2,11 +2,12 @@ import threading
 import time
 import logging
 
+from src.status_notifier import StatusNotifier
 
 
 class MotorWorker(threading.Thread):
     def __init__(self, drv, base_schedule, cycle_period, tick=0.1):
-        super().__init__(daemon=True)
+        super().__init__(daemon=True, name="MotorWorker")
         self.drv = drv
         self.base_schedule = base_schedule
         self.cycle_period  = cycle_period
@@ -17,6 +18,7 @@ class MotorWorker(threading.Thread):
         self.cycle_idx = 0
         self.lock = threading.Lock()     # GUI ↔ 워커 공유 보호
         self.stat = {}                   # 최신 drv.poll 결과
+        self.notifier = StatusNotifier(volatile=('time',))  # 값이 바뀐 샘플만 GUI로 push
         self.t0 = 0
         self.looping = False
 
@@ -49,7 +51,8 @@ class MotorWorker(threading.Thread):
                 if cmd.kind == "MOVE":
                     with self.lock:
                         self.drv.move(cmd.deg, cmd.vel, cmd.acc, cmd.dwell)
-                    logging.info(f"MotorWorker: MOVE command at {cmd.t:.2f}s, deg={cmd.deg}, vel={cmd.vel}, acc={cmd.acc}, dwell={cmd.dwell}")
+                    logging.info("MotorWorker: MOVE command at %.2fs, deg=%s, vel=%s, acc=%s, dwell=%s",
+                                 cmd.t, cmd.deg, cmd.vel, cmd.acc, cmd.dwell)
                 elif cmd.kind == "RESTART":
                     shift = now_rel
                     self.queue = [c.shifted(shift) for c in self.base_schedule]
@@ -60,6 +63,7 @@ class MotorWorker(threading.Thread):
                 st = self.drv.poll()
                 st["time"] = now_rel
                 self.stat = st
+                self.notifier.publish(st)
                 
             # with self.lock:
             #     self.stat = st           # GUI 가 읽어갈 수 있게 저장
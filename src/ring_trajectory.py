@@ -0,0 +1,79 @@
+"""
+링 궤적 (시간 매개변수화된 각도/속도 프로파일)
+DynamixelWorker.stream_trajectory()가 미리 샘플링해 고정 주기로 스트리밍
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Setpoint:
+    t: float            # 궤적 시작 기준 시각 (초)
+    angle: float        # 시작 위치 기준 누적 각도 (도, 다중 회전, 반시계 +)
+    velocity: float     # 각속도 (도/초)
+
+
+class Trajectory:
+    """
+    구간별 궤적
+      - from_keyframes: (t, angle) 키프레임 사이를 선형 또는 smoothstep 보간
+      - from_velocity_profile: (t, velocity) 구간별 일정 속도를 적분
+    """
+
+    def __init__(self, times: Sequence[float], angles: Sequence[float], smooth: bool = False):
+        if len(times) < 2 or len(times) != len(angles):
+            raise ValueError("궤적에는 2개 이상의 (t, angle) 점이 필요합니다")
+        if any(b <= a for a, b in zip(times, times[1:])):
+            raise ValueError("궤적 시각은 증가해야 합니다")
+        self.times = [float(t) for t in times]
+        self.angles = [float(a) for a in angles]
+        self.smooth = smooth
+
+    @classmethod
+    def from_keyframes(cls, keyframes: Sequence[Tuple[float, float]], smooth: bool = True) -> "Trajectory":
+        """[(t, angle), ...] 키프레임 (smooth=True면 구간마다 가감속)"""
+        times, angles = zip(*keyframes)
+        return cls(times, angles, smooth)
+
+    @classmethod
+    def from_velocity_profile(cls, segments: Sequence[Tuple[float, float]], duration: float) -> "Trajectory":
+        """
+        [(t_start, velocity), ...] 구간별 일정 속도 (도/초), 마지막 구간은 duration까지
+        """
+        times = [float(t) for t, _ in segments] + [float(duration)]
+        angles = [0.0]
+        for (t0, v), t1 in zip(segments, times[1:]):
+            angles.append(angles[-1] + v * (t1 - t0))
+        return cls(times, angles, smooth=False)
+
+    @property
+    def duration(self) -> float:
+        return self.times[-1] - self.times[0]
+
+    def angle_at(self, t: float) -> float:
+        t = min(max(t + self.times[0], self.times[0]), self.times[-1])
+        i = min(bisect_right(self.times, t) - 1, len(self.times) - 2)
+        t0, t1 = self.times[i], self.times[i + 1]
+        a0, a1 = self.angles[i], self.angles[i + 1]
+        u = (t - t0) / (t1 - t0)
+        if self.smooth:
+            u = u * u * (3.0 - 2.0 * u)
+        return a0 + (a1 - a0) * u
+
+    def sample(self, rate: float) -> List[Setpoint]:
+        """rate(Hz) 고정 주기로 미리 샘플링 (마지막 점 포함)"""
+        period = 1.0 / rate
+        n = int(round(self.duration * rate))
+        angles = [self.angle_at(k * period) for k in range(n + 1)]
+        setpoints = []
+        for k, angle in enumerate(angles):
+            if 0 < k < n:
+                velocity = (angles[k + 1] - angles[k - 1]) / (2 * period)
+            elif n:
+                velocity = (angles[min(k + 1, n)] - angles[max(k - 1, 0)]) / period
+            else:
+                velocity = 0.0
+            setpoints.append(Setpoint(k * period, angle, velocity))
+        return setpoints
@@ -0,0 +1,94 @@
+"""
+Push-based status snapshots from worker threads (no Qt dependency)
+
+A worker publishes its status after each sample. The notifier freezes it
+into an immutable snapshot (read-only mappings, tuples) and swaps one
+reference, so readers never share a lock with the worker. Listeners are
+called only when a sample differs from the previous one and the consumer
+has taken everything published before, so a burst of samples produces one
+notification and an idle device produces none. Sample subscribers (e.g.
+telemetry recorders) see every new snapshot instead. The GUI-side Qt bridge
+lives in main.py.
+"""
+
+import threading
+from types import MappingProxyType
+
+
+def freeze(value):
+    """Deep read-only copy: dicts -> MappingProxyType, lists/tuples -> tuples"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class StatusNotifier:
+    def __init__(self, volatile=()):
+        """
+        Args:
+            volatile: top-level keys ignored when deciding whether a sample is
+                      new (timestamps, counters shown only in diagnostics)
+        """
+        self.volatile = frozenset(volatile)
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._sample_listeners = []
+        self._snapshot = None
+        self._seq = 0           # samples published
+        self._taken = 0         # seq of the last sample the consumer took
+
+    def subscribe(self, callback):
+        """callback() runs on the publishing thread and must not block"""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def subscribe_samples(self, callback):
+        """callback(snapshot) for every new sample, on the publishing thread (not coalesced)"""
+        with self._lock:
+            self._sample_listeners.append(callback)
+
+    def unsubscribe_samples(self, callback):
+        with self._lock:
+            if callback in self._sample_listeners:
+                self._sample_listeners.remove(callback)
+
+    def _same(self, a, b):
+        if a.keys() != b.keys():
+            return False
+        return all(a[key] == b[key] for key in a if key not in self.volatile)
+
+    def publish(self, status):
+        """Publish a status sample, returns False when it matches the previous one"""
+        snapshot = freeze(status)
+        with self._lock:
+            if self._snapshot is not None and self._same(self._snapshot, snapshot):
+                return False
+            self._snapshot = snapshot
+            self._seq += 1
+            # Only the first unseen sample notifies; later ones ride along with it
+            listeners = list(self._listeners) if self._seq == self._taken + 1 else ()
+            sample_listeners = list(self._sample_listeners)
+        for callback in sample_listeners:
+            callback(snapshot)
+        for callback in listeners:
+            callback()
+        return True
+
+    def latest(self):
+        """Most recent snapshot (None before the first publish), does not mark it taken"""
+        return self._snapshot
+
+    def take(self):
+        """Newest snapshot if one arrived since the last take(), else None (single consumer)"""
+        with self._lock:
+            if self._seq == self._taken:
+                return None
+            self._taken = self._seq
+            return self._snapshot
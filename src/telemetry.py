@@ -0,0 +1,131 @@
+"""
+Telemetry history for live plots (no Qt dependency)
+
+Each channel keeps two fixed-size NumPy rings allocated up front:
+  - raw     : the last raw_seconds of (t, value) samples
+  - history : one (min, max, last) envelope per block_seconds, for long spans
+so memory stays constant however long the application runs. Rendering asks
+for a min/max envelope decimated to one bin per screen column, so the cost
+of a frame depends on the plot width, not on how much data is visible.
+
+Samples arrive only when a value changes (StatusNotifier drops duplicates),
+so empty columns hold the last value; a NaN sample marks a gap (device
+disconnected) and is drawn as a break in the line.
+"""
+
+import threading
+
+import numpy as np
+
+
+class RingBuffer:
+    """Preallocated ring of rows of float64 columns; one writer, reader holds the channel lock"""
+
+    def __init__(self, capacity, columns=2):
+        self.capacity = int(capacity)
+        self.data = np.full((columns, self.capacity), np.nan)
+        self.head = 0       # next write index
+        self.count = 0
+
+    def append(self, *row):
+        self.data[:, self.head] = row
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def oldest_time(self):
+        if not self.count:
+            return None
+        return self.data[0, (self.head - self.count) % self.capacity]
+
+    def since(self, t0):
+        """Rows with t >= t0 plus the one before (for the held value), oldest first"""
+        if not self.count:
+            return self.data[:, :0]
+        if self.count < self.capacity:
+            ordered = self.data[:, :self.count]
+        else:
+            ordered = np.concatenate((self.data[:, self.head:], self.data[:, :self.head]), axis=1)
+        start = max(int(np.searchsorted(ordered[0], t0)) - 1, 0)
+        return ordered[:, start:]
+
+
+def decimate_minmax(t, lo, hi, last, t0, t1, bins):
+    """
+    Min/max envelope of sorted samples over [t0, t1) in `bins` equal columns
+
+    Args:
+        t: sample (or block) times, ascending
+        lo, hi: per-sample minimum/maximum (the value itself for raw samples)
+        last: value in effect after each sample (held across empty columns)
+
+    Returns:
+        (lo, hi) arrays of length bins, NaN where nothing is known
+    """
+    edges = np.linspace(t0, t1, bins + 1)
+    idx = np.searchsorted(t, edges)
+    starts, ends = idx[:-1], idx[1:]
+    nonempty = ends > starts
+    out_lo = np.full(bins, np.nan)
+    out_hi = np.full(bins, np.nan)
+
+    if nonempty.any():
+        s = starts[nonempty]
+        stop = ends[nonempty][-1]
+        # Empty bins contribute no samples, so consecutive non-empty starts delimit each bin
+        with np.errstate(invalid='ignore'):
+            out_lo[nonempty] = np.fmin.reduceat(lo[s[0]:stop], s - s[0])
+            out_hi[nonempty] = np.fmax.reduceat(hi[s[0]:stop], s - s[0])
+
+    # Hold the most recent value (including one sample before t0) through empty bins
+    last_idx = np.where(nonempty, ends - 1, -1)
+    last_idx = np.maximum.accumulate(np.concatenate(([starts[0] - 1], last_idx)))[1:]
+    held = ~nonempty & (last_idx >= 0)
+    out_lo[held] = out_hi[held] = last[last_idx[held]]
+    return out_lo, out_hi
+
+
+class TelemetryChannel:
+    def __init__(self, name, unit="", rate_hint=100.0, raw_seconds=60.0, block_seconds=1.0,
+                 history_seconds=4 * 3600.0):
+        """
+        Args:
+            rate_hint: expected maximum sample rate (Hz), sizes the raw ring
+            raw_seconds: span served from raw samples
+            block_seconds: envelope block length for the history ring
+            history_seconds: span served from envelope blocks
+        """
+        self.name = name
+        self.unit = unit
+        self.block_seconds = block_seconds
+        self.lock = threading.Lock()
+        self.raw = RingBuffer(raw_seconds * rate_hint, columns=2)                     # t, value
+        self.history = RingBuffer(history_seconds / block_seconds, columns=4)       # t, min, max, last
+        self._block = None  # [block start, min, max, last] being accumulated
+
+    def append(self, t, value):
+        """Add a sample (worker thread); value None or NaN marks a gap"""
+        value = np.nan if value is None else float(value)
+        with self.lock:
+            self.raw.append(t, value)
+            block = self._block
+            if block is not None and t - block[0] >= self.block_seconds:
+                self.history.append(*block)
+                block = None
+            if block is None:
+                self._block = [t, value, value, value]
+            else:
+                block[1] = np.fmin(block[1], value)
+                block[2] = np.fmax(block[2], value)
+                block[3] = value
+
+    def envelope(self, t0, t1, bins):
+        """(lo, hi) decimated to bins columns over [t0, t1) (GUI thread)"""
+        with self.lock:
+            oldest = self.raw.oldest_time()
+            if oldest is not None and oldest <= t0:
+                t, y = self.raw.since(t0)
+                return decimate_minmax(t, y, y, y, t0, t1, bins)
+            t, lo, hi, last = self.history.since(t0)
+            if self._block is not None:
+                t, lo, hi, last = np.concatenate(((t, lo, hi, last), np.array(self._block)[:, None]), axis=1)
+        return decimate_minmax(t, lo, hi, last, t0, t1, bins)
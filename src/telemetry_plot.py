@@ -0,0 +1,125 @@
+"""
+Scrolling telemetry strip chart (QPainter, no plotting library)
+
+One strip per TelemetryChannel, newest sample at the right edge. Each
+frame asks every channel for a min/max envelope with one bin per pixel
+column and draws it as a single polyline, so the cost per frame depends on
+the widget width only. The refresh timer runs only while the widget is
+actually on screen (not hidden, not minimized, not fully covered).
+"""
+
+import time
+
+import numpy as np
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import QTimer, QPointF, QEvent
+from PyQt5.QtGui import QPainter, QPen, QColor, QPolygonF
+
+STRIP_COLORS = ("#1f77b4", "#d62728", "#2ca02c", "#ff7f0e", "#9467bd", "#8c564b")
+SPANS = (10.0, 30.0, 60.0, 600.0, 3600.0, 4 * 3600.0)   # selectable time spans (s)
+
+
+class TelemetryPlot(QtWidgets.QWidget):
+    def __init__(self, channels, span=30.0, fps=30.0, parent=None):
+        super().__init__(parent)
+        self.channels = list(channels)
+        self.span = span
+        self.setMinimumHeight(60 * max(1, len(self.channels)))
+        self.timer = QTimer(self)
+        self.timer.setInterval(int(1000 / fps))
+        self.timer.timeout.connect(self._refresh)
+        self.frames = 0
+
+    # ── visibility: render only while on screen ───────────────
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start()
+        window = self.window()
+        if window is not self:
+            window.installEventFilter(self)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.WindowStateChange and obj is self.window():
+            if obj.isMinimized():
+                self.timer.stop()
+            elif self.isVisible():
+                self.timer.start()
+        return False
+
+    def _refresh(self):
+        if self.visibleRegion().isEmpty():
+            return
+        self.update()
+
+    def set_span(self, span):
+        self.span = span
+        self.update()
+
+    def mouseDoubleClickEvent(self, event):
+        """Double click cycles the visible time span"""
+        later = [s for s in SPANS if s > self.span]
+        self.set_span(later[0] if later else SPANS[0])
+
+    # ── drawing ───────────────────────────────────────────────
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().base())
+        if not self.channels:
+            return
+        self.frames += 1
+        width = max(1, self.width())
+        strip = self.height() / len(self.channels)
+        t1 = time.monotonic()
+        t0 = t1 - self.span
+        metrics = painter.fontMetrics()
+
+        for k, channel in enumerate(self.channels):
+            top = k * strip
+            lo, hi = channel.envelope(t0, t1, width)
+            painter.setPen(QPen(self.palette().mid().color()))
+            painter.drawLine(QPointF(0, top + strip - 0.5), QPointF(width, top + strip - 0.5))
+
+            valid = ~np.isnan(lo)
+            label = f"{channel.name}"
+            if valid.any():
+                y_min, y_max = float(np.min(lo[valid])), float(np.max(hi[valid]))
+                if y_max - y_min < 1e-9:
+                    y_min, y_max = y_min - 1.0, y_max + 1.0
+                pad = (y_max - y_min) * 0.1
+                y_min, y_max = y_min - pad, y_max + pad
+                scale = (strip - 4) / (y_max - y_min)
+                y_lo = top + 2 + (y_max - lo) * scale
+                y_hi = top + 2 + (y_max - hi) * scale
+
+                painter.setPen(QPen(QColor(STRIP_COLORS[k % len(STRIP_COLORS)]), 1))
+                for polygon in self._runs(valid, y_lo, y_hi):
+                    painter.drawPolyline(polygon)
+                last = hi[valid][-1]
+                label += f"  {last:.2f} {channel.unit}   [{y_min + pad:.1f} .. {y_max - pad:.1f}]"
+
+            painter.setPen(QPen(self.palette().text().color()))
+            painter.drawText(4, int(top + metrics.ascent() + 2), label)
+
+        painter.drawText(width - metrics.horizontalAdvance(f"{self.span:.0f} s") - 4,
+                         int(self.height() - 4), f"{self.span:.0f} s")
+
+    @staticmethod
+    def _runs(valid, y_lo, y_hi):
+        """Polylines through (x, hi) -> (x, lo) per column, split at NaN gaps"""
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], valid.astype(np.int8), [0]))))
+        for start, stop in zip(edges[::2], edges[1::2]):
+            n = stop - start
+            points = np.empty((n, 2, 2))
+            points[:, :, 0] = (np.arange(start, stop) + 0.5)[:, None]
+            points[:, 0, 1] = y_hi[start:stop]
+            points[:, 1, 1] = y_lo[start:stop]
+            # Fill the QPolygonF storage directly (2n QPointF of two doubles) instead of per-point objects
+            polygon = QPolygonF(2 * n)
+            buffer = polygon.data()
+            buffer.setsize(points.nbytes)
+            memoryview(buffer)[:] = points.tobytes()
+            yield polygon
@@ -0,0 +1,450 @@
+# Generated from resource/mainwindow.ui by tools/build_ui.py - do not edit,
+# edit the .ui file and run python tools/build_ui.py again.
+UI_SHA256 = "be786960b9277906b2845919fc069d5130099e8cb74ee983fae9d04540ab796f"
+
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'resource/mainwindow.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(761, 512)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.frame = QtWidgets.QFrame(self.centralwidget)
+        self.frame.setGeometry(QtCore.QRect(20, 20, 441, 181))
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.label_7 = QtWidgets.QLabel(self.frame)
+        self.label_7.setGeometry(QtCore.QRect(10, 10, 56, 12))
+        self.label_7.setObjectName("label_7")
+        self.layoutWidget = QtWidgets.QWidget(self.frame)
+        self.layoutWidget.setGeometry(QtCore.QRect(10, 20, 419, 31))
+        self.layoutWidget.setObjectName("layoutWidget")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout(self.layoutWidget)
+        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.label_5 = QtWidgets.QLabel(self.layoutWidget)
+        self.label_5.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout_5.addWidget(self.label_5)
+        self.label_time = QtWidgets.QLabel(self.layoutWidget)
+        self.label_time.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_time.setObjectName("label_time")
+        self.horizontalLayout_5.addWidget(self.label_time)
+        self.label_9 = QtWidgets.QLabel(self.layoutWidget)
+        self.label_9.setText("")
+        self.label_9.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_9.setObjectName("label_9")
+        self.horizontalLayout_5.addWidget(self.label_9)
+        self.label_14 = QtWidgets.QLabel(self.layoutWidget)
+        self.label_14.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_14.setObjectName("label_14")
+        self.horizontalLayout_5.addWidget(self.label_14)
+        self.label_connect = QtWidgets.QLabel(self.layoutWidget)
+        self.label_connect.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_connect.setObjectName("label_connect")
+        self.horizontalLayout_5.addWidget(self.label_connect)
+        self.label_13 = QtWidgets.QLabel(self.layoutWidget)
+        self.label_13.setText("")
+        self.label_13.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_13.setObjectName("label_13")
+        self.horizontalLayout_5.addWidget(self.label_13)
+        self.label_24 = QtWidgets.QLabel(self.layoutWidget)
+        self.label_24.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_24.setObjectName("label_24")
+        self.horizontalLayout_5.addWidget(self.label_24)
+        self.label_arduino_status = QtWidgets.QLabel(self.layoutWidget)
+        self.label_arduino_status.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_arduino_status.setObjectName("label_arduino_status")
+        self.horizontalLayout_5.addWidget(self.label_arduino_status)
+        self.horizontalLayoutWidget = QtWidgets.QWidget(self.frame)
+        self.horizontalLayoutWidget.setGeometry(QtCore.QRect(10, 60, 421, 51))
+        self.horizontalLayoutWidget.setObjectName("horizontalLayoutWidget")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.horizontalLayoutWidget)
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.label_3 = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_3.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout_2.addWidget(self.label_3)
+        self.label_q = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_q.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_q.setObjectName("label_q")
+        self.verticalLayout_2.addWidget(self.label_q)
+        self.horizontalLayout_2.addLayout(self.verticalLayout_2)
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.label_8 = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_8.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_8.setObjectName("label_8")
+        self.verticalLayout_4.addWidget(self.label_8)
+        self.label_cnt = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_cnt.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_cnt.setObjectName("label_cnt")
+        self.verticalLayout_4.addWidget(self.label_cnt)
+        self.horizontalLayout_2.addLayout(self.verticalLayout_4)
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.label_4 = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_4.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout_5.addWidget(self.label_4)
+        self.label_qdot = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_qdot.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_qdot.setObjectName("label_qdot")
+        self.verticalLayout_5.addWidget(self.label_qdot)
+        self.horizontalLayout_2.addLayout(self.verticalLayout_5)
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.label_6 = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_6.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_6.setObjectName("label_6")
+        self.verticalLayout_6.addWidget(self.label_6)
+        self.label_torque = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_torque.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_torque.setObjectName("label_torque")
+        self.verticalLayout_6.addWidget(self.label_torque)
+        self.horizontalLayout_2.addLayout(self.verticalLayout_6)
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.label_10 = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_10.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_10.setObjectName("label_10")
+        self.verticalLayout_7.addWidget(self.label_10)
+        self.label_rdy = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_rdy.setText("")
+        self.label_rdy.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_rdy.setObjectName("label_rdy")
+        self.verticalLayout_7.addWidget(self.label_rdy)
+        self.horizontalLayout_2.addLayout(self.verticalLayout_7)
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.label_11 = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_11.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_11.setObjectName("label_11")
+        self.verticalLayout_8.addWidget(self.label_11)
+        self.label_run = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_run.setText("")
+        self.label_run.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_run.setObjectName("label_run")
+        self.verticalLayout_8.addWidget(self.label_run)
+        self.horizontalLayout_2.addLayout(self.verticalLayout_8)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.label_12 = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_12.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_12.setObjectName("label_12")
+        self.verticalLayout_3.addWidget(self.label_12)
+        self.label_err = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_err.setText("")
+        self.label_err.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_err.setObjectName("label_err")
+        self.verticalLayout_3.addWidget(self.label_err)
+        self.horizontalLayout_2.addLayout(self.verticalLayout_3)
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.label_15 = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_15.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_15.setObjectName("label_15")
+        self.verticalLayout_9.addWidget(self.label_15)
+        self.label_hom = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_hom.setText("")
+        self.label_hom.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_hom.setObjectName("label_hom")
+        self.verticalLayout_9.addWidget(self.label_hom)
+        self.horizontalLayout_2.addLayout(self.verticalLayout_9)
+        self.horizontalLayoutWidget_2 = QtWidgets.QWidget(self.frame)
+        self.horizontalLayoutWidget_2.setGeometry(QtCore.QRect(10, 120, 421, 51))
+        self.horizontalLayoutWidget_2.setObjectName("horizontalLayoutWidget_2")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout(self.horizontalLayoutWidget_2)
+        self.horizontalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.label_16 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_16.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_16.setObjectName("label_16")
+        self.verticalLayout_10.addWidget(self.label_16)
+        self.label_led1 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_led1.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_led1.setObjectName("label_led1")
+        self.verticalLayout_10.addWidget(self.label_led1)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_10)
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.label_17 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_17.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_17.setObjectName("label_17")
+        self.verticalLayout_11.addWidget(self.label_17)
+        self.label_led2 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_led2.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_led2.setObjectName("label_led2")
+        self.verticalLayout_11.addWidget(self.label_led2)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_11)
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.label_18 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_18.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_18.setObjectName("label_18")
+        self.verticalLayout_12.addWidget(self.label_18)
+        self.label_led3 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_led3.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_led3.setObjectName("label_led3")
+        self.verticalLayout_12.addWidget(self.label_led3)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_12)
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.label_19 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_19.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_19.setObjectName("label_19")
+        self.verticalLayout_13.addWidget(self.label_19)
+        self.label_led4 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_led4.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_led4.setObjectName("label_led4")
+        self.verticalLayout_13.addWidget(self.label_led4)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_13)
+        self.verticalLayout_14 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_14.setObjectName("verticalLayout_14")
+        self.label_20 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_20.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_20.setObjectName("label_20")
+        self.verticalLayout_14.addWidget(self.label_20)
+        self.label_led5 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_led5.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_led5.setObjectName("label_led5")
+        self.verticalLayout_14.addWidget(self.label_led5)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_14)
+        self.verticalLayout_15 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_15.setObjectName("verticalLayout_15")
+        self.label_21 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_21.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_21.setObjectName("label_21")
+        self.verticalLayout_15.addWidget(self.label_21)
+        self.label_led6 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_led6.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_led6.setObjectName("label_led6")
+        self.verticalLayout_15.addWidget(self.label_led6)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_15)
+        self.verticalLayout_16 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_16.setObjectName("verticalLayout_16")
+        self.label_22 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_22.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_22.setObjectName("label_22")
+        self.verticalLayout_16.addWidget(self.label_22)
+        self.label_sw1 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_sw1.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_sw1.setObjectName("label_sw1")
+        self.verticalLayout_16.addWidget(self.label_sw1)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_16)
+        self.verticalLayout_17 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_17.setObjectName("verticalLayout_17")
+        self.label_23 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_23.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_23.setObjectName("label_23")
+        self.verticalLayout_17.addWidget(self.label_23)
+        self.label_sw2 = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_sw2.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_sw2.setObjectName("label_sw2")
+        self.verticalLayout_17.addWidget(self.label_sw2)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_17)
+        self.pushButton_connect = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_connect.setGeometry(QtCore.QRect(480, 20, 151, 41))
+        self.pushButton_connect.setObjectName("pushButton_connect")
+        self.pushButton_runloop = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_runloop.setGeometry(QtCore.QRect(480, 170, 151, 41))
+        self.pushButton_runloop.setObjectName("pushButton_runloop")
+        self.pushButton_estop = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_estop.setGeometry(QtCore.QRect(650, 120, 91, 91))
+        self.pushButton_estop.setObjectName("pushButton_estop")
+        self.pushButton_homing = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_homing.setGeometry(QtCore.QRect(480, 120, 151, 41))
+        self.pushButton_homing.setObjectName("pushButton_homing")
+        self.pushButton_gozero = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_gozero.setGeometry(QtCore.QRect(200, 212, 81, 41))
+        self.pushButton_gozero.setObjectName("pushButton_gozero")
+        self.lineEdit = QtWidgets.QLineEdit(self.centralwidget)
+        self.lineEdit.setGeometry(QtCore.QRect(110, 262, 81, 31))
+        self.lineEdit.setObjectName("lineEdit")
+        self.label = QtWidgets.QLabel(self.centralwidget)
+        self.label.setGeometry(QtCore.QRect(30, 262, 71, 31))
+        self.label.setObjectName("label")
+        self.pushButton_zoffset = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_zoffset.setGeometry(QtCore.QRect(200, 262, 111, 31))
+        self.pushButton_zoffset.setObjectName("pushButton_zoffset")
+        self.pushButton_m2 = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_m2.setGeometry(QtCore.QRect(290, 212, 81, 41))
+        self.pushButton_m2.setObjectName("pushButton_m2")
+        self.pushButton_m1 = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_m1.setGeometry(QtCore.QRect(110, 212, 81, 41))
+        self.pushButton_m1.setObjectName("pushButton_m1")
+        self.pushButton_m3 = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_m3.setGeometry(QtCore.QRect(380, 212, 81, 41))
+        self.pushButton_m3.setObjectName("pushButton_m3")
+        self.pushButton_m0 = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_m0.setGeometry(QtCore.QRect(20, 212, 81, 41))
+        self.pushButton_m0.setObjectName("pushButton_m0")
+        self.pushButton_zoffset_save = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_zoffset_save.setGeometry(QtCore.QRect(320, 262, 111, 31))
+        self.pushButton_zoffset_save.setObjectName("pushButton_zoffset_save")
+        self.pushButton_motoron = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_motoron.setGeometry(QtCore.QRect(650, 20, 91, 91))
+        self.pushButton_motoron.setObjectName("pushButton_motoron")
+        self.pushButton_arduino_connect = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_arduino_connect.setGeometry(QtCore.QRect(480, 70, 151, 41))
+        self.pushButton_arduino_connect.setObjectName("pushButton_arduino_connect")
+        self.textBrowser = QtWidgets.QTextBrowser(self.centralwidget)
+        self.textBrowser.setGeometry(QtCore.QRect(20, 311, 441, 181))
+        self.textBrowser.setObjectName("textBrowser")
+        self.pushButton_ledon = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_ledon.setGeometry(QtCore.QRect(480, 220, 71, 31))
+        self.pushButton_ledon.setObjectName("pushButton_ledon")
+        self.pushButton_ledoff = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_ledoff.setGeometry(QtCore.QRect(560, 220, 71, 31))
+        self.pushButton_ledoff.setObjectName("pushButton_ledoff")
+        self.lineEdit_led = QtWidgets.QLineEdit(self.centralwidget)
+        self.lineEdit_led.setGeometry(QtCore.QRect(560, 260, 71, 31))
+        self.lineEdit_led.setObjectName("lineEdit_led")
+        self.pushButton_ledcmd = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_ledcmd.setGeometry(QtCore.QRect(650, 260, 91, 31))
+        self.pushButton_ledcmd.setObjectName("pushButton_ledcmd")
+        self.spinBox_led = QtWidgets.QSpinBox(self.centralwidget)
+        self.spinBox_led.setGeometry(QtCore.QRect(480, 261, 71, 31))
+        self.spinBox_led.setMaximum(5)
+        self.spinBox_led.setObjectName("spinBox_led")
+        self.pushButton_ringp1 = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_ringp1.setGeometry(QtCore.QRect(480, 340, 151, 31))
+        self.pushButton_ringp1.setObjectName("pushButton_ringp1")
+        self.pushButton_ringp2 = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_ringp2.setGeometry(QtCore.QRect(480, 380, 151, 31))
+        self.pushButton_ringp2.setObjectName("pushButton_ringp2")
+        self.lineEdit_ringpos1 = QtWidgets.QLineEdit(self.centralwidget)
+        self.lineEdit_ringpos1.setGeometry(QtCore.QRect(650, 340, 91, 31))
+        self.lineEdit_ringpos1.setObjectName("lineEdit_ringpos1")
+        self.lineEidit_ringpos2 = QtWidgets.QLineEdit(self.centralwidget)
+        self.lineEidit_ringpos2.setGeometry(QtCore.QRect(650, 380, 91, 31))
+        self.lineEidit_ringpos2.setObjectName("lineEidit_ringpos2")
+        self.pushButton_ringpos_save = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_ringpos_save.setGeometry(QtCore.QRect(650, 420, 91, 31))
+        self.pushButton_ringpos_save.setObjectName("pushButton_ringpos_save")
+        self.pushButton_ringc = QtWidgets.QPushButton(self.centralwidget)
+        self.pushButton_ringc.setGeometry(QtCore.QRect(480, 420, 151, 31))
+        self.pushButton_ringc.setObjectName("pushButton_ringc")
+        self.label_ring_status = QtWidgets.QLabel(self.centralwidget)
+        self.label_ring_status.setGeometry(QtCore.QRect(480, 480, 31, 20))
+        self.label_ring_status.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_ring_status.setObjectName("label_ring_status")
+        self.label_ring_angle = QtWidgets.QLabel(self.centralwidget)
+        self.label_ring_angle.setGeometry(QtCore.QRect(590, 480, 41, 20))
+        self.label_ring_angle.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_ring_angle.setObjectName("label_ring_angle")
+        self.label_ring_moving = QtWidgets.QLabel(self.centralwidget)
+        self.label_ring_moving.setGeometry(QtCore.QRect(520, 480, 31, 20))
+        self.label_ring_moving.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_ring_moving.setObjectName("label_ring_moving")
+        self.label_ring_position = QtWidgets.QLabel(self.centralwidget)
+        self.label_ring_position.setGeometry(QtCore.QRect(650, 480, 41, 20))
+        self.label_ring_position.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_ring_position.setObjectName("label_ring_position")
+        self.label_ring_angle_2 = QtWidgets.QLabel(self.centralwidget)
+        self.label_ring_angle_2.setGeometry(QtCore.QRect(590, 460, 41, 20))
+        self.label_ring_angle_2.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_ring_angle_2.setObjectName("label_ring_angle_2")
+        self.label_ring_angle_3 = QtWidgets.QLabel(self.centralwidget)
+        self.label_ring_angle_3.setGeometry(QtCore.QRect(520, 460, 31, 20))
+        self.label_ring_angle_3.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_ring_angle_3.setObjectName("label_ring_angle_3")
+        self.label_ring_position_2 = QtWidgets.QLabel(self.centralwidget)
+        self.label_ring_position_2.setGeometry(QtCore.QRect(650, 460, 41, 20))
+        self.label_ring_position_2.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_ring_position_2.setObjectName("label_ring_position_2")
+        self.label_ring_angle_4 = QtWidgets.QLabel(self.centralwidget)
+        self.label_ring_angle_4.setGeometry(QtCore.QRect(480, 460, 31, 20))
+        self.label_ring_angle_4.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_ring_angle_4.setObjectName("label_ring_angle_4")
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.label_7.setText(_translate("MainWindow", "Status"))
+        self.label_5.setText(_translate("MainWindow", "Time"))
+        self.label_time.setText(_translate("MainWindow", "0.0"))
+        self.label_14.setText(_translate("MainWindow", "Motor"))
+        self.label_connect.setText(_translate("MainWindow", "NO"))
+        self.label_24.setText(_translate("MainWindow", "Serial"))
+        self.label_arduino_status.setText(_translate("MainWindow", "NO"))
+        self.label_3.setText(_translate("MainWindow", "q (deg)"))
+        self.label_q.setText(_translate("MainWindow", "0.0"))
+        self.label_8.setText(_translate("MainWindow", "cnt"))
+        self.label_cnt.setText(_translate("MainWindow", "0"))
+        self.label_4.setText(_translate("MainWindow", "qv(°/s)"))
+        self.label_qdot.setText(_translate("MainWindow", "0.0"))
+        self.label_6.setText(_translate("MainWindow", "Torque"))
+        self.label_torque.setText(_translate("MainWindow", "0.0"))
+        self.label_10.setText(_translate("MainWindow", "RDY"))
+        self.label_11.setText(_translate("MainWindow", "RUN"))
+        self.label_12.setText(_translate("MainWindow", "ERR"))
+        self.label_15.setText(_translate("MainWindow", "HOM"))
+        self.label_16.setText(_translate("MainWindow", "LED1"))
+        self.label_led1.setText(_translate("MainWindow", "0"))
+        self.label_17.setText(_translate("MainWindow", "LED2"))
+        self.label_led2.setText(_translate("MainWindow", "0"))
+        self.label_18.setText(_translate("MainWindow", "LED3"))
+        self.label_led3.setText(_translate("MainWindow", "0"))
+        self.label_19.setText(_translate("MainWindow", "LED4"))
+        self.label_led4.setText(_translate("MainWindow", "0"))
+        self.label_20.setText(_translate("MainWindow", "LED5"))
+        self.label_led5.setText(_translate("MainWindow", "0"))
+        self.label_21.setText(_translate("MainWindow", "LED6"))
+        self.label_led6.setText(_translate("MainWindow", "0"))
+        self.label_22.setText(_translate("MainWindow", "SW1"))
+        self.label_sw1.setText(_translate("MainWindow", "0"))
+        self.label_23.setText(_translate("MainWindow", "SW2"))
+        self.label_sw2.setText(_translate("MainWindow", "0"))
+        self.pushButton_connect.setText(_translate("MainWindow", "MOTOR CONNECT"))
+        self.pushButton_runloop.setText(_translate("MainWindow", "RUN LOOP"))
+        self.pushButton_estop.setText(_translate("MainWindow", "E STOP"))
+        self.pushButton_homing.setText(_translate("MainWindow", "HOMING"))
+        self.pushButton_gozero.setText(_translate("MainWindow", "GO ZERO"))
+        self.label.setText(_translate("MainWindow", "Z OFFSET"))
+        self.pushButton_zoffset.setText(_translate("MainWindow", "SEND Z OFFSET"))
+        self.pushButton_m2.setText(_translate("MainWindow", "MOVE +0.05"))
+        self.pushButton_m1.setText(_translate("MainWindow", "MOVE -0.05"))
+        self.pushButton_m3.setText(_translate("MainWindow", "MOVE +0.1"))
+        self.pushButton_m0.setText(_translate("MainWindow", "MOVE -0.1"))
+        self.pushButton_zoffset_save.setText(_translate("MainWindow", "SAVE Z OFFSET"))
+        self.pushButton_motoron.setText(_translate("MainWindow", "MOTOR ON"))
+        self.pushButton_arduino_connect.setText(_translate("MainWindow", "ARDUINO CONNECT"))
+        self.pushButton_ledon.setText(_translate("MainWindow", "LED ON"))
+        self.pushButton_ledoff.setText(_translate("MainWindow", "LED OFF"))
+        self.pushButton_ledcmd.setText(_translate("MainWindow", "LED CMD"))
+        self.spinBox_led.setPrefix(_translate("MainWindow", "led"))
+        self.pushButton_ringp1.setText(_translate("MainWindow", "RING POS 1"))
+        self.pushButton_ringp2.setText(_translate("MainWindow", "RING POS 2"))
+        self.pushButton_ringpos_save.setText(_translate("MainWindow", "SAVE"))
+        self.pushButton_ringc.setText(_translate("MainWindow", "RING CON"))
+        self.label_ring_status.setText(_translate("MainWindow", "0"))
+        self.label_ring_angle.setText(_translate("MainWindow", "0"))
+        self.label_ring_moving.setText(_translate("MainWindow", "0"))
+        self.label_ring_position.setText(_translate("MainWindow", "0"))
+        self.label_ring_angle_2.setText(_translate("MainWindow", "angle"))
+        self.label_ring_angle_3.setText(_translate("MainWindow", "mov"))
+        self.label_ring_position_2.setText(_translate("MainWindow", "rev"))
+        self.label_ring_angle_4.setText(_translate("MainWindow", "stat"))
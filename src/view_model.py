@@ -0,0 +1,109 @@
+"""
+Diff-based widget rendering for the GUI thread
+
+WidgetCache remembers the last text and enabled state it applied to each
+widget and skips setText()/setEnabled() when nothing changed, so a repaint
+only touches widgets whose value moved. Widgets are duck-typed (anything
+with setText/setEnabled), keeping this module free of Qt imports. Every
+write to a cached widget must go through the cache, otherwise the cached
+value goes stale; call invalidate() after touching a widget directly.
+
+FrameTimer measures wall and GUI-thread CPU time per rendered frame so the
+saving can be read off the diagnostics panel.
+"""
+
+import time
+
+
+class WidgetCache:
+    def __init__(self, enabled=True):
+        """
+        Args:
+            enabled: False applies every write (for A/B frame-time comparison)
+        """
+        self.enabled = enabled
+        self._text = {}
+        self._state = {}
+        self.applied = 0
+        self.skipped = 0
+
+    def set_text(self, widget, text):
+        """Apply text if it differs from the last one applied, returns True when applied"""
+        if self.enabled and self._text.get(widget) == text:
+            self.skipped += 1
+            return False
+        widget.setText(text)
+        self._text[widget] = text
+        self.applied += 1
+        return True
+
+    def set_enabled(self, widget, enabled):
+        enabled = bool(enabled)
+        if self.enabled and self._state.get(widget) is enabled:
+            self.skipped += 1
+            return False
+        widget.setEnabled(enabled)
+        self._state[widget] = enabled
+        self.applied += 1
+        return True
+
+    def invalidate(self, widget=None):
+        """Forget cached values (one widget, or all) so the next write is applied"""
+        if widget is None:
+            self._text.clear()
+            self._state.clear()
+        else:
+            self._text.pop(widget, None)
+            self._state.pop(widget, None)
+
+    def stats(self):
+        return {'applied': self.applied, 'skipped': self.skipped}
+
+
+class FrameTimer:
+    def __init__(self, window=1.0):
+        """
+        Args:
+            window: seconds per reporting window (avg/max reset each window)
+        """
+        self.window = window
+        self.frames = 0
+        self._reset(time.perf_counter())
+        self.report = {'frames_per_sec': 0.0, 'avg_ms': 0.0, 'max_ms': 0.0, 'cpu_pct': 0.0}
+
+    def _reset(self, now):
+        self._window_start = now
+        self._count = 0
+        self._wall = 0.0
+        self._max = 0.0
+        self._cpu = 0.0
+
+    def start(self):
+        """Returns a token for stop(); wrap each GUI-thread render in start()/stop()"""
+        return time.perf_counter(), time.thread_time()
+
+    def stop(self, token):
+        wall0, cpu0 = token
+        now = time.perf_counter()
+        wall = now - wall0
+        self.frames += 1
+        self._count += 1
+        self._wall += wall
+        self._cpu += time.thread_time() - cpu0
+        self._max = max(self._max, wall)
+
+        elapsed = now - self._window_start
+        if elapsed >= self.window:
+            self.report = {
+                'frames_per_sec': self._count / elapsed,
+                'avg_ms': self._wall / self._count * 1000.0,
+                'max_ms': self._max * 1000.0,
+                'cpu_pct': self._cpu / elapsed * 100.0,
+            }
+            self._reset(now)
+
+    def get_report(self):
+        """Last full window's figures, zeros once no frame has been rendered for a window"""
+        if time.perf_counter() - self._window_start >= 2 * self.window:
+            return {'frames_per_sec': 0.0, 'avg_ms': 0.0, 'max_ms': 0.0, 'cpu_pct': 0.0}
+        return dict(self.report)
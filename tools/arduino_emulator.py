@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Arduino firmware emulator behind a Linux pseudo-terminal
+
+Speaks the 8-byte request/response protocol used by ArduinoWorker:
+  request : [Signal][B1][B2][B3][B4][B5][B6][CRC]
+  response: [DigitalOutput][B1][B2][B3][B4][B5][SwitchStates][CRC]
+The request CRC covers bytes 0-5 and the response CRC bytes 0-6, exactly as
+calculate_crc() produces them on the PC side.
+
+With --protocol 2 it also answers HELLO and serves v2 frames (src/ardu_protocol.py)
+while still accepting v1 frames, like updated firmware would.
+
+Usage:
+  python tools/arduino_emulator.py --link /tmp/ttyARDUINO --latency 0.002
+  (then set ports.arduino in config.json to /tmp/ttyARDUINO)
+"""
+
+import os
+import sys
+import time
+import tty
+import random
+import select
+import logging
+import argparse
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.ardu_worker import calculate_crc  # noqa: E402
+from src.ardu_protocol import (SYNC, HEADER_LEN, PROTOCOL_V2, MSG_HELLO, MSG_UPDATE, MSG_FULL,  # noqa: E402
+                               MSG_HELLO_ACK, MSG_STATUS, crc8, encode, decode_update)
+
+FRAME_LEN = 8
+
+
+class ArduinoEmulator(threading.Thread):
+    def __init__(self, link=None, latency=0.0, drop_rate=0.0, crc_error_rate=0.0, seed=None,
+                 protocol=1, channels=6):
+        """
+        Args:
+            link: optional stable symlink to the pty slave (survives unplug/replug)
+            protocol: 1 = original firmware, 2 = also answers v2 HELLO/UPDATE/FULL
+            channels: LED channel count reported in HELLO_ACK (v2 only)
+            latency: response delay in seconds
+            drop_rate: probability of dropping one byte from a response
+            crc_error_rate: probability of sending a response with a corrupted CRC
+        """
+        super().__init__(daemon=True)
+        self.link = link
+        self.latency = latency
+        self.drop_rate = drop_rate
+        self.crc_error_rate = crc_error_rate
+        self.rng = random.Random(seed)
+        self.protocol = protocol
+        self.channels = channels if protocol >= PROTOCOL_V2 else 6
+
+        self.lock = threading.Lock()
+        self.stop_evt = threading.Event()
+        self.plugged = threading.Event()
+
+        # Firmware state
+        self.signal = 0
+        self.brightness = [0] * self.channels
+        self.switch_states = 0
+        self._script = []  # [(monotonic time, switch_states)], sorted
+
+        # Counters
+        self.frames_rx = 0
+        self.frames_bad = 0
+        self.frames_tx = 0
+
+        self.master_fd = None
+        self.slave_fd = None
+        self.port = None
+        self._open_pty()
+
+    # ── pty handling ────────────────────────────────────────
+    def _open_pty(self):
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)
+        self.port = os.ttyname(self.slave_fd)
+        if self.link:
+            tmp = self.link + ".tmp"
+            if os.path.lexists(tmp):
+                os.unlink(tmp)
+            os.symlink(self.port, tmp)
+            os.replace(tmp, self.link)
+        self.plugged.set()
+        logging.info(f"Arduino emulator on {self.port}" + (f" ({self.link})" if self.link else ""))
+
+    def _close_pty(self):
+        self.plugged.clear()
+        for fd in (self.master_fd, self.slave_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.master_fd = self.slave_fd = None
+
+    @property
+    def device(self):
+        """Path the client should open (symlink if configured)"""
+        return self.link or self.port
+
+    def unplug(self):
+        """Simulate a USB unplug: the client sees I/O errors until replug()"""
+        with self.lock:
+            self._close_pty()
+            if self.link and os.path.lexists(self.link):
+                os.unlink(self.link)
+        logging.info("Arduino emulator unplugged")
+
+    def replug(self):
+        with self.lock:
+            if self.master_fd is None:
+                self._open_pty()
+
+    # ── scripting ───────────────────────────────────────────
+    def set_switches(self, states):
+        with self.lock:
+            self.switch_states = states & 0xFF
+
+    def press_switch(self, mask, duration=0.1, delay=0.0):
+        """Schedule a switch press (bit mask) for duration seconds, starting after delay"""
+        t = time.monotonic() + delay
+        self.schedule([(t, mask, True), (t + duration, mask, False)])
+
+    def schedule(self, events):
+        """events: [(monotonic time, mask, pressed)]"""
+        with self.lock:
+            self._script.extend(events)
+            self._script.sort(key=lambda e: e[0])
+
+    def _run_script(self):
+        now = time.monotonic()
+        while self._script and self._script[0][0] <= now:
+            _, mask, pressed = self._script.pop(0)
+            if pressed:
+                self.switch_states |= mask
+            else:
+                self.switch_states &= ~mask & 0xFF
+
+    # ── firmware ────────────────────────────────────────────
+    def _next_frame(self, buf):
+        """
+        Split one request off buf. Returns (frame, version) or (None, None) when
+        more bytes are needed. v2 frames start with SYNC; anything else is v1.
+        """
+        if self.protocol >= PROTOCOL_V2 and buf and buf[0] == SYNC:
+            if len(buf) < HEADER_LEN:
+                return None, None
+            n = HEADER_LEN + buf[3] + 1
+            if len(buf) < n:
+                return None, None
+            frame = bytes(buf[:n])
+            del buf[:n]
+            return frame, 2
+        if len(buf) < FRAME_LEN:
+            return None, None
+        frame = bytes(buf[:FRAME_LEN])
+        del buf[:FRAME_LEN]
+        return frame, 1
+
+    def _handle_v1(self, frame):
+        if calculate_crc(frame[:7]) != frame[7]:
+            return None
+
+        self.signal = frame[0]
+        self.brightness[:6] = frame[1:7]
+        response = bytearray([self.signal]) + bytearray(self.brightness[:5]) + bytearray([self.switch_states])
+        response.append(calculate_crc(response + b"\x00"))
+        return response
+
+    def _handle_v2(self, frame):
+        if crc8(frame[1:-1]) != frame[-1]:
+            return None
+
+        msg_type, seq, payload = frame[1], frame[2], frame[4:-1]
+        if msg_type == MSG_HELLO:
+            return bytearray(encode(MSG_HELLO_ACK, seq, bytes([PROTOCOL_V2, self.channels])))
+        if msg_type == MSG_UPDATE and payload:
+            self.signal = decode_update(payload, self.brightness)
+        elif msg_type == MSG_FULL and payload:
+            self.signal = payload[0]
+            values = payload[1:1 + self.channels]
+            self.brightness[:len(values)] = values
+        else:
+            return None
+        return bytearray(encode(MSG_STATUS, seq, bytes([self.signal, self.switch_states])))
+
+    def _handle_frame(self, frame, version=1):
+        self.frames_rx += 1
+        response = self._handle_v2(frame) if version == 2 else self._handle_v1(frame)
+        if response is None:
+            self.frames_bad += 1
+            return None
+
+        if self.crc_error_rate and self.rng.random() < self.crc_error_rate:
+            response[-1] ^= 0xFF
+        if self.drop_rate and self.rng.random() < self.drop_rate:
+            del response[self.rng.randrange(len(response))]
+        return bytes(response)
+
+    def stop(self):
+        self.stop_evt.set()
+
+    def run(self):
+        buf = bytearray()
+        while not self.stop_evt.is_set():
+            if not self.plugged.wait(0.05):
+                buf.clear()
+                continue
+
+            with self.lock:
+                fd = self.master_fd
+            if fd is None:
+                continue
+            try:
+                ready, _, _ = select.select([fd], [], [], 0.01)
+                if not ready:
+                    with self.lock:
+                        self._run_script()
+                    continue
+                buf += os.read(fd, 256)
+            except OSError:
+                continue
+
+            while True:
+                frame, version = self._next_frame(buf)
+                if frame is None:
+                    break
+                with self.lock:
+                    self._run_script()
+                    response = self._handle_frame(frame, version)
+                if response is None:
+                    continue
+                if self.latency:
+                    time.sleep(self.latency)
+                try:
+                    os.write(fd, response)
+                    self.frames_tx += 1
+                except OSError:
+                    break
+
+        with self.lock:
+            self._close_pty()
+            if self.link and os.path.lexists(self.link):
+                os.unlink(self.link)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arduino firmware emulator (pty)")
+    parser.add_argument("--link", default=None, help="stable symlink for the pty, e.g. /tmp/ttyARDUINO")
+    parser.add_argument("--latency", type=float, default=0.0, help="response delay (s)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="probability of dropping a response byte")
+    parser.add_argument("--crc-error-rate", type=float, default=0.0, help="probability of a corrupted CRC")
+    parser.add_argument("--press-every", type=float, default=0.0, help="press SW1 every N seconds")
+    parser.add_argument("--protocol", type=int, default=1, choices=(1, 2), help="firmware protocol version")
+    parser.add_argument("--channels", type=int, default=6, help="LED channels (protocol 2)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    emu = ArduinoEmulator(args.link, args.latency, args.drop_rate, args.crc_error_rate,
+                          protocol=args.protocol, channels=args.channels)
+    emu.start()
+    print(f"Arduino emulator listening on {emu.device}")
+    try:
+        while True:
+            if args.press_every > 0:
+                emu.press_switch(0x80, duration=0.2)
+                time.sleep(args.press_every)
+            else:
+                time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emu.stop()
+        emu.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+ArduinoWorker benchmark against the pty emulator (no hardware needed)
+
+Measures:
+  - throughput      : frames/s with tick=0
+  - read stalls     : exchanges that waited out the worker's read timeout
+                      (response lost or short) and the share of the run spent there
+  - switch latency  : emulator switch press -> switch bit visible in get_status()
+  - reconnect       : unplug for --outage seconds, time until frames flow again
+
+Every dropped byte costs one full read timeout (1 s by default, as in the
+GUI), so with --drop-rate the throughput figure is dominated by that timeout
+rather than by the link; read it together with the stall line, or pass a
+shorter --read-timeout to see the exchange rate between stalls.
+
+Usage:
+  python tools/bench_arduino.py --duration 3 --latency 0.001
+  python tools/bench_arduino.py --drop-rate 0.02 --read-timeout 0.02
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.ardu_worker import ArduinoWorker  # noqa: E402
+from tools.arduino_emulator import ArduinoEmulator  # noqa: E402
+
+
+def wait_for(pred, timeout, poll=0.0005):
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < timeout:
+        if pred():
+            return time.perf_counter() - t0
+        time.sleep(poll)
+    return None
+
+
+def bench_throughput(worker, duration):
+    start = worker.get_status()['link']
+    time.sleep(duration)
+    link = worker.get_status()['link']
+    stalls = (link['timeouts'] - start['timeouts']) + (link['short_reads'] - start['short_reads'])
+    return (link['frames_ok'] - start['frames_ok']) / duration, stalls, link
+
+
+def bench_switch_latency(worker, emu, presses):
+    samples = []
+    for _ in range(presses):
+        emu.set_switches(0)
+        wait_for(lambda: not worker.get_status()['switch_states'] & 0x80, 1.0)
+        emu.set_switches(0x80)
+        dt = wait_for(lambda: worker.get_status()['switch_states'] & 0x80, 1.0)
+        if dt is not None:
+            samples.append(dt * 1000.0)
+    emu.set_switches(0)
+    return samples
+
+
+def bench_reconnect(worker, emu, outage):
+    emu.unplug()
+    wait_for(lambda: not worker.get_status()['connected'], 2.0)
+    time.sleep(outage)
+    before = worker.get_status()['link']['frames_ok']
+    t0 = time.perf_counter()
+    emu.replug()
+    recovered = wait_for(lambda: worker.get_status()['link']['frames_ok'] > before, 30.0, poll=0.001)
+    return None if recovered is None else time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ArduinoWorker benchmark (pty emulator)")
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--latency", type=float, default=0.0, help="emulated firmware response delay (s)")
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--crc-error-rate", type=float, default=0.0)
+    parser.add_argument("--presses", type=int, default=20)
+    parser.add_argument("--outage", type=float, default=1.0, help="unplug duration (s)")
+    parser.add_argument("--tick", type=float, default=0.0)
+    parser.add_argument("--read-timeout", type=float, default=1.0,
+                        help="worker serial read timeout (s), paid once per dropped response")
+    parser.add_argument("--firmware", type=int, default=1, choices=(1, 2), help="emulated firmware protocol")
+    parser.add_argument("--protocol", type=int, default=1, choices=(1, 2), help="worker preferred protocol (2 = negotiate v2)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    link = f"/tmp/ttyARDUINO-bench-{os.getpid()}"
+    emu = ArduinoEmulator(link, args.latency, args.drop_rate, args.crc_error_rate, seed=0,
+                          protocol=args.firmware)
+    emu.start()
+
+    worker = ArduinoWorker(port=link, tick=args.tick, read_timeout=args.read_timeout, protocol=args.protocol)
+    t0 = time.perf_counter()
+    if not worker.connect():
+        print("connect failed")
+        return 1
+    print(f"connect         : {(time.perf_counter() - t0) * 1000:.0f} ms, protocol v{worker.protocol}")
+    worker.start()
+
+    try:
+        fps, stalls, stats = bench_throughput(worker, args.duration)
+        print(f"throughput      : {fps:8.1f} frames/s  (rtt avg {stats['rtt_avg_ms']:.2f} ms, "
+              f"max {stats['rtt_max_ms']:.2f} ms, crc {stats['crc_errors']}, "
+              f"timeouts {stats['timeouts']}, short {stats['short_reads']})")
+        stalled = min(stalls * args.read_timeout, args.duration)
+        live = args.duration - stalled
+        print(f"read stalls     : {stalls} x {args.read_timeout * 1000:.0f} ms read timeout = "
+              f"{stalled / args.duration:.0%} of the run"
+              + (f", {fps * args.duration / live:8.1f} frames/s between stalls" if stalls and live > 0 else ""))
+        frames = max(1, stats['frames_ok'])
+        print(f"bytes/frame     : tx {stats['bytes_tx'] / frames:.1f}, rx {stats['bytes_rx'] / frames:.1f}")
+
+        samples = bench_switch_latency(worker, emu, args.presses)
+        if samples:
+            print(f"switch latency  : median {statistics.median(samples):.2f} ms, "
+                  f"max {max(samples):.2f} ms ({len(samples)}/{args.presses} presses)")
+        else:
+            print("switch latency  : no presses observed")
+
+        recover = bench_reconnect(worker, emu, args.outage)
+        if recover is None:
+            print("reconnect       : did not recover")
+        else:
+            status = worker.get_status()
+            print(f"reconnect       : frames flowing {recover * 1000:.0f} ms after replug "
+                  f"(reconnects {status['link']['reconnects']}, "
+                  f"reported recovery {status['last_recovery_time']:.2f} s)")
+    finally:
+        worker.stop()
+        worker.join(timeout=5)
+        emu.stop()
+        emu.join(timeout=5)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+DynamixelDriver / DynamixelWorker benchmark against the pty bus emulator (no hardware needed)
+
+Measures:
+  - scan        : broadcast vs sequential vs per-ID SDK ping over --scan-range
+  - status read : read_status_block() transactions/s, full block vs fast-tier fields
+  - writes      : velocity+goal writes/s, acknowledged vs TxOnly (configure_fast_writes)
+  - ring move   : worker move_to_angle() submit -> completion() future
+
+Usage:
+  python tools/bench_dynamixel.py --ids 1 2 --cycles 200
+  python tools/bench_dynamixel.py --return-delay-us 0 --baud-index 3
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from drivers.dynamixel.dynamixel_driver import DynamixelDriver, EXTENDED_POSITION_CONTROL_MODE  # noqa: E402
+from src.dynamixel_worker import DynamixelWorker  # noqa: E402
+from tools.dynamixel_emulator import DynamixelBusEmulator, BAUD_RATES  # noqa: E402
+
+
+def rate(fn, cycles):
+    t0 = time.perf_counter()
+    for i in range(cycles):
+        fn(i)
+    return cycles / (time.perf_counter() - t0)
+
+
+def bench_scan(driver, id_range):
+    results = {}
+    for method in ('broadcast', 'sequential', 'ping'):
+        t0 = time.perf_counter()
+        found = driver.scan_motors(id_range, method)
+        results[method] = ((time.perf_counter() - t0) * 1000.0, len(found))
+    return results
+
+
+def bench_status(driver, ids, cycles):
+    full = rate(lambda i: driver.read_status_block(ids), cycles)
+    fast = rate(lambda i: driver.read_status_block(ids, ['position', 'moving', 'velocity']), cycles)
+    return full, fast
+
+
+def bench_writes(driver, ids, cycles, return_delay_us):
+    acked = rate(lambda i: driver.write_goal(ids[i % len(ids)], 100, 1000 + i), cycles)
+    driver.configure_fast_writes(ids, return_delay_us=return_delay_us)
+    tx_only = rate(lambda i: driver.write_goal(ids[i % len(ids)], 100, 1000 + i), cycles)
+    driver.verify_writes()
+    driver.configure_fast_writes(ids, return_delay_us=500, status_return_level=2)
+    return acked, tx_only
+
+
+def bench_moves(driver, ids, moves):
+    worker = DynamixelWorker(driver, ids[0], motor_ids=ids)
+    worker.start()
+    samples = []
+    try:
+        worker.set_operating_mode(EXTENDED_POSITION_CONTROL_MODE).result(2)
+        for k in range(moves):
+            t0 = time.perf_counter()
+            worker.move_to_angle((k * 45 + 30) % 360, velocity=1000)
+            if worker.completion([ids[0]]).result(10):
+                samples.append((time.perf_counter() - t0) * 1000.0)
+    finally:
+        worker.stop()
+        worker.join(timeout=5)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dynamixel driver/worker benchmark (pty emulator)")
+    parser.add_argument("--ids", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--scan-range", type=int, nargs=2, default=[1, 10])
+    parser.add_argument("--cycles", type=int, default=200)
+    parser.add_argument("--moves", type=int, default=5)
+    parser.add_argument("--baud-index", type=int, default=1, help="Baud Rate register (1 = 57600)")
+    parser.add_argument("--return-delay-us", type=float, default=None, help="emulated Return Delay Time override")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    emu = DynamixelBusEmulator(args.ids, baud_index=args.baud_index, return_delay_us=args.return_delay_us, seed=0)
+    emu.start()
+
+    driver = DynamixelDriver(device_name=emu.device, baudrate=BAUD_RATES[args.baud_index])
+    driver.connect()
+    try:
+        for method, (ms, n) in bench_scan(driver, tuple(args.scan_range)).items():
+            print(f"scan {method:<10}: {ms:7.1f} ms ({n} motors)")
+
+        ids = sorted(driver.connected_motors) or args.ids
+        full, fast = bench_status(driver, ids, args.cycles)
+        print(f"status read     : full block {full:6.1f}/s, fast tier {fast:6.1f}/s ({len(ids)} motors)")
+
+        acked, tx_only = bench_writes(driver, ids, args.cycles, 0)
+        print(f"goal writes     : acknowledged {acked:6.1f}/s, TxOnly {tx_only:6.1f}/s "
+              f"(emulator does not pace host->motor wire time)")
+
+        samples = bench_moves(driver, ids, args.moves)
+        if samples:
+            print(f"ring move       : median {statistics.median(samples):.0f} ms, max {max(samples):.0f} ms "
+                  f"(submit -> completion, {len(samples)} moves)")
+        print(f"bus packets     : rx {emu.packets_rx}, tx {emu.packets_tx}, bad {emu.packets_bad}")
+    finally:
+        driver.disconnect()
+        emu.stop()
+        emu.join(timeout=5)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
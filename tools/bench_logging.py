@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Logging cost per worker loop iteration: direct handlers vs the queue pipeline
+
+Each iteration logs one INFO record (like a MOVE or command log) and one
+DEBUG record with the debug level disabled, the way the worker hot loops do.
+  - direct : root logger formats and writes to file + console on the caller
+  - queue  : src.log_pipeline (caller only enqueues, listener formats/writes)
+The DEBUG line is measured both as an eager f-string and with lazy %-args.
+
+Usage:
+  python tools/bench_logging.py --iterations 20000
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import pathlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from src.log_pipeline import LoggingPipeline, rotating_file_handler, LOG_FORMAT, LOG_DATEFMT  # noqa: E402
+
+
+def handlers(tmpdir):
+    console = logging.StreamHandler(open(os.devnull, "w"))
+    console.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+    return [rotating_file_handler(pathlib.Path(tmpdir) / "bench.log"), console]
+
+
+def loop(iterations, lazy):
+    status = {'position': 2048, 'moving': False, 'brightness': [255, 128, 64, 32, 16, 0]}
+    t0 = time.perf_counter()
+    for i in range(iterations):
+        logging.info("MOVE command at %.2fs, deg=%s, vel=%s", i * 0.01, 90, 30)
+        if lazy:
+            logging.debug("Status: %s", status)
+        else:
+            logging.debug(f"Status: {status}")
+    return (time.perf_counter() - t0) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Logging cost per loop iteration")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        direct = handlers(tmpdir)
+        for handler in direct:
+            root.addHandler(handler)
+        root.setLevel(logging.INFO)
+        eager = loop(args.iterations, lazy=False)
+        lazy = loop(args.iterations, lazy=True)
+        for handler in direct:
+            root.removeHandler(handler)
+            handler.close()
+        print(f"direct handlers : {eager:7.2f} us/iteration (f-string debug), {lazy:7.2f} (lazy debug)")
+
+        pipeline = LoggingPipeline(handlers(tmpdir), logging.INFO)
+        eager = loop(args.iterations, lazy=False)
+        lazy = loop(args.iterations, lazy=True)
+        t0 = time.perf_counter()
+        pipeline.stop()
+        drain = (time.perf_counter() - t0) * 1000.0
+        stats = pipeline.get_stats()["MainThread"]
+        print(f"queue pipeline  : {eager:7.2f} us/iteration (f-string debug), {lazy:7.2f} (lazy debug)")
+        print(f"  enqueue avg {stats['avg_us']:.2f} us, max {stats['max_us']:.0f} us per record; "
+              f"listener drained the backlog {drain:.0f} ms after the loop")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Cold-start time of the GUI, broken down by stage
+
+Every run is a fresh interpreter (nothing cached in sys.modules) that
+measures, in order:
+  - qt_import  : import PyQt5.QtWidgets
+  - app_import : import main (application modules; device stacks are lazy)
+  - qapp       : QApplication()
+  - config     : config.json + schedule.txt load and parse
+  - ui_build   : widgets from the compiled module (src/ui_mainwindow.py) or uic.loadUi
+  - window     : MainWindow() in full (UI, logging, telemetry, timers)
+  - total      : process spawn to window constructed (interpreter start included)
+and, after the window is up, how long the deferred device-stack imports
+take (paid on the I/O thread at first connect). Each mode is run --runs
+times and the median is printed. The headless row imports headless.py
+and loads the config, without Qt.
+
+Usage:
+  python tools/bench_startup.py --runs 5
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+STAGES = ("qt_import", "app_import", "qapp", "config", "ui_build", "window", "total")
+DEVICE_MODULES = ("serial", "dynamixel_sdk", "pymodbus.client")  # pymodbus pulls in serial, so serial goes first
+
+
+def child(mode, t_spawn):
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    stages = {}
+
+    def stage(name, t0):
+        stages[name] = (time.perf_counter() - t0) * 1e3
+
+    if mode == "headless":
+        t0 = time.perf_counter()
+        import headless
+        stage("app_import", t0)
+        t0 = time.perf_counter()
+        headless.parse_schedule(headless.load_schedule())
+        headless.load_config()
+        stage("config", t0)
+        stages["total"] = (time.time() - t_spawn) * 1e3
+        return {"stages": stages, "loaded": [m for m in DEVICE_MODULES if m in sys.modules],
+                "qt": any(m.startswith("PyQt5") for m in sys.modules)}
+
+    if mode == "loaded":
+        sys.modules["src.ui_mainwindow"] = None     # compiled UI unavailable -> uic.loadUi fallback
+
+    t0 = time.perf_counter()
+    from PyQt5 import QtWidgets
+    stage("qt_import", t0)
+
+    t0 = time.perf_counter()
+    import main
+    stage("app_import", t0)
+
+    t0 = time.perf_counter()
+    app = QtWidgets.QApplication(sys.argv[:1])
+    stage("qapp", t0)
+
+    t0 = time.perf_counter()
+    from src.app_config import load_config, load_schedule
+    from src.schedule_command import parse_schedule
+    config = load_config()
+    parse_schedule(load_schedule())
+    stage("config", t0)
+
+    t0 = time.perf_counter()
+    scratch = QtWidgets.QMainWindow()
+    main.main_window_ui()().setupUi(scratch)
+    stage("ui_build", t0)
+    scratch.deleteLater()
+
+    config.setdefault("logging", {}).update(file="", console=False)  # keep the benchmark out of logs/
+    main.load_config = lambda: config
+    t0 = time.perf_counter()
+    window = main.MainWindow()
+    stage("window", t0)
+    stages["total"] = (time.time() - t_spawn) * 1e3
+
+    loaded = [m for m in DEVICE_MODULES if m in sys.modules]
+    deferred = {}
+    for module in DEVICE_MODULES:
+        t0 = time.perf_counter()
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        deferred[module] = (time.perf_counter() - t0) * 1e3
+    window.log_pipeline.stop()
+    del app
+    return {"stages": stages, "loaded": loaded, "deferred": deferred}
+
+
+def run(mode, runs):
+    results = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode, "--spawn", repr(time.time())],
+                             capture_output=True, text=True, check=True)
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def report(mode, results):
+    stages = {name: statistics.median(r["stages"][name] for r in results)
+              for name in STAGES if name in results[0]["stages"]}
+    print(f"{mode:9s}" + "".join(f"{stages.get(name, float('nan')):12.1f}" for name in STAGES))
+    return results[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GUI cold-start time by stage")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", choices=("compiled", "loaded", "headless"), help=argparse.SUPPRESS)
+    parser.add_argument("--spawn", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        if "DISPLAY" not in os.environ and "WAYLAND_DISPLAY" not in os.environ and os.name != "nt":
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        print(json.dumps(child(args.child, args.spawn)))
+        return
+
+    print(f"median of {args.runs} cold starts, ms")
+    print(f"{'':9s}" + "".join(f"{name:>12s}" for name in STAGES))
+    last = report("compiled", run("compiled", args.runs))
+    report("loaded", run("loaded", args.runs))
+    headless = report("headless", run("headless", args.runs))
+
+    print(f"\ndevice stacks loaded at startup: {', '.join(last['loaded']) or 'none'}")
+    print("deferred to first connect: " + ", ".join(f"{m} {ms:.1f} ms" for m, ms in last["deferred"].items()))
+    print(f"headless imports Qt: {headless['qt']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Compile resource/mainwindow.ui to src/ui_mainwindow.py ahead of time
+
+MainWindow builds its widgets from the compiled module instead of parsing
+the .ui XML with uic.loadUi on every launch. The module records the SHA-256
+of the .ui it was built from; when the .ui no longer matches, main.py logs a
+warning and falls back to uic.loadUi, so an edit in Designer is never
+silently ignored. Run after every .ui change (and before a PyInstaller build):
+
+Usage:
+  python tools/build_ui.py
+  python tools/build_ui.py --check    # exit 1 when src/ui_mainwindow.py is stale
+"""
+
+import io
+import os
+import sys
+import hashlib
+import argparse
+import pathlib
+
+ROOT = pathlib.Path(os.path.dirname(os.path.abspath(__file__))).parent
+UI_FILE = ROOT / "resource" / "mainwindow.ui"
+OUT_FILE = ROOT / "src" / "ui_mainwindow.py"
+
+
+def ui_digest(path=UI_FILE):
+    """SHA-256 of the .ui with LF line endings (same value on CRLF checkouts)"""
+    return hashlib.sha256(path.read_bytes().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def built_digest(path=OUT_FILE):
+    """UI_SHA256 recorded in the compiled module, None when it does not exist"""
+    if not path.exists():
+        return None
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.startswith("UI_SHA256 = "):
+            return line.split("=", 1)[1].strip().strip('"')
+    return None
+
+
+def build(ui_file=UI_FILE, out_file=OUT_FILE):
+    from PyQt5 import uic
+    code = io.StringIO()
+    with ui_file.open(encoding="utf-8") as f:
+        uic.compileUi(f, code)
+    source = ui_file.relative_to(ROOT).as_posix()
+    header = (f"# Generated from {source} by tools/build_ui.py - do not edit,\n"
+              f"# edit the .ui file and run python tools/build_ui.py again.\n"
+              f"UI_SHA256 = \"{ui_digest(ui_file)}\"\n\n")
+    # pyuic records the absolute .ui path; keep the generated file machine independent
+    out_file.write_text(header + code.getvalue().replace(str(ui_file), source), encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the Qt Designer UI to Python")
+    parser.add_argument("--check", action="store_true", help="only check that the compiled UI is up to date")
+    args = parser.parse_args()
+
+    fresh = built_digest() == ui_digest()
+    if args.check:
+        print(f"{OUT_FILE.relative_to(ROOT)}: {'up to date' if fresh else 'STALE'}")
+        return 0 if fresh else 1
+    build()
+    print(f"{UI_FILE.relative_to(ROOT)} -> {OUT_FILE.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
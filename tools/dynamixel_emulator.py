@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+"""
+Dynamixel Protocol 2.0 bus emulator behind a Linux pseudo-terminal
+
+Emulates one or more XM430-W350 devices on a shared bus so dynamixel_sdk
+based code (DynamixelDriver, DynamixelWorker) can be regression-tested and
+benchmarked without hardware.
+
+Supported instructions: PING (incl. broadcast), READ, WRITE, REG_WRITE,
+ACTION, REBOOT, SYNC_READ, SYNC_WRITE, BULK_READ, BULK_WRITE.
+Control table: XM430 layout incl. indirect address/data 1-28, status return
+level, return delay time, baud rate, EEPROM lock while torque is on.
+Dynamics: position/extended-position/velocity modes move the present position
+toward the goal at the profile velocity; Moving/velocity/current follow.
+
+The bus baud rate is taken from the pty termios settings, so packets sent at a
+rate that does not match a device's Baud Rate register are ignored (like
+garbage on a real bus), and wire time is simulated from the byte count.
+
+Usage:
+  python tools/dynamixel_emulator.py --link /tmp/ttyDXL --ids 1 2 --return-delay-us 0
+  (then set ports.dynamixel in config.json to /tmp/ttyDXL)
+"""
+
+import os
+import sys
+import time
+import tty
+import random
+import select
+import struct
+import logging
+import argparse
+import termios
+import threading
+
+# ── Protocol 2.0 constants ───────────────────────────────────
+HEADER = b"\xFF\xFF\xFD\x00"
+BROADCAST_ID = 0xFE
+
+INST_PING = 0x01
+INST_READ = 0x02
+INST_WRITE = 0x03
+INST_REG_WRITE = 0x04
+INST_ACTION = 0x05
+INST_REBOOT = 0x08
+INST_STATUS = 0x55
+INST_SYNC_READ = 0x82
+INST_SYNC_WRITE = 0x83
+INST_BULK_READ = 0x92
+INST_BULK_WRITE = 0x93
+
+ERR_INSTRUCTION = 0x02
+ERR_CRC = 0x03
+ERR_DATA_RANGE = 0x04
+ERR_DATA_LENGTH = 0x05
+ERR_ACCESS = 0x07
+
+# ── XM430-W350 control table ────────────────────────────────
+MODEL_NUMBER = 1020
+FIRMWARE_VERSION = 48
+TABLE_SIZE = 662
+EEPROM_END = 64
+
+ADDR_ID = 7
+ADDR_BAUD_RATE = 8
+ADDR_RETURN_DELAY_TIME = 9
+ADDR_OPERATING_MODE = 11
+ADDR_MOVING_THRESHOLD = 24
+ADDR_VELOCITY_LIMIT = 44
+ADDR_MAX_POSITION_LIMIT = 48
+ADDR_MIN_POSITION_LIMIT = 52
+ADDR_TORQUE_ENABLE = 64
+ADDR_STATUS_RETURN_LEVEL = 68
+ADDR_GOAL_VELOCITY = 104
+ADDR_PROFILE_ACCELERATION = 108
+ADDR_PROFILE_VELOCITY = 112
+ADDR_GOAL_POSITION = 116
+ADDR_REALTIME_TICK = 120
+ADDR_MOVING = 122
+ADDR_MOVING_STATUS = 123
+ADDR_PRESENT_CURRENT = 126
+ADDR_PRESENT_VELOCITY = 128
+ADDR_PRESENT_POSITION = 132
+ADDR_PRESENT_VOLTAGE = 144
+ADDR_PRESENT_TEMPERATURE = 146
+
+INDIRECT_BLOCKS = ((168, 224, 28), (578, 634, 28))  # (address base, data base, count)
+
+BAUD_RATES = {0: 9600, 1: 57600, 2: 115200, 3: 1000000, 4: 2000000, 5: 3000000, 6: 4000000, 7: 4500000}
+VELOCITY_UNIT_TICKS = 0.229 / 60.0 * 4096.0  # 1 velocity unit (0.229 rpm) in ticks/s
+
+POSITION_MODE = 3
+EXTENDED_POSITION_MODE = 4
+VELOCITY_MODE = 1
+
+_TERMIOS_BAUD = {getattr(termios, f"B{b}"): b for b in BAUD_RATES.values() if hasattr(termios, f"B{b}")}
+
+
+def _make_crc_table():
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x8005) & 0xFFFF if crc & 0x8000 else (crc << 1) & 0xFFFF
+        table.append(crc)
+    return table
+
+
+_CRC_TABLE = _make_crc_table()
+
+
+def crc16(data, crc=0):
+    for b in data:
+        crc = ((crc << 8) ^ _CRC_TABLE[((crc >> 8) ^ b) & 0xFF]) & 0xFFFF
+    return crc
+
+
+def stuff(body):
+    """Byte stuffing: FF FF FD -> FF FF FD FD"""
+    out = bytearray()
+    for b in body:
+        out.append(b)
+        if b == 0xFD and out[-3:-1] == b"\xFF\xFF" and len(out) >= 3:
+            out.append(0xFD)
+    return bytes(out)
+
+
+def unstuff(body):
+    out = bytearray()
+    i = 0
+    while i < len(body):
+        out.append(body[i])
+        if body[i] == 0xFD and out[-3:-1] == b"\xFF\xFF" and i + 1 < len(body) and body[i + 1] == 0xFD:
+            i += 1
+        i += 1
+    return bytes(out)
+
+
+def make_packet(dxl_id, instruction, params=b""):
+    body = stuff(bytes([instruction]) + bytes(params))
+    length = len(body) + 2
+    pkt = HEADER + bytes([dxl_id, length & 0xFF, length >> 8]) + body
+    crc = crc16(pkt)
+    return pkt + bytes([crc & 0xFF, crc >> 8])
+
+
+class DxlDevice:
+    """One XM430 control table with simple motion dynamics"""
+
+    def __init__(self, dxl_id, baud_index=1, return_delay_us=None):
+        self.table = bytearray(TABLE_SIZE)
+        self.return_delay_override = return_delay_us
+        self.registered = None
+        self._pos = 0.0
+        self._vel = 0.0
+        self._t = time.monotonic()
+        self.factory_reset(dxl_id, baud_index)
+
+    def factory_reset(self, dxl_id, baud_index):
+        t = self.table
+        t[:] = bytes(TABLE_SIZE)
+        struct.pack_into("<H", t, 0, MODEL_NUMBER)
+        t[6] = FIRMWARE_VERSION
+        t[ADDR_ID] = dxl_id
+        t[ADDR_BAUD_RATE] = baud_index
+        t[ADDR_RETURN_DELAY_TIME] = 250
+        t[ADDR_OPERATING_MODE] = POSITION_MODE
+        t[13] = 2  # protocol type
+        struct.pack_into("<i", t, ADDR_MOVING_THRESHOLD, 10)
+        t[31] = 80  # temperature limit
+        struct.pack_into("<H", t, 32, 160)
+        struct.pack_into("<H", t, 34, 95)
+        struct.pack_into("<H", t, 36, 885)
+        struct.pack_into("<H", t, 38, 1193)
+        struct.pack_into("<i", t, ADDR_VELOCITY_LIMIT, 200)
+        struct.pack_into("<i", t, ADDR_MAX_POSITION_LIMIT, 4095)
+        struct.pack_into("<i", t, ADDR_MIN_POSITION_LIMIT, 0)
+        t[ADDR_STATUS_RETURN_LEVEL] = 2
+        struct.pack_into("<H", t, ADDR_PRESENT_VOLTAGE, 120)
+        t[ADDR_PRESENT_TEMPERATURE] = 35
+        for addr_base, data_base, count in INDIRECT_BLOCKS:
+            for n in range(count):
+                struct.pack_into("<H", t, addr_base + 2 * n, data_base + n)
+        self._pos = float(self._rd(ADDR_PRESENT_POSITION, 4))
+        self._vel = 0.0
+
+    # ── raw access ──────────────────────────────────────────
+    def _rd(self, addr, size, signed=True):
+        fmt = {1: "b", 2: "h", 4: "i"}[size]
+        return struct.unpack_from("<" + (fmt if signed else fmt.upper()), self.table, addr)[0]
+
+    def _wr(self, addr, size, value):
+        fmt = {1: "B", 2: "H", 4: "I"}[size]
+        struct.pack_into("<" + fmt, self.table, addr, value & ((1 << (8 * size)) - 1))
+
+    def _indirect_target(self, addr):
+        for addr_base, data_base, count in INDIRECT_BLOCKS:
+            if data_base <= addr < data_base + count:
+                return struct.unpack_from("<H", self.table, addr_base + 2 * (addr - data_base))[0]
+        return None
+
+    @property
+    def id(self):
+        return self.table[ADDR_ID]
+
+    @property
+    def baudrate(self):
+        return BAUD_RATES.get(self.table[ADDR_BAUD_RATE], 57600)
+
+    @property
+    def status_return_level(self):
+        return self.table[ADDR_STATUS_RETURN_LEVEL]
+
+    @property
+    def return_delay(self):
+        if self.return_delay_override is not None:
+            return self.return_delay_override * 1e-6
+        return self.table[ADDR_RETURN_DELAY_TIME] * 2e-6
+
+    # ── dynamics ────────────────────────────────────────────
+    def step(self, now=None):
+        now = time.monotonic() if now is None else now
+        dt = now - self._t
+        self._t = now
+        t = self.table
+        self._wr(ADDR_REALTIME_TICK, 2, int(now * 1000))
+
+        mode = t[ADDR_OPERATING_MODE]
+        if not t[ADDR_TORQUE_ENABLE]:
+            self._vel = 0.0
+        elif mode == VELOCITY_MODE:
+            self._vel = self._rd(ADDR_GOAL_VELOCITY, 4) * VELOCITY_UNIT_TICKS
+            self._pos += self._vel * dt
+        else:
+            goal = self._rd(ADDR_GOAL_POSITION, 4)
+            if mode == POSITION_MODE:
+                goal = max(self._rd(ADDR_MIN_POSITION_LIMIT, 4), min(self._rd(ADDR_MAX_POSITION_LIMIT, 4), goal))
+            profile = self._rd(ADDR_PROFILE_VELOCITY, 4) or self._rd(ADDR_VELOCITY_LIMIT, 4)
+            speed = profile * VELOCITY_UNIT_TICKS
+            err = goal - self._pos
+            travel = speed * dt
+            if abs(err) <= travel:
+                self._pos = float(goal)
+                self._vel = 0.0
+            else:
+                self._vel = speed if err > 0 else -speed
+                self._pos += self._vel * dt
+
+        pos = int(round(self._pos))
+        vel_units = int(round(self._vel / VELOCITY_UNIT_TICKS))
+        moving = abs(vel_units) > 0 or (
+            t[ADDR_TORQUE_ENABLE] and mode != VELOCITY_MODE
+            and abs(self._rd(ADDR_GOAL_POSITION, 4) - pos) > self._rd(ADDR_MOVING_THRESHOLD, 4))
+        self._wr(ADDR_PRESENT_POSITION, 4, pos)
+        self._wr(140, 4, pos)  # position trajectory
+        self._wr(ADDR_PRESENT_VELOCITY, 4, vel_units)
+        self._wr(136, 4, vel_units)  # velocity trajectory
+        self._wr(ADDR_PRESENT_CURRENT, 2, (40 if moving else 4) * (1 if vel_units >= 0 else -1))
+        t[ADDR_MOVING] = 1 if moving else 0
+        t[ADDR_MOVING_STATUS] = 0x01 if not moving else 0x02
+
+    # ── instruction handlers ────────────────────────────────
+    def read(self, addr, length):
+        if addr + length > TABLE_SIZE:
+            return None
+        self.step()
+        out = bytearray(length)
+        for i in range(length):
+            target = self._indirect_target(addr + i)
+            out[i] = self.table[target if target is not None else addr + i]
+        return bytes(out)
+
+    def write(self, addr, data):
+        """Returns the status error byte"""
+        if addr + len(data) > TABLE_SIZE:
+            return ERR_DATA_RANGE
+        self.step()
+        targets = []
+        for i in range(len(data)):
+            target = self._indirect_target(addr + i)
+            targets.append(target if target is not None else addr + i)
+        if self.table[ADDR_TORQUE_ENABLE] and any(a < EEPROM_END for a in targets):
+            return ERR_ACCESS
+        torque_was_on = self.table[ADDR_TORQUE_ENABLE]
+        for a, b in zip(targets, data):
+            self.table[a] = b
+        if not torque_was_on and self.table[ADDR_TORQUE_ENABLE]:
+            # Torque on: Goal Position is reset to Present Position (no jump)
+            self._wr(ADDR_GOAL_POSITION, 4, self._rd(ADDR_PRESENT_POSITION, 4))
+        return 0
+
+
+class DynamixelBusEmulator(threading.Thread):
+    def __init__(self, ids=(1,), link=None, baud_index=1, return_delay_us=None,
+                 error_rate=0.0, max_stable_baud=None, simulate_wire_time=True, seed=None):
+        """
+        Args:
+            ids: device IDs on the bus
+            link: optional stable symlink to the pty slave
+            baud_index: initial Baud Rate register value (1 = 57600)
+            return_delay_us: override Return Delay Time for all devices (None = use the register)
+            error_rate: probability of corrupting a status packet CRC
+            max_stable_baud: above this bus rate, status packets are corrupted with 20 % probability
+            simulate_wire_time: sleep for the transmit time of each status packet
+        """
+        super().__init__(daemon=True)
+        self.devices = {i: DxlDevice(i, baud_index, return_delay_us) for i in ids}
+        self.link = link
+        self.error_rate = error_rate
+        self.max_stable_baud = max_stable_baud
+        self.simulate_wire_time = simulate_wire_time
+        self.rng = random.Random(seed)
+
+        self.lock = threading.Lock()
+        self.stop_evt = threading.Event()
+
+        # Counters
+        self.packets_rx = 0
+        self.packets_bad = 0
+        self.packets_tx = 0
+        self.packets_ignored = 0
+
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)
+        self.port = os.ttyname(self.slave_fd)
+        if link:
+            if os.path.lexists(link):
+                os.unlink(link)
+            os.symlink(self.port, link)
+        logging.info(f"Dynamixel emulator on {self.device} (IDs {list(self.devices)})")
+
+    @property
+    def device(self):
+        return self.link or self.port
+
+    def bus_baudrate(self):
+        """Baud rate the client configured on the pty (None if not a standard rate)"""
+        speed = termios.tcgetattr(self.master_fd)[5]
+        return _TERMIOS_BAUD.get(speed)
+
+    def stop(self):
+        self.stop_evt.set()
+
+    # ── packet framing ──────────────────────────────────────
+    @staticmethod
+    def _split_packet(buf):
+        """Returns (packet or None, consumed) — None packet with consumed>0 means garbage skipped"""
+        idx = buf.find(HEADER)
+        if idx < 0:
+            keep = 3
+            return None, max(0, len(buf) - keep)
+        if idx > 0:
+            return None, idx
+        if len(buf) < 7:
+            return None, 0
+        length = buf[5] | (buf[6] << 8)
+        total = 7 + length
+        if len(buf) < total:
+            return None, 0
+        return bytes(buf[:total]), total
+
+    def _send(self, device, instruction_error, params=b"", force=False):
+        pkt = bytearray(make_packet(device.id, INST_STATUS, bytes([instruction_error]) + bytes(params)))
+        baud = self.bus_baudrate() or device.baudrate
+        corrupt = self.error_rate and self.rng.random() < self.error_rate
+        if self.max_stable_baud and baud > self.max_stable_baud and self.rng.random() < 0.2:
+            corrupt = True
+        if corrupt:
+            pkt[-1] ^= 0xFF
+        delay = device.return_delay
+        if self.simulate_wire_time:
+            delay += len(pkt) * 10.0 / baud
+        if delay > 0:
+            time.sleep(delay)
+        os.write(self.master_fd, bytes(pkt))
+        self.packets_tx += 1
+
+    def _handle(self, pkt):
+        self.packets_rx += 1
+        if crc16(pkt[:-2]) != (pkt[-2] | (pkt[-1] << 8)):
+            self.packets_bad += 1
+            return
+        dxl_id = pkt[4]
+        body = unstuff(pkt[7:-2])
+        inst, params = body[0], body[1:]
+
+        baud = self.bus_baudrate()
+        targets = [d for d in self.devices.values()
+                   if (dxl_id == BROADCAST_ID or d.id == dxl_id) and (baud is None or d.baudrate == baud)]
+        if not targets:
+            self.packets_ignored += 1
+            return
+
+        if inst == INST_PING:
+            for d in sorted(targets, key=lambda d: d.id):
+                model = struct.pack("<H", MODEL_NUMBER) + bytes([FIRMWARE_VERSION])
+                if dxl_id == BROADCAST_ID:
+                    time.sleep(0.0001 * d.id)  # devices answer in ID order
+                self._send(d, 0, model)
+            return
+
+        if inst in (INST_SYNC_READ, INST_SYNC_WRITE, INST_BULK_READ, INST_BULK_WRITE):
+            self._handle_group(inst, params)
+            return
+
+        d = targets[0] if dxl_id != BROADCAST_ID else None
+        if inst == INST_READ and d is not None:
+            addr, length = struct.unpack_from("<HH", params)
+            data = d.read(addr, length)
+            if d.status_return_level >= 1:
+                self._send(d, ERR_DATA_RANGE if data is None else 0, data or b"")
+        elif inst in (INST_WRITE, INST_REG_WRITE):
+            addr = struct.unpack_from("<H", params)[0]
+            for dev in targets:
+                if inst == INST_WRITE:
+                    err = dev.write(addr, params[2:])
+                else:
+                    dev.registered = (addr, bytes(params[2:]))
+                    err = 0
+                if dxl_id != BROADCAST_ID and dev.status_return_level >= 2:
+                    self._send(dev, err)
+        elif inst == INST_ACTION:
+            for dev in targets:
+                if dev.registered:
+                    dev.write(*dev.registered)
+                    dev.registered = None
+                if dxl_id != BROADCAST_ID and dev.status_return_level >= 2:
+                    self._send(dev, 0)
+        elif inst == INST_REBOOT and d is not None:
+            d.table[ADDR_TORQUE_ENABLE] = 0
+            if d.status_return_level >= 2:
+                self._send(d, 0)
+        elif d is not None:
+            self._send(d, ERR_INSTRUCTION)
+
+    def _handle_group(self, inst, params):
+        baud = self.bus_baudrate()
+
+        def dev(i):
+            d = self.devices.get(i)
+            return d if d is not None and (baud is None or d.baudrate == baud) else None
+
+        if inst == INST_SYNC_READ:
+            addr, length = struct.unpack_from("<HH", params)
+            for i in params[4:]:
+                d = dev(i)
+                if d is None:
+                    return  # missing device: later IDs wait forever on a real bus too
+                self._send(d, 0, d.read(addr, length) or bytes(length))
+        elif inst == INST_SYNC_WRITE:
+            addr, length = struct.unpack_from("<HH", params)
+            p = params[4:]
+            for k in range(0, len(p) - length, length + 1):
+                d = dev(p[k])
+                if d is not None:
+                    d.write(addr, p[k + 1:k + 1 + length])
+        elif inst == INST_BULK_READ:
+            for k in range(0, len(params), 5):
+                i, addr, length = params[k], *struct.unpack_from("<HH", params, k + 1)
+                d = dev(i)
+                if d is None:
+                    return
+                self._send(d, 0, d.read(addr, length) or bytes(length))
+        elif inst == INST_BULK_WRITE:
+            k = 0
+            while k + 5 <= len(params):
+                i, addr, length = params[k], *struct.unpack_from("<HH", params, k + 1)
+                d = dev(i)
+                if d is not None:
+                    d.write(addr, params[k + 5:k + 5 + length])
+                k += 5 + length
+
+    def run(self):
+        buf = bytearray()
+        while not self.stop_evt.is_set():
+            try:
+                ready, _, _ = select.select([self.master_fd], [], [], 0.02)
+                if not ready:
+                    continue
+                buf += os.read(self.master_fd, 4096)
+            except OSError:
+                continue
+
+            while True:
+                pkt, consumed = self._split_packet(buf)
+                if consumed:
+                    del buf[:consumed]
+                if pkt is None:
+                    if consumed:
+                        continue
+                    break
+                with self.lock:
+                    try:
+                        self._handle(pkt)
+                    except (struct.error, IndexError):
+                        self.packets_bad += 1
+
+        for fd in (self.master_fd, self.slave_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        if self.link and os.path.lexists(self.link):
+            os.unlink(self.link)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dynamixel Protocol 2.0 bus emulator (pty)")
+    parser.add_argument("--link", default=None, help="stable symlink for the pty, e.g. /tmp/ttyDXL")
+    parser.add_argument("--ids", type=int, nargs="+", default=[1])
+    parser.add_argument("--baud-index", type=int, default=1, help="initial Baud Rate register (1 = 57600)")
+    parser.add_argument("--return-delay-us", type=float, default=None, help="override Return Delay Time")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of a corrupted status CRC")
+    parser.add_argument("--max-stable-baud", type=int, default=None, help="corrupt 20%% of replies above this rate")
+    parser.add_argument("--no-wire-time", action="store_true", help="do not simulate transmit time")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    emu = DynamixelBusEmulator(args.ids, args.link, args.baud_index, args.return_delay_us,
+                               args.error_rate, args.max_stable_baud, not args.no_wire_time)
+    emu.start()
+    print(f"Dynamixel emulator listening on {emu.device}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emu.stop()
+        emu.join()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
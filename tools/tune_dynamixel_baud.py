@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Dynamixel bus baud-rate auto-tuning
+
+Steps the motors and the adapter up through the supported baud rates, runs a
+read/write soak at each one and keeps the fastest rate with no errors. The
+chosen rate is written to the motors' EEPROM and to config.json
+(baudrates.dynamixel, dynamixel.bus_map). If the final rate fails its
+re-check, everything is rolled back to the starting rate.
+
+Run with the GUI closed: torque is switched off while the motors change rate.
+
+Usage:
+  python tools/tune_dynamixel_baud.py
+  python tools/tune_dynamixel_baud.py --port /tmp/ttyDXL --config /tmp/config.json --max-error-rate 0.01
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+from drivers.dynamixel.dynamixel_driver import (DynamixelDriver, TUNE_SOAK_TRANSACTIONS,  # noqa: E402
+                                                TUNE_MAX_ERROR_RATE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dynamixel baud-rate auto-tuning")
+    parser.add_argument("--config", default=os.path.join(ROOT, "config.json"))
+    parser.add_argument("--port", default=None, help="override ports.dynamixel")
+    parser.add_argument("--ids", type=int, nargs="*", default=None, help="motor IDs (default: bus_map or scan)")
+    parser.add_argument("--candidates", type=int, nargs="*", default=None, help="baud rates to try")
+    parser.add_argument("--transactions", type=int, default=TUNE_SOAK_TRANSACTIONS, help="soak transactions per rate")
+    parser.add_argument("--max-error-rate", type=float, default=TUNE_MAX_ERROR_RATE)
+    parser.add_argument("--dry-run", action="store_true", help="return to the original rate, leave config.json alone")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    with open(args.config) as f:
+        config = json.load(f)
+
+    port = args.port or config.get("ports", {}).get("dynamixel")
+    baudrate = config.get("baudrates", {}).get("dynamixel", 57600)
+    dxl_config = config.setdefault("dynamixel", {})
+
+    driver = DynamixelDriver(device_name=port, baudrate=baudrate)
+    driver.connect()
+    try:
+        motor_ids = args.ids or [m['id'] for m in (dxl_config.get("bus_map") or {}).get("motors", [])]
+        if not motor_ids or not driver.verify_motors([{'id': i} for i in motor_ids]):
+            motor_ids = [m['id'] for m in driver.scan_motors()]
+        if not motor_ids:
+            print(f"no motors found on {port} at {baudrate} bps")
+            return 1
+
+        best, results = driver.tune_baudrate(motor_ids, args.candidates, args.transactions, args.max_error_rate)
+
+        print(f"\n{'baud':>9}  {'errors':>7}  {'rtt avg':>8}  {'rtt max':>8}")
+        for rate, r in sorted(results.items()):
+            if r is None:
+                print(f"{rate:>9}  {'no reply':>7}")
+            else:
+                print(f"{rate:>9}  {r['errors']:>3}/{r['transactions']:<3}  "
+                      f"{r['rtt_avg_ms']:6.2f}ms  {r['rtt_max_ms']:6.2f}ms")
+        print(f"\nselected: {best} bps (was {baudrate} bps)")
+
+        if args.dry_run:
+            driver.recover_baudrate(motor_ids, baudrate)
+            print("dry run: motors returned to the original rate, config.json unchanged")
+            return 0
+
+        if best != baudrate:
+            config.setdefault("baudrates", {})["dynamixel"] = best
+            dxl_config["bus_map"] = {"port": port, "baudrate": best,
+                                     "motors": list(driver.connected_motors.values())
+                                     or [{'id': i} for i in motor_ids]}
+            with open(args.config, "w") as f:
+                json.dump(config, f, indent=2)
+            print(f"config.json updated: baudrates.dynamixel = {best}")
+        return 0
+    finally:
+        driver.disconnect()
+
+
+if __name__ == "__main__":
+    sys.exit(main())